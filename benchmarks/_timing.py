@@ -0,0 +1,93 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Timing utilities shared by the ligotimegps benchmarks."""
+
+from __future__ import annotations
+
+import timeit
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Callable,
+        Iterable,
+    )
+
+#: default minimum wall time for each measurement (seconds)
+MIN_TIME = 0.2
+
+#: number of repeats of each measurement, the fastest is reported
+REPEAT = 5
+
+
+def time_per_call(
+    func: Callable[[], object] | str,
+    min_time: float = MIN_TIME,
+    repeat: int = REPEAT,
+    namespace: dict[str, object] | None = None,
+) -> float:
+    """Return the best time per call of ``func`` in seconds.
+
+    Parameters
+    ----------
+    func : `callable`, `str`
+        the zero-argument function, or statement, to time
+
+    min_time : `float`, optional
+        the minimum wall time of each repeat
+
+    repeat : `int`, optional
+        the number of repeats, the fastest is returned
+
+    namespace : `dict`, optional
+        the namespace in which to execute ``func``, if given as a `str`
+
+    Returns
+    -------
+    seconds : `float`
+        the best time per call
+    """
+    timer = timeit.Timer(func, globals=namespace)
+    number, elapsed = timer.autorange()
+    while elapsed < min_time:
+        number *= 2
+        elapsed = timer.timeit(number)
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def format_time(seconds: float) -> str:
+    """Format a time in seconds using an appropriate unit."""
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def print_table(
+    header: Iterable[str],
+    rows: Iterable[Iterable[object]],
+) -> None:
+    """Print a simple left-aligned text table."""
+    table = [list(map(str, header)), *(list(map(str, row)) for row in rows)]
+    widths = [max(map(len, col)) for col in zip(*table, strict=True)]
+    for i, row in enumerate(table):
+        print("  ".join(
+            cell.ljust(width) for cell, width in zip(row, widths, strict=True)
+        ).rstrip())
+        if i == 0:
+            print("  ".join("-" * width for width in widths))
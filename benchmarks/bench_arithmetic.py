@@ -0,0 +1,146 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark `LIGOTimeGPS` addition and subtraction with mixed operands.
+
+This compares the specialised `int`, `float`, and `LIGOTimeGPS` operand
+paths against the previous implementation, which converted every operand
+to a temporary `LIGOTimeGPS` and built the result through ``__init__``.
+
+Run as::
+
+    python benchmarks/bench_arithmetic.py
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import LIGOTimeGPS
+
+if TYPE_CHECKING:
+    from typing import (
+        Self,
+        SupportsFloat,
+    )
+
+    from ligotimegps import LIGOTimeGPSLike
+
+    Operand = LIGOTimeGPSLike | SupportsFloat | str | bytes
+
+NSTEPS = 1000
+
+
+class LegacyLIGOTimeGPS(LIGOTimeGPS):
+    """`LIGOTimeGPS` with the previous addition and subtraction."""
+
+    __slots__ = ()
+
+    def __add__(self, other: Operand) -> Self:
+        """Add a value (previous implementation)."""
+        if not isinstance(other, LIGOTimeGPS):
+            other = LIGOTimeGPS(other)
+        return type(self)(
+            self._seconds + other._seconds,
+            self._nanoseconds + other._nanoseconds,
+        )
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Operand) -> Self:
+        """Subtract a value (previous implementation)."""
+        if not isinstance(other, LIGOTimeGPS):
+            other = LIGOTimeGPS(other)
+        return type(self)(
+            self._seconds - other._seconds,
+            self._nanoseconds - other._nanoseconds,
+        )
+
+    def __rsub__(self, other: Operand) -> Self:
+        """Subtract from a value (previous implementation)."""
+        if not isinstance(other, LIGOTimeGPS):
+            other = LIGOTimeGPS(other)
+        return type(self)(
+            other._seconds - self._seconds,
+            other._nanoseconds - self._nanoseconds,
+        )
+
+
+def _stride(start: LIGOTimeGPS, stride: float | LIGOTimeGPS) -> None:
+    """Step through `NSTEPS` strides from ``start``."""
+    t = start
+    for _ in range(NSTEPS):
+        t += stride
+
+
+#: statements to time, with ``t`` a time and ``step`` a `LIGOTimeGPS`
+OPERATIONS = {
+    "t + int": "t + 16",
+    "t + float": "t + 0.0625",
+    "t + LIGOTimeGPS": "t + step",
+    "t - int": "t - 16",
+    "t - float": "t - 0.0625",
+    "t - LIGOTimeGPS": "t - step",
+    "float - t": "1234567890.5 - t",
+}
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    rows = []
+    start = LIGOTimeGPS(1234567890, 123456789)
+    legacy = LegacyLIGOTimeGPS(1234567890, 123456789)
+    step = LIGOTimeGPS(0, 62500000)
+    for name, statement in OPERATIONS.items():
+        before = time_per_call(
+            statement,
+            namespace={"t": legacy, "step": step},
+        )
+        after = time_per_call(
+            statement,
+            namespace={"t": start, "step": step},
+        )
+        rows.append((
+            name,
+            format_time(before),
+            format_time(after),
+            f"{before / after:.1f}x",
+        ))
+    for name, stride in (
+        ("float", 1 / 16),
+        ("LIGOTimeGPS", step),
+    ):
+        before = time_per_call(partial(_stride, legacy, stride)) / NSTEPS
+        after = time_per_call(partial(_stride, start, stride)) / NSTEPS
+        rows.append((
+            f"t += stride ({name})",
+            format_time(before),
+            format_time(after),
+            f"{before / after:.1f}x",
+        ))
+    print_table(("operation", "before", "after", "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
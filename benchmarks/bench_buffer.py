@@ -0,0 +1,104 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark bulk conversion between GPS times and int64 buffers.
+
+This compares `to_ns_array`, `from_ns_array`, and `LIGOTimeGPSView`
+against a Python loop calling `LIGOTimeGPS.ns` (or `LIGOTimeGPS.from_ns`)
+for each element.
+
+Run as::
+
+    python benchmarks/bench_buffer.py
+"""
+
+from __future__ import annotations
+
+from array import array
+from functools import partial
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import (
+    LIGOTimeGPS,
+    LIGOTimeGPSView,
+    from_ns_array,
+    to_ns_array,
+)
+
+NTIMES = 100000
+
+
+def _loop_to_ns(times: list[LIGOTimeGPS]) -> array[int]:
+    """Convert times to nanoseconds with a Python loop."""
+    return array("q", [t.ns() for t in times])
+
+
+def _loop_from_ns(nanoseconds: array[int]) -> list[LIGOTimeGPS]:
+    """Convert nanoseconds to times with a Python loop."""
+    return [LIGOTimeGPS.from_ns(ns) for ns in nanoseconds]
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    nanoseconds = array(
+        "q",
+        range(1000000000000000000, 1000000000000000000 + NTIMES * 61035, 61035),
+    )
+    times = _loop_from_ns(nanoseconds)
+    gpsarray = from_ns_array(nanoseconds)
+    rows = []
+    for name, before, after in (
+        (
+            "to_ns_array(LIGOTimeGPSArray)",
+            partial(_loop_to_ns, times),
+            partial(to_ns_array, gpsarray),
+        ),
+        (
+            "to_ns_array(..., copy=False)",
+            partial(_loop_to_ns, times),
+            partial(to_ns_array, gpsarray, copy=False),
+        ),
+        (
+            "from_ns_array",
+            partial(_loop_from_ns, nanoseconds),
+            partial(from_ns_array, nanoseconds),
+        ),
+        (
+            "LIGOTimeGPSView",
+            partial(_loop_from_ns, nanoseconds),
+            partial(LIGOTimeGPSView, nanoseconds),
+        ),
+    ):
+        t_before = time_per_call(before, repeat=3)
+        t_after = time_per_call(after, repeat=3)
+        rows.append((
+            name,
+            format_time(t_before),
+            format_time(t_after),
+            f"{t_before / t_after:.0f}x",
+        ))
+    print(f"{NTIMES} elements, 'before' is a per-element Python loop\n")
+    print_table(("operation", "before", "after", "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark two-detector coincidence with `coincidences`.
+
+This compares the sort-and-sweep `coincidences` function against nested
+loops comparing every pair of `LIGOTimeGPS` events, then times
+`coincidences` alone on streams of a million events each, where nested
+loops are impractical.
+
+Run as::
+
+    python benchmarks/bench_coinc.py
+"""
+
+from __future__ import annotations
+
+import random
+from functools import partial
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import (
+    LIGOTimeGPS,
+    LIGOTimeGPSArray,
+    coincidences,
+)
+
+NSMALL = 2000
+NLARGE = 1000000
+WINDOW = LIGOTimeGPS(0, 10000000)
+RATE = 1.0  # mean events per second, per stream
+
+
+def _nested_loops(
+    left: list[LIGOTimeGPS],
+    right: list[LIGOTimeGPS],
+) -> list[tuple[int, int]]:
+    """Find coincidences by comparing every pair of events."""
+    return [
+        (i, j)
+        for i, a in enumerate(left)
+        for j, b in enumerate(right)
+        if abs(a - b) <= WINDOW
+    ]
+
+
+def _stream(rng: random.Random, count: int) -> LIGOTimeGPSArray:
+    """Return ``count`` random event times, unsorted."""
+    span = int(count / RATE * 1e9)
+    return LIGOTimeGPSArray.from_ns(
+        rng.randrange(span) for _ in range(count)
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    rng = random.Random(0)
+    left = _stream(rng, NSMALL)
+    right = _stream(rng, NSMALL)
+    before = partial(_nested_loops, list(left), list(right))
+    after = partial(coincidences, left, right, window=WINDOW)
+    t_before = time_per_call(before, min_time=0, repeat=1)
+    t_after = time_per_call(after)
+    rows = [(
+        f"2 x {NSMALL} events",
+        format_time(t_before),
+        format_time(t_after),
+        f"{t_before / t_after:.1f}x",
+    )]
+
+    left = _stream(rng, NLARGE)
+    right = _stream(rng, NLARGE)
+    large = partial(coincidences, left, right, window=WINDOW)
+    t_large = time_per_call(large, min_time=0, repeat=1)
+    rows.append((f"2 x {NLARGE} events", "-", format_time(t_large), "-"))
+    print_table(("operation", "before", "after", "speed-up"), rows)
+    print(f"\n{len(large()[0])} coincidences in {NLARGE} event pairs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark sorting and bisecting lists of `LIGOTimeGPS`.
+
+This compares the direct rich comparison methods against the previous
+implementation (`math.isinf` check and temporary `LIGOTimeGPS` for
+every non-GPS operand, plus `functools.total_ordering` wrappers).
+
+Run as::
+
+    python benchmarks/bench_comparison.py
+"""
+
+from __future__ import annotations
+
+import bisect
+import random
+from functools import partial
+from math import isinf
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import LIGOTimeGPS
+
+if TYPE_CHECKING:
+    from typing import SupportsFloat
+
+NTIMES = 10000
+
+
+class LegacyLIGOTimeGPS(LIGOTimeGPS):
+    """`LIGOTimeGPS` with the previous comparison methods."""
+
+    __slots__ = ()
+
+    def __eq__(self, other: object) -> bool:
+        """Test equality (previous implementation)."""
+        try:
+            if isinf(other):  # type: ignore[arg-type]
+                return False
+            if not isinstance(other, LIGOTimeGPS):
+                other = LIGOTimeGPS(other)  # type: ignore[arg-type]
+        except TypeError:
+            return False
+        return (
+            self._seconds == other._seconds
+            and self._nanoseconds == other._nanoseconds
+        )
+
+    def __ne__(self, other: object) -> bool:
+        """Test inequality (previous implementation)."""
+        return not (self == other)
+
+    def __lt__(self, other: SupportsFloat) -> bool:
+        """Test 'less than' (previous implementation)."""
+        try:
+            if isinf(other) and other > 0:  # type: ignore[operator]
+                return True
+            if isinf(other):
+                return False
+            if not isinstance(other, LIGOTimeGPS):
+                other = LIGOTimeGPS(other)
+        except TypeError:
+            return NotImplemented
+        return (
+            self._seconds < other._seconds
+            or (
+                self._seconds == other._seconds
+                and self._nanoseconds < other._nanoseconds
+            )
+        )
+
+    # the methods synthesised by functools.total_ordering from __lt__
+
+    def __gt__(self, other: SupportsFloat) -> bool:
+        """Test 'greater than' (previous implementation)."""
+        result = type(self).__lt__(self, other)
+        if result is NotImplemented:
+            return result
+        return not result and self != other
+
+    def __le__(self, other: SupportsFloat) -> bool:
+        """Test 'less than or equal to' (previous implementation)."""
+        result = type(self).__lt__(self, other)
+        if result is NotImplemented:
+            return result
+        return result or self == other
+
+    def __ge__(self, other: SupportsFloat) -> bool:
+        """Test 'greater than or equal to' (previous implementation)."""
+        result = type(self).__lt__(self, other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = LIGOTimeGPS.__hash__
+
+
+def _times(cls: type[LIGOTimeGPS], n: int = NTIMES) -> list[LIGOTimeGPS]:
+    """Return a reproducible shuffled list of times."""
+    rng = random.Random(0)
+    return [
+        cls(rng.randint(1000000000, 1000001000), rng.randrange(1000000000))
+        for _ in range(n)
+    ]
+
+
+def _bisect(times: list[LIGOTimeGPS], keys: list[Any]) -> None:
+    """Locate each key in a sorted list of times."""
+    for key in keys:
+        bisect.bisect_left(times, key)
+
+
+def _filter(times: list[LIGOTimeGPS], start: int, end: int) -> None:
+    """Select the times in a ``[start, end)`` interval."""
+    [t for t in times if start <= t < end]
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    rows = []
+    rng = random.Random(1)
+    int_keys = [rng.randint(1000000000, 1000001000) for _ in range(1000)]
+    float_keys = [k + rng.random() for k in int_keys]
+    results = {}
+    for name, cls in (("before", LegacyLIGOTimeGPS), ("after", LIGOTimeGPS)):
+        times = _times(cls)
+        ordered = sorted(times)
+        gps_keys = [cls(k) for k in float_keys]
+        results[name] = {
+            f"sort {NTIMES}": time_per_call(partial(sorted, times)),
+            "bisect x1000 (GPS)": time_per_call(
+                partial(_bisect, ordered, gps_keys),
+            ),
+            "bisect x1000 (int)": time_per_call(
+                partial(_bisect, ordered, int_keys),
+            ),
+            "bisect x1000 (float)": time_per_call(
+                partial(_bisect, ordered, float_keys),
+            ),
+            f"filter {NTIMES} (int)": time_per_call(
+                partial(_filter, times, 1000000100, 1000000900),
+            ),
+        }
+    for key, before in results["before"].items():
+        after = results["after"][key]
+        rows.append((
+            key,
+            format_time(before),
+            format_time(after),
+            f"{before / after:.1f}x",
+        ))
+    print_table(("operation", "before", "after", "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
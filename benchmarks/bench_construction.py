@@ -0,0 +1,111 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark `LIGOTimeGPS` construction for each input type.
+
+This compares the type-dispatch table in `LIGOTimeGPS.__init__` against
+the previous chain of `isinstance` checks (starting with the runtime
+`LIGOTimeGPSLike` protocol check).
+
+Run as::
+
+    python benchmarks/bench_construction.py
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import (
+    LIGOTimeGPS,
+    LIGOTimeGPSLike,
+)
+
+if TYPE_CHECKING:
+    from typing import SupportsFloat
+
+
+class ForeignGPS:
+    """A foreign `LIGOTimeGPSLike` type, e.g. `lal.LIGOTimeGPS`."""
+
+    gpsSeconds = 1234567890  # noqa: N815
+    gpsNanoSeconds = 123456789  # noqa: N815
+
+
+class LegacyLIGOTimeGPS(LIGOTimeGPS):
+    """`LIGOTimeGPS` with the previous `isinstance`-chain constructor."""
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        seconds: LIGOTimeGPSLike | SupportsFloat | str | bytes = 0,
+        nanoseconds: float = 0,
+    ) -> None:
+        """Create a new `LegacyLIGOTimeGPS`."""
+        nanoseconds_value = float(nanoseconds)
+        if isinstance(seconds, LIGOTimeGPSLike):
+            sec_int, ns = self._from_lal_ligotimegps(seconds)
+            nanoseconds_value += ns
+        elif isinstance(seconds, int):
+            sec_int = seconds
+        elif isinstance(seconds, float):
+            sec_int, ns = self._from_float(seconds)
+            nanoseconds_value += ns
+        elif isinstance(seconds, (str, bytes)):
+            sec_int, ns = self._from_str_or_bytes(seconds)
+            nanoseconds_value += ns
+        else:
+            raise TypeError(seconds)
+        self._seconds = sec_int + int(nanoseconds_value // 1000000000)
+        self._nanoseconds = int(nanoseconds_value % 1000000000)
+
+
+INPUTS: dict[str, LIGOTimeGPSLike | SupportsFloat | str | bytes] = {
+    "int": 1234567890,
+    "float": 1234567890.125,
+    "str": "1234567890.123456789",
+    "bytes": b"1234567890.123456789",
+    "LIGOTimeGPS": LIGOTimeGPS(1234567890, 123456789),
+    "LIGOTimeGPSLike": ForeignGPS(),
+}
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    rows = []
+    for name, value in INPUTS.items():
+        before = time_per_call(partial(LegacyLIGOTimeGPS, value))
+        after = time_per_call(partial(LIGOTimeGPS, value))
+        rows.append((
+            name,
+            format_time(before),
+            format_time(after),
+            f"{before / after:.1f}x",
+        ))
+    print_table(("input type", "before", "after", "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
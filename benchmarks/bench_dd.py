@@ -0,0 +1,141 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark bulk phase computations with double-double arithmetic.
+
+This times computing ``(t - t0) * f`` for many GPS times using exact
+`LIGOTimeGPS` arithmetic, plain floats, and the double-double functions
+of `ligotimegps.dd` (on `array.array` and, if installed, on
+`numpy.ndarray`), and reports the maximum error of each compared with
+the exact result.
+
+Run as::
+
+    python benchmarks/bench_dd.py
+"""
+
+from __future__ import annotations
+
+import random
+from array import array
+from fractions import Fraction
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import (
+    LIGOTimeGPS,
+    dd_mul,
+    dd_sub,
+    to_dd_arrays,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Callable,
+        Iterable,
+    )
+
+NTIMES = 10000
+FREQUENCY = 1234.56789
+T0 = LIGOTimeGPS(1400000000)
+
+
+def _gps(times: list[LIGOTimeGPS]) -> list[LIGOTimeGPS]:
+    """Compute the phases using `LIGOTimeGPS`."""
+    return [(t - T0) * FREQUENCY for t in times]
+
+
+def _float(times: array[float]) -> list[float]:
+    """Compute the phases using floats."""
+    t0 = float(T0)
+    return [(t - t0) * FREQUENCY for t in times]
+
+
+def _dd(times: tuple[Any, Any]) -> tuple[Any, Any]:
+    """Compute the phases using double-doubles."""
+    return dd_mul(dd_sub(times, T0.to_dd()), FREQUENCY)
+
+
+def _as_fractions(result: object) -> Iterable[Fraction]:
+    """Return the exact values of the phases computed by a method."""
+    if isinstance(result, tuple):
+        hi, lo = (list(map(float, part)) for part in result)
+        return map(Fraction.__add__, map(Fraction, hi), map(Fraction, lo))
+    return (
+        Fraction(value.ns(), 10 ** 9) if isinstance(value, LIGOTimeGPS)
+        else Fraction(value)
+        for value in result  # type: ignore[attr-defined]
+    )
+
+
+def _max_error(result: object, exact: list[Fraction]) -> str:
+    """Return the maximum absolute error of a result, in cycles."""
+    error = max(
+        abs(value - ref)
+        for value, ref in zip(_as_fractions(result), exact, strict=True)
+    )
+    return f"{float(error):.1e}"
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    rng = random.Random(0)
+    ns = [rng.randrange(10 ** 18, 2 * 10 ** 18) for _ in range(NTIMES)]
+    times = list(map(LIGOTimeGPS.from_ns, ns))
+    dd = to_dd_arrays(times)
+    exact = [
+        Fraction(n - T0.ns(), 10 ** 9) * Fraction(FREQUENCY) for n in ns
+    ]
+
+    cases: list[tuple[str, Callable[[], object]]] = [
+        ("LIGOTimeGPS", partial(_gps, times)),
+        ("float", partial(_float, array("d", map(float, times)))),
+        ("double-double (array)", partial(_dd, dd)),
+    ]
+    try:
+        import numpy as np  # type: ignore[import-not-found]
+    except ImportError:
+        pass
+    else:
+        cases.append((
+            "double-double (numpy)",
+            partial(_dd, (np.frombuffer(dd[0]), np.frombuffer(dd[1]))),
+        ))
+
+    rows = [
+        (
+            name,
+            format_time(time_per_call(func)),
+            _max_error(func(), exact),
+        )
+        for name, func in cases
+    ]
+    print(f"(t - t0) * {FREQUENCY} for {NTIMES} times\n")
+    print_table(("method", "time", "max error (cycles)"), rows)
+
+
+if __name__ == "__main__":
+    main()
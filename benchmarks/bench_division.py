@@ -0,0 +1,96 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark `LIGOTimeGPS` division and modulo.
+
+This compares the exact integer implementation against the previous
+iterative float-refinement implementation.
+
+Run as::
+
+    python benchmarks/bench_division.py
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from fractions import Fraction
+from functools import partial
+from typing import Any
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import LIGOTimeGPS
+
+HALF_NANOSECOND = 0.5e-9
+
+TIME = LIGOTimeGPS(1234567890, 123456789)
+
+DIVISORS: dict[str, Any] = {
+    "int": 16,
+    "float": 1 / 16384,
+    "Fraction": Fraction(1, 4096),
+    "Decimal": Decimal("0.0625"),
+}
+
+
+def legacy_truediv(self: LIGOTimeGPS, other: float) -> LIGOTimeGPS:
+    """Divide using the previous iterative algorithm."""
+    quotient = type(self)(float(self) / float(other))
+    for _ in range(100):
+        residual = float(self - quotient * other) / float(other)
+        quotient += residual
+        if abs(residual) <= HALF_NANOSECOND:
+            break
+    return quotient
+
+
+def legacy_mod(self: LIGOTimeGPS, other: float) -> LIGOTimeGPS:
+    """Compute the remainder using the previous iterative algorithm."""
+    quotient = int(legacy_truediv(self, other))
+    return self - quotient * other
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    rows = []
+    for name, divisor in DIVISORS.items():
+        for op, legacy, new in (
+            ("/", legacy_truediv, LIGOTimeGPS.__truediv__),
+            ("%", legacy_mod, LIGOTimeGPS.__mod__),
+        ):
+            after = time_per_call(partial(new, TIME, divisor))
+            try:
+                before = time_per_call(partial(legacy, TIME, divisor))
+            except TypeError:  # legacy implementation doesn't support type
+                rows.append((f"TIME {op} {name}", "n/a", format_time(after), ""))
+                continue
+            rows.append((
+                f"TIME {op} {name}",
+                format_time(before),
+                format_time(after),
+                f"{before / after:.1f}x",
+            ))
+    print_table(("operation", "before", "after", "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark element-wise operations on `LIGOTimeGPSArray`.
+
+This compares arithmetic and comparisons on a `LIGOTimeGPSArray`
+against the same operation applied to each element of a `list` of
+`LIGOTimeGPS`.
+
+Run as::
+
+    python benchmarks/bench_gpsarray.py
+"""
+
+from __future__ import annotations
+
+from functools import partial
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import (
+    LIGOTimeGPS,
+    LIGOTimeGPSArray,
+)
+
+NTIMES = 100000
+OFFSET = LIGOTimeGPS(10, 500000000)
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    times = [
+        LIGOTimeGPS.from_ns(1000000000000000000 + i * 61035)
+        for i in range(NTIMES)
+    ]
+    gpsarray = LIGOTimeGPSArray(times)
+    threshold = times[NTIMES // 2]
+    rows = []
+    for name, before, after in (
+        (
+            "+ LIGOTimeGPS",
+            lambda: [t + OFFSET for t in times],
+            partial(gpsarray.__add__, OFFSET),
+        ),
+        (
+            "- array",
+            lambda: [a - b for a, b in zip(times, times, strict=True)],
+            partial(gpsarray.__sub__, gpsarray),
+        ),
+        (
+            "< LIGOTimeGPS",
+            lambda: [t < threshold for t in times],
+            partial(gpsarray.__lt__, threshold),
+        ),
+        (
+            "== LIGOTimeGPS",
+            lambda: [t == threshold for t in times],
+            partial(gpsarray.__eq__, threshold),
+        ),
+        (
+            "negation",
+            lambda: [-t for t in times],
+            gpsarray.__neg__,
+        ),
+        (
+            "round",
+            lambda: [round(t) for t in times],
+            gpsarray.__round__,
+        ),
+    ):
+        assert list(after()) == before()
+        t_before = time_per_call(before, repeat=3)
+        t_after = time_per_call(after, repeat=3)
+        rows.append((
+            name,
+            format_time(t_before),
+            format_time(t_after),
+            f"{t_before / t_after:.1f}x",
+        ))
+    print(f"{NTIMES} times, 'before' is a list of LIGOTimeGPS\n")
+    print_table(("operation", "before", "after", "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark streaming GPS times from files with `read_times`.
+
+This compares reading a file of times with ``readlines()`` and
+`LIGOTimeGPS` per line against `read_times` for each file format,
+reporting the time and the peak memory allocated to read (and sum the
+nanoseconds of) every time, and the time to seek to a time near the end
+of a sorted binary file.
+
+Run as::
+
+    python benchmarks/bench_gpsfile.py
+"""
+
+from __future__ import annotations
+
+import tempfile
+import tracemalloc
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import (
+    GPSRange,
+    LIGOTimeGPS,
+    read_times,
+    write_times,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+NTIMES = 200000
+CHUNK_SIZE = 4096
+
+
+def _readlines(path: Path) -> int:
+    """Read times with ``readlines()`` and `LIGOTimeGPS` per line."""
+    with path.open("rb") as file:
+        times = [LIGOTimeGPS(line) for line in file.readlines()]
+    return sum(t.gpsNanoSeconds for t in times)
+
+
+def _read_times(path: Path, fmt: str, *, as_ns: bool) -> int:
+    """Read times with `read_times`."""
+    total = 0
+    for chunk in read_times(path, fmt, chunk_size=CHUNK_SIZE, as_ns=as_ns):
+        if as_ns:
+            total += sum(ns % 1000000000 for ns in chunk)
+        else:
+            total += sum(t.gpsNanoSeconds for t in chunk)
+    return total
+
+
+def _seek(path: Path, fmt: str, start: LIGOTimeGPS) -> list[LIGOTimeGPS]:
+    """Return the first chunk of times at or after ``start``."""
+    chunks = read_times(path, fmt, chunk_size=CHUNK_SIZE, start=start)
+    try:
+        return next(chunks)
+    finally:
+        chunks.close()
+
+
+def _peak_memory(func: Callable[[], object]) -> int:
+    """Return the peak memory allocated by calling ``func``, in bytes."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    times = GPSRange(1400000000, 1400000000 + NTIMES * 0.0123, 0.0123)
+    rows = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = {}
+        for fmt in ("text", "int64", "packed"):
+            paths[fmt] = Path(tmpdir) / f"times.{fmt}"
+            write_times(paths[fmt], times, fmt)
+        expected = _readlines(paths["text"])
+        for name, func in (
+            ("readlines + LIGOTimeGPS", partial(_readlines, paths["text"])),
+            *(
+                (
+                    f"read_times {fmt!r}{', as_ns' if as_ns else ''}",
+                    partial(_read_times, path, fmt, as_ns=as_ns),
+                )
+                for fmt, path in paths.items()
+                for as_ns in (False, True)
+            ),
+        ):
+            assert func() == expected
+            rows.append((
+                name,
+                format_time(time_per_call(func, repeat=3)),
+                f"{_peak_memory(func) / 2 ** 20:.1f} MiB",
+            ))
+        for fmt in ("int64", "packed"):
+            seek = partial(_seek, paths[fmt], fmt, times[-10])
+            rows.append((
+                f"seek + first chunk, {fmt!r}",
+                format_time(time_per_call(seek)),
+                "-",
+            ))
+    print(f"{NTIMES} times, chunks of {CHUNK_SIZE}\n")
+    print_table(("method", "time", "peak memory"), rows)
+
+
+if __name__ == "__main__":
+    main()
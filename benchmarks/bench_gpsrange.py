@@ -0,0 +1,112 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark generating a regular sequence of GPS times with `GPSRange`.
+
+This compares `GPSRange` against building the same sequence by repeatedly
+adding the step to a `LIGOTimeGPS`, which also accumulates rounding
+error, and reports that error alongside the timings.
+
+Run as::
+
+    python benchmarks/bench_gpsrange.py
+"""
+
+from __future__ import annotations
+
+from functools import partial
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import (
+    GPSRange,
+    LIGOTimeGPS,
+)
+
+RATE = 16384
+STEP = 1 / RATE
+NTIMES = 16384
+DRIFT_STEP = 1 / 3
+
+
+def _accumulate(
+    start: LIGOTimeGPS,
+    count: int,
+    step: float = STEP,
+) -> list[LIGOTimeGPS]:
+    """Return a sequence of times by repeated addition."""
+    times = []
+    t = start
+    for _ in range(count):
+        times.append(t)
+        t = t + step
+    return times
+
+
+def _iterate(times: GPSRange) -> list[LIGOTimeGPS]:
+    """Return all times in a `GPSRange` as a list."""
+    return list(times)
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    start = LIGOTimeGPS(1000000000)
+    times = GPSRange(start, start + NTIMES * STEP, STEP)
+    rows = []
+    for name, before, after in (
+        (
+            f"list of times (x{NTIMES})",
+            partial(_accumulate, start, NTIMES),
+            partial(_iterate, times),
+        ),
+        (
+            f"int64 nanoseconds (x{NTIMES})",
+            partial(_accumulate, start, NTIMES),
+            times.ns,
+        ),
+        (
+            "last element",
+            partial(_accumulate, start, NTIMES),
+            partial(times.__getitem__, NTIMES - 1),
+        ),
+    ):
+        t_before = time_per_call(before)
+        t_after = time_per_call(after)
+        rows.append((
+            name,
+            format_time(t_before),
+            format_time(t_after),
+            f"{t_before / t_after:.1f}x",
+        ))
+    print_table(("operation", "before", "after", "speed-up"), rows)
+
+    # repeated addition rounds every step, so the error grows with length
+    count = 100000
+    drift = _accumulate(start, count, DRIFT_STEP)[-1]
+    exact = GPSRange(start, start + count * DRIFT_STEP, DRIFT_STEP)[-1]
+    print(
+        f"\nerror after {count} additions of 1/3 s: "
+        f"{float(drift - exact) * 1e9:.0f} ns (GPSRange: 0 ns)",
+    )
+
+
+if __name__ == "__main__":
+    main()
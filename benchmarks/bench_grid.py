@@ -0,0 +1,104 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark snapping times to a sample grid and mapping them to indices.
+
+This compares `LIGOTimeGPS.floor` and `SampleGrid` against the
+equivalent operations built from `LIGOTimeGPS` arithmetic.
+
+Run as::
+
+    python benchmarks/bench_grid.py
+"""
+
+from __future__ import annotations
+
+from functools import partial
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import (
+    LIGOTimeGPS,
+    LIGOTimeGPSArray,
+    SampleGrid,
+)
+
+RATE = 16384
+STEP = 1 / RATE
+NTIMES = 10000
+
+
+def _floor_mod(t: LIGOTimeGPS) -> LIGOTimeGPS:
+    """Floor a time to the grid using the modulo operator."""
+    return t - t % STEP
+
+
+def _index_arithmetic(t: LIGOTimeGPS, t0: LIGOTimeGPS) -> int:
+    """Return the sample index of a time using LIGOTimeGPS arithmetic."""
+    return int((t - t0) * RATE)
+
+
+def _indices_loop(times: LIGOTimeGPSArray, t0: LIGOTimeGPS) -> list[int]:
+    """Return the sample index of many times using a Python loop."""
+    return [_index_arithmetic(t, t0) for t in times]
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    t0 = LIGOTimeGPS(1000000000)
+    t = LIGOTimeGPS(1000012345, 123456789)
+    grid = SampleGrid(t0, RATE)
+    times = LIGOTimeGPSArray.from_ns(range(
+        t0.ns(),
+        t0.ns() + NTIMES * 12345677,
+        12345677,
+    ))
+    rows = []
+    for name, before, after in (
+        (
+            "floor to 1/16384 s",
+            partial(_floor_mod, t),
+            partial(t.floor, STEP),
+        ),
+        (
+            "time -> index",
+            partial(_index_arithmetic, t, t0),
+            partial(grid.index, t),
+        ),
+        (
+            f"time -> index (x{NTIMES})",
+            partial(_indices_loop, times, t0),
+            partial(grid.indices, times),
+        ),
+    ):
+        t_before = time_per_call(before)
+        t_after = time_per_call(after)
+        rows.append((
+            name,
+            format_time(t_before),
+            format_time(t_after),
+            f"{t_before / t_after:.1f}x",
+        ))
+    print_table(("operation", "before", "after", "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark dictionaries keyed on dense grids of `LIGOTimeGPS`.
+
+This compares the rational-value hash of `LIGOTimeGPS` (consistent
+with `int`, `float`, and `fractions.Fraction`) against the previous
+``seconds ^ nanoseconds`` hash, reporting the number of distinct hash
+values and the dict insert/lookup time for each workload.
+The previous hash is cheaper to compute, but doesn't match the hash of
+equal numbers, so it is expected to be faster here.
+
+Run as::
+
+    python benchmarks/bench_hash.py
+"""
+
+from __future__ import annotations
+
+import random
+from functools import partial
+from typing import TYPE_CHECKING
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import LIGOTimeGPS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+START = 1000000000
+NTIMES = 65536
+
+
+class LegacyLIGOTimeGPS(LIGOTimeGPS):
+    """`LIGOTimeGPS` with the previous XOR hash."""
+
+    __slots__ = ()
+
+    def __hash__(self) -> int:
+        """Return hash of the `LIGOTimeGPS` (previous implementation)."""
+        return self._seconds ^ self._nanoseconds
+
+
+def grid(cls: type[LIGOTimeGPS], rate: int) -> list[LIGOTimeGPS]:
+    """Return `NTIMES` times on a regular sample grid."""
+    step = 1000000000 // rate
+    return [cls(START + i // rate, (i % rate) * step) for i in range(NTIMES)]
+
+
+def triggers(cls: type[LIGOTimeGPS]) -> list[LIGOTimeGPS]:
+    """Return `NTIMES` random trigger times in a 1000-second window."""
+    rng = random.Random(0)
+    return [
+        cls(START + rng.randrange(1000), rng.randrange(1000000000))
+        for _ in range(NTIMES)
+    ]
+
+
+WORKLOADS: dict[str, Callable[[type[LIGOTimeGPS]], list[LIGOTimeGPS]]] = {
+    "1 Hz grid": partial(grid, rate=1),
+    "4096 Hz grid": partial(grid, rate=4096),
+    "16384 Hz grid": partial(grid, rate=16384),
+    "triggers": triggers,
+}
+
+
+def _lookup(table: dict[LIGOTimeGPS, None], keys: list[LIGOTimeGPS]) -> None:
+    """Look up each key in a dict."""
+    for key in keys:
+        table[key]
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    rows = []
+    for label, workload in WORKLOADS.items():
+        results = {}
+        for name, cls in (
+            ("before", LegacyLIGOTimeGPS),
+            ("after", LIGOTimeGPS),
+        ):
+            times = workload(cls)
+            table = dict.fromkeys(times)
+            results[name] = (
+                len(set(map(hash, times))),
+                time_per_call(partial(dict.fromkeys, times), repeat=3),
+                time_per_call(partial(_lookup, table, times), repeat=3),
+            )
+        for i, operation in ((1, "insert"), (2, "lookup")):
+            before = results["before"][i]
+            after = results["after"][i]
+            rows.append((
+                f"{label} {operation}",
+                results["before"][0],
+                results["after"][0],
+                format_time(before),
+                format_time(after),
+                f"{before / after:.1f}x",
+            ))
+    print_table(
+        (
+            "workload",
+            "hashes before",
+            "hashes after",
+            "before",
+            "after",
+            "speed-up",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
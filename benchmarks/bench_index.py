@@ -0,0 +1,135 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark range and nearest-neighbour queries with `GPSIndex`.
+
+This compares `GPSIndex` against bisecting a sorted list of
+`(LIGOTimeGPS, row)` tuples, which compares `LIGOTimeGPS` objects
+at every step of every search.
+
+Run as::
+
+    python benchmarks/bench_index.py
+"""
+
+from __future__ import annotations
+
+import bisect
+import random
+from functools import partial
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import (
+    GPSIndex,
+    LIGOTimeGPS,
+)
+
+NTIMES = 100000
+NQUERIES = 1000
+
+Entry = tuple[LIGOTimeGPS, int]
+
+
+def _build(times: list[LIGOTimeGPS]) -> list[Entry]:
+    """Return a sorted list of ``(time, row)`` tuples."""
+    return sorted(zip(times, range(len(times)), strict=True))
+
+
+def _range(
+    entries: list[Entry],
+    keys: list[LIGOTimeGPS],
+    t1s: list[LIGOTimeGPS],
+) -> int:
+    """Return the total number of rows in 1-second windows."""
+    total = 0
+    for t1 in t1s:
+        first = bisect.bisect_left(keys, t1)
+        last = bisect.bisect_left(keys, t1 + 1)
+        total += len([row for _, row in entries[first:last]])
+    return total
+
+
+def _index_range(index: GPSIndex, t1s: list[LIGOTimeGPS]) -> int:
+    """Return the total number of rows in 1-second windows."""
+    return sum(len(index.range(t1, t1 + 1)) for t1 in t1s)
+
+
+def _nearest(
+    entries: list[Entry],
+    keys: list[LIGOTimeGPS],
+    times: list[LIGOTimeGPS],
+) -> list[int]:
+    """Return the row of the nearest entry to each time."""
+    rows = []
+    for t in times:
+        i = bisect.bisect_left(keys, t)
+        if i == len(keys) or (i and t - keys[i - 1] <= keys[i] - t):
+            i -= 1
+        rows.append(entries[i][1])
+    return rows
+
+
+def _index_nearest(index: GPSIndex, times: list[LIGOTimeGPS]) -> list[int]:
+    """Return the row of the nearest entry to each time."""
+    return [index.nearest(t)[1] for t in times]
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    rng = random.Random(0)
+    span = 86400 * 10 ** 9
+    times = [LIGOTimeGPS.from_ns(rng.randrange(span)) for _ in range(NTIMES)]
+    queries = [LIGOTimeGPS.from_ns(rng.randrange(span)) for _ in range(NQUERIES)]
+    entries = _build(times)
+    keys = [t for t, _ in entries]
+    index = GPSIndex(times)
+    rows = []
+    for name, before, after in (
+        (
+            f"build (x{NTIMES})",
+            partial(_build, times),
+            partial(GPSIndex, times),
+        ),
+        (
+            f"range (x{NQUERIES})",
+            partial(_range, entries, keys, queries),
+            partial(_index_range, index, queries),
+        ),
+        (
+            f"nearest (x{NQUERIES})",
+            partial(_nearest, entries, keys, queries),
+            partial(_index_nearest, index, queries),
+        ),
+    ):
+        t_before = time_per_call(before)
+        t_after = time_per_call(after)
+        rows.append((
+            name,
+            format_time(t_before),
+            format_time(t_after),
+            f"{t_before / t_after:.1f}x",
+        ))
+    print_table(("operation", "before", "after", "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark interning of `LIGOTimeGPS` built from repeated inputs.
+
+This compares ``LIGOTimeGPS(value)`` against ``LIGOTimeGPS.intern(value)``
+for an ingestion workload where a small set of distinct times (e.g.
+segment boundaries or frame-file epochs) is repeated many times.
+
+Run as::
+
+    python benchmarks/bench_intern.py
+"""
+
+from __future__ import annotations
+
+import random
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import (
+    InternCache,
+    LIGOTimeGPS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+#: number of inputs in each workload
+NVALUES = 100000
+
+#: number of distinct inputs in each workload
+NDISTINCT = 500
+
+
+def _inputs() -> dict[str, list[Any]]:
+    """Return the workloads to benchmark."""
+    rng = random.Random(0)
+    epochs = [
+        1000000000 + rng.randrange(10000000) + rng.randrange(16) / 16
+        for _ in range(NDISTINCT)
+    ]
+    floats = [rng.choice(epochs) for _ in range(NVALUES)]
+    return {
+        "float": list(floats),
+        "str": [repr(x) for x in floats],
+        "bytes": [repr(x).encode() for x in floats],
+    }
+
+
+def _convert(func: Callable[[Any], LIGOTimeGPS], values: list[Any]) -> None:
+    """Convert each value using ``func``."""
+    list(map(func, values))
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    rows = []
+    for name, values in _inputs().items():
+        cache = InternCache(LIGOTimeGPS)
+        before = time_per_call(partial(_convert, LIGOTimeGPS, values))
+        after = time_per_call(partial(_convert, cache, values))
+        info = cache.cache_info()
+        rows.append((
+            name,
+            format_time(before / NVALUES),
+            format_time(after / NVALUES),
+            f"{before / after:.1f}x",
+            f"{info.hits / (info.hits + info.misses):.1%}",
+        ))
+    print_table(
+        ("input type", "LIGOTimeGPS()", "intern()", "speed-up", "hit rate"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
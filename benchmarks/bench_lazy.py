@@ -0,0 +1,94 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark loading a table of GPS time columns, then filtering its rows.
+
+Each row of the table holds several GPS time strings, as read from a
+LIGO_LW XML file.
+All cells are converted on load with either `LIGOTimeGPS` or
+`LIGOTimeGPS.lazy`, then the rows are filtered on the first column, and
+every time in the selected rows is used.
+
+Run as::
+
+    python benchmarks/bench_lazy.py
+"""
+
+from __future__ import annotations
+
+import random
+from functools import partial
+from typing import TYPE_CHECKING
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import LIGOTimeGPS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+NROWS = 20000
+NCOLUMNS = 10
+START = LIGOTimeGPS(1400000000)
+END = START + 1000000
+
+
+def _load_and_filter(
+    table: list[list[bytes]],
+    convert: Callable[[bytes], LIGOTimeGPS],
+    keep: float,
+) -> int:
+    """Load ``table``, keep rows whose first time is in range, use them."""
+    rows = [list(map(convert, row)) for row in table]
+    end = START + (END - START) * keep
+    selected = [row for row in rows if START <= row[0] < end]
+    return sum(sum(t.gpsNanoSeconds for t in row) for row in selected)
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    rng = random.Random(0)
+    table = [
+        [
+            f"{rng.randrange(START.ns(), END.ns()) / 1e9:.9f}".encode()
+            for _ in range(NCOLUMNS)
+        ]
+        for _ in range(NROWS)
+    ]
+    rows = []
+    for keep in (0.01, 0.1, 1.):
+        eager = partial(_load_and_filter, table, LIGOTimeGPS, keep)
+        lazy = partial(_load_and_filter, table, LIGOTimeGPS.lazy, keep)
+        assert eager() == lazy()
+        t_eager = time_per_call(eager, repeat=3)
+        t_lazy = time_per_call(lazy, repeat=3)
+        rows.append((
+            f"{keep:.0%}",
+            format_time(t_eager),
+            format_time(t_lazy),
+            f"{t_eager / t_lazy:.1f}x",
+        ))
+    print(f"{NROWS} rows x {NCOLUMNS} columns of GPS time strings\n")
+    print_table(("rows kept", "eager", "lazy", "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
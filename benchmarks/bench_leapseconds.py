@@ -0,0 +1,142 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark conversion of GPS times to Unix time and UTC.
+
+This compares `LIGOTimeGPS.to_unix_ns` and the bulk `gps_to_unix_ns`
+against a per-call linear scan of the leap-second table (as done by
+many time-conversion libraries), and `LIGOTimeGPS.to_datetime` against
+building the `datetime` from `float` seconds.
+
+Run as::
+
+    python benchmarks/bench_leapseconds.py
+"""
+
+from __future__ import annotations
+
+import random
+from array import array
+from datetime import (
+    UTC,
+    datetime,
+    timedelta,
+)
+from functools import partial
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import (
+    LIGOTimeGPS,
+    gps_to_unix_ns,
+)
+from ligotimegps.leapseconds import (
+    BUILTIN_TABLE,
+    UNIX_GPS_EPOCH,
+)
+
+NTIMES = 100000
+
+#: GPS time (seconds) of each leap second since the GPS epoch
+LEAPS = [
+    unix - UNIX_GPS_EPOCH + tai - 20
+    for unix, tai in BUILTIN_TABLE.leaps
+    if tai > 19  # noqa: PLR2004
+]
+
+EPOCH = datetime(1980, 1, 6, tzinfo=UTC)
+
+
+def _scan_to_unix_ns(times: list[LIGOTimeGPS]) -> list[int]:
+    """Convert times to Unix nanoseconds, scanning all leap seconds."""
+    out = []
+    for t in times:
+        seconds = t.gpsSeconds
+        leaps = 0
+        for leap in LEAPS:
+            if seconds >= leap:
+                leaps += 1
+        ns = (seconds + UNIX_GPS_EPOCH - leaps) * 1000000000
+        out.append(ns + t.gpsNanoSeconds)
+    return out
+
+
+def _to_unix_ns(times: list[LIGOTimeGPS]) -> list[int]:
+    """Convert times to Unix nanoseconds with `LIGOTimeGPS.to_unix_ns`."""
+    return [t.to_unix_ns() for t in times]
+
+
+def _scan_to_datetime(times: list[LIGOTimeGPS]) -> list[datetime]:
+    """Convert times to `datetime` via `float`, scanning all leap seconds."""
+    out = []
+    for t in times:
+        seconds = float(t)
+        leaps = sum(seconds >= leap for leap in LEAPS)
+        out.append(EPOCH + timedelta(seconds=seconds - leaps))
+    return out
+
+
+def _to_datetime(times: list[LIGOTimeGPS]) -> list[datetime]:
+    """Convert times to `datetime` with `LIGOTimeGPS.to_datetime`."""
+    return [t.to_datetime() for t in times]
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    rng = random.Random(0)
+    nanoseconds = array(
+        "q",
+        sorted(rng.randrange(10 ** 18, 14 * 10 ** 17) for _ in range(NTIMES)),
+    )
+    times = list(map(LIGOTimeGPS.from_ns, nanoseconds))
+    assert _scan_to_unix_ns(times) == _to_unix_ns(times)
+    rows = []
+    for name, before, after in (
+        (
+            "LIGOTimeGPS.to_unix_ns",
+            partial(_scan_to_unix_ns, times),
+            partial(_to_unix_ns, times),
+        ),
+        (
+            "gps_to_unix_ns (bulk)",
+            partial(_scan_to_unix_ns, times),
+            partial(gps_to_unix_ns, nanoseconds),
+        ),
+        (
+            "LIGOTimeGPS.to_datetime",
+            partial(_scan_to_datetime, times),
+            partial(_to_datetime, times),
+        ),
+    ):
+        t_before = time_per_call(before, repeat=3)
+        t_after = time_per_call(after, repeat=3)
+        rows.append((
+            name,
+            format_time(t_before),
+            format_time(t_after),
+            f"{t_before / t_after:.0f}x",
+        ))
+    print(f"{NTIMES} times, 'before' scans the leap-second table per call\n")
+    print_table(("operation", "before", "after", "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
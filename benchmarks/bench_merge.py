@@ -0,0 +1,112 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark merging time-ordered event streams with `merge_by_time`.
+
+This compares `merge_by_time` against `heapq.merge` with a key
+function returning the `LIGOTimeGPS` of each event, which compares
+`LIGOTimeGPS` objects at every step of the merge.
+
+Run as::
+
+    python benchmarks/bench_merge.py
+"""
+
+from __future__ import annotations
+
+import heapq
+import random
+from collections import deque
+from functools import partial
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import (
+    LIGOTimeGPS,
+    merge_by_time,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+NSTREAMS = 16
+NEVENTS = 10000  # per stream
+
+Event = tuple[str, LIGOTimeGPS]
+_time = itemgetter(1)
+
+
+def _consume(iterator: Iterator[Event]) -> None:
+    """Exhaust an iterator."""
+    deque(iterator, maxlen=0)
+
+
+def _heapq_merge(streams: list[list[Event]]) -> None:
+    """Merge streams with `heapq.merge`."""
+    _consume(heapq.merge(*streams, key=_time))
+
+
+def _merge_by_time(streams: list[list[Event]], lateness: float = 0) -> None:
+    """Merge streams with `merge_by_time`."""
+    _consume(merge_by_time(*streams, key=_time, lateness=lateness))
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    rng = random.Random(0)
+    streams = [
+        sorted(
+            (
+                (f"channel{i}", LIGOTimeGPS.from_ns(rng.randrange(10 ** 13)))
+                for _ in range(NEVENTS)
+            ),
+            key=_time,
+        )
+        for i in range(NSTREAMS)
+    ]
+    rows = []
+    for name, before, after in (
+        (
+            f"{NSTREAMS} x {NEVENTS} events",
+            partial(_heapq_merge, streams),
+            partial(_merge_by_time, streams),
+        ),
+        (
+            f"{NSTREAMS} x {NEVENTS} events (lateness=1)",
+            partial(_heapq_merge, streams),
+            partial(_merge_by_time, streams, lateness=1),
+        ),
+    ):
+        t_before = time_per_call(before)
+        t_after = time_per_call(after)
+        rows.append((
+            name,
+            format_time(t_before),
+            format_time(t_after),
+            f"{t_before / t_after:.1f}x",
+        ))
+    print_table(("operation", "heapq.merge", "merge_by_time", "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
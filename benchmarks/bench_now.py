@@ -0,0 +1,88 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark the latency of reading the current GPS time.
+
+This compares `LIGOTimeGPS.now` against building the time from
+`datetime.datetime.now` via `float` seconds with a per-call leap-second
+lookup, and against `LIGOTimeGPS.from_unix_ns` (which looks up the leap
+seconds on every call), with the cost of `time.time_ns` for reference.
+
+Run as::
+
+    python benchmarks/bench_now.py
+"""
+
+from __future__ import annotations
+
+from datetime import (
+    UTC,
+    datetime,
+)
+from time import time_ns
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import LIGOTimeGPS
+from ligotimegps.leapseconds import (
+    BUILTIN_TABLE,
+    UNIX_GPS_EPOCH,
+)
+
+#: GPS time (seconds) of each leap second since the GPS epoch
+LEAPS = [
+    unix - UNIX_GPS_EPOCH + tai - 20
+    for unix, tai in BUILTIN_TABLE.leaps
+    if tai > 19  # noqa: PLR2004
+]
+
+EPOCH = datetime(1980, 1, 6, tzinfo=UTC)
+
+
+def _from_datetime() -> LIGOTimeGPS:
+    """Return the current GPS time via `datetime` and `float`."""
+    seconds = (datetime.now(tz=UTC) - EPOCH).total_seconds()
+    leaps = sum(seconds >= leap for leap in LEAPS)
+    return LIGOTimeGPS(seconds + leaps)
+
+
+def _from_unix_ns() -> LIGOTimeGPS:
+    """Return the current GPS time via `LIGOTimeGPS.from_unix_ns`."""
+    return LIGOTimeGPS.from_unix_ns(time_ns())
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    rows = [
+        (name, format_time(time_per_call(func)))
+        for name, func in (
+            ("time.time_ns (reference)", time_ns),
+            ("datetime -> float -> LIGOTimeGPS", _from_datetime),
+            ("LIGOTimeGPS.from_unix_ns(time_ns())", _from_unix_ns),
+            ("LIGOTimeGPS.now", LIGOTimeGPS.now),
+        )
+    ]
+    print("latency per call\n")
+    print_table(("method", "time"), rows)
+
+
+if __name__ == "__main__":
+    main()
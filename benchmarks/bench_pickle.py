@@ -0,0 +1,112 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark serialising many GPS times with `pickle` and `pack_many`.
+
+This compares the size and round-trip time of pickling a list of
+`LIGOTimeGPS` using ``__reduce__`` against the previous
+``__getstate__``/``__setstate__`` implementation, and against the
+fixed-width binary packing of `pack_many` and `unpack_many`.
+
+Run as::
+
+    python benchmarks/bench_pickle.py
+"""
+
+from __future__ import annotations
+
+import pickle
+import random
+from functools import partial
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import (
+    LIGOTimeGPS,
+    LIGOTimeGPSArray,
+    pack_many,
+    unpack_many,
+)
+
+NTIMES = 10000
+
+
+class LegacyLIGOTimeGPS(LIGOTimeGPS):
+    """`LIGOTimeGPS` pickled using ``__getstate__`` (previous implementation)."""
+
+    __slots__ = ()
+
+    __reduce__ = object.__reduce__  # type: ignore[assignment]
+
+
+def _pickle_roundtrip(times: object) -> object:
+    """Pickle and unpickle an object."""
+    data = pickle.dumps(times, protocol=pickle.HIGHEST_PROTOCOL)
+    return pickle.loads(data)  # noqa: S301
+
+
+def _pack_roundtrip(times: list[LIGOTimeGPS]) -> list[LIGOTimeGPS]:
+    """Pack and unpack a list of times."""
+    return unpack_many(pack_many(times))
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    rng = random.Random(0)
+    ns = [rng.randrange(10 ** 18) for _ in range(NTIMES)]
+    legacy = list(map(LegacyLIGOTimeGPS.from_ns, ns))
+    times = list(map(LIGOTimeGPS.from_ns, ns))
+    array = LIGOTimeGPSArray.from_ns(ns)
+
+    rows = []
+    for name, size, func in (
+        (
+            "pickle (__getstate__)",
+            len(pickle.dumps(legacy, protocol=pickle.HIGHEST_PROTOCOL)),
+            partial(_pickle_roundtrip, legacy),
+        ),
+        (
+            "pickle (__reduce__)",
+            len(pickle.dumps(times, protocol=pickle.HIGHEST_PROTOCOL)),
+            partial(_pickle_roundtrip, times),
+        ),
+        (
+            "pack_many/unpack_many",
+            len(pack_many(times)),
+            partial(_pack_roundtrip, times),
+        ),
+        (
+            "pickle LIGOTimeGPSArray",
+            len(pickle.dumps(array, protocol=pickle.HIGHEST_PROTOCOL)),
+            partial(_pickle_roundtrip, array),
+        ),
+    ):
+        rows.append((
+            name,
+            f"{size / NTIMES:.1f}",
+            format_time(time_per_call(func)),
+        ))
+    print(f"round-trip of {NTIMES} times\n")
+    print_table(("method", "bytes/time", "round-trip"), rows)
+
+
+if __name__ == "__main__":
+    main()
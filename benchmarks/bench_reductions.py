@@ -0,0 +1,111 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark exact reductions over many GPS times.
+
+This compares `gps_sum`, `gps_mean`, `gps_min`, `argsort`, and
+`histogram` against the equivalent built-in functions applied to a
+`list` of `LIGOTimeGPS` objects.
+
+Run as::
+
+    python benchmarks/bench_reductions.py
+"""
+
+from __future__ import annotations
+
+import random
+from functools import partial
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import (
+    LIGOTimeGPS,
+    LIGOTimeGPSArray,
+    argsort,
+    gps_mean,
+    gps_min,
+    gps_sum,
+    histogram,
+)
+
+NTIMES = 100000
+START = LIGOTimeGPS(1000000000)
+BIN_WIDTH = 60
+
+
+def _sum(times: list[LIGOTimeGPS]) -> LIGOTimeGPS:
+    """Sum times with `LIGOTimeGPS` addition."""
+    return sum(times, LIGOTimeGPS(0))
+
+
+def _mean(times: list[LIGOTimeGPS]) -> LIGOTimeGPS:
+    """Average times with `LIGOTimeGPS` addition and division."""
+    return _sum(times) / len(times)
+
+
+def _argsort(times: list[LIGOTimeGPS]) -> list[int]:
+    """Return sorting indices using `LIGOTimeGPS` comparisons."""
+    return sorted(range(len(times)), key=times.__getitem__)
+
+
+def _histogram(times: list[LIGOTimeGPS]) -> list[int]:
+    """Count times in bins using `LIGOTimeGPS` arithmetic."""
+    counts: dict[int, int] = {}
+    for t in times:
+        index = int((t - START) / BIN_WIDTH)
+        counts[index] = counts.get(index, 0) + 1
+    return [counts.get(i, 0) for i in range(max(counts) + 1)]
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    rng = random.Random(0)
+    times = [
+        START + LIGOTimeGPS.from_ns(rng.randrange(86400 * 10 ** 9))
+        for _ in range(NTIMES)
+    ]
+    array = LIGOTimeGPSArray(times)
+    rows = []
+    for name, before, after in (
+        ("sum", partial(_sum, times), partial(gps_sum, array)),
+        ("mean", partial(_mean, times), partial(gps_mean, array)),
+        ("min", partial(min, times), partial(gps_min, array)),
+        ("argsort", partial(_argsort, times), partial(argsort, array)),
+        (
+            "histogram",
+            partial(_histogram, times),
+            partial(histogram, array, START, BIN_WIDTH),
+        ),
+    ):
+        t_before = time_per_call(before)
+        t_after = time_per_call(after)
+        rows.append((
+            f"{name} (x{NTIMES})",
+            format_time(t_before),
+            format_time(t_after),
+            f"{t_before / t_after:.1f}x",
+        ))
+    print_table(("operation", "before", "after", "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
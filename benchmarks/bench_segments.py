@@ -0,0 +1,164 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark segment algebra on large lists of segments.
+
+This compares `SegmentList` against the same operations on plain lists
+of ``(start, end)`` tuples of `LIGOTimeGPS`, coalesced and combined
+with `LIGOTimeGPS` comparisons.
+
+Run as::
+
+    python benchmarks/bench_segments.py
+"""
+
+from __future__ import annotations
+
+import bisect
+import random
+from functools import partial
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import (
+    LIGOTimeGPS,
+    SegmentList,
+)
+
+NSEGMENTS = 100000
+NQUERIES = 1000
+
+Pair = tuple[LIGOTimeGPS, LIGOTimeGPS]
+
+
+def _coalesce(segments: list[Pair]) -> list[Pair]:
+    """Sort and merge a list of segment tuples."""
+    out: list[Pair] = []
+    for start, end in sorted(segments):
+        if out and start <= out[-1][1]:
+            if end > out[-1][1]:
+                out[-1] = (out[-1][0], end)
+        elif end > start:
+            out.append((start, end))
+    return out
+
+
+def _intersection(left: list[Pair], right: list[Pair]) -> list[Pair]:
+    """Intersect two coalesced lists of segment tuples."""
+    out = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        start = max(left[i][0], right[j][0])
+        end = min(left[i][1], right[j][1])
+        if start < end:
+            out.append((start, end))
+        if left[i][1] < right[j][1]:
+            i += 1
+        else:
+            j += 1
+    return out
+
+
+def _union(left: list[Pair], right: list[Pair]) -> list[Pair]:
+    """Return the union of two lists of segment tuples."""
+    return _coalesce(left + right)
+
+
+def _contains(segments: list[Pair], times: list[LIGOTimeGPS]) -> int:
+    """Count the times contained by a coalesced list of segment tuples."""
+    starts = [start for start, _ in segments]
+    count = 0
+    for t in times:
+        index = bisect.bisect_right(starts, t) - 1
+        if index >= 0 and t < segments[index][1]:
+            count += 1
+    return count
+
+
+def _segmentlist_contains(
+    segments: SegmentList,
+    times: list[LIGOTimeGPS],
+) -> int:
+    """Count the times contained by a `SegmentList`."""
+    return sum(t in segments for t in times)
+
+
+def _random_segments(rng: random.Random) -> list[Pair]:
+    """Return random segments covering about half of their extent."""
+    segments = []
+    for _ in range(NSEGMENTS):
+        start = rng.randrange(10 ** 18)
+        duration = rng.randrange(2 * 10 ** 13)
+        segments.append((
+            LIGOTimeGPS.from_ns(start),
+            LIGOTimeGPS.from_ns(start + duration),
+        ))
+    return segments
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    rng = random.Random(0)
+    raw_left = _random_segments(rng)
+    raw_right = _random_segments(rng)
+    times = [LIGOTimeGPS.from_ns(rng.randrange(10 ** 18)) for _ in range(NQUERIES)]
+
+    tuples_left = _coalesce(raw_left)
+    tuples_right = _coalesce(raw_right)
+    left = SegmentList(raw_left)
+    right = SegmentList(raw_right)
+
+    rows = []
+    for name, before, after in (
+        (
+            f"coalesce (x{NSEGMENTS})",
+            partial(_coalesce, raw_left),
+            partial(SegmentList, raw_left),
+        ),
+        (
+            "intersection",
+            partial(_intersection, tuples_left, tuples_right),
+            partial(left.__and__, right),
+        ),
+        (
+            "union",
+            partial(_union, tuples_left, tuples_right),
+            partial(left.__or__, right),
+        ),
+        (
+            f"contains time (x{NQUERIES})",
+            partial(_contains, tuples_left, times),
+            partial(_segmentlist_contains, left, times),
+        ),
+    ):
+        t_before = time_per_call(before)
+        t_after = time_per_call(after)
+        rows.append((
+            name,
+            format_time(t_before),
+            format_time(t_after),
+            f"{t_before / t_after:.1f}x",
+        ))
+    print_table(("operation", "before", "after", "speed-up"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark memory use and attribute access of `LIGOTimeGPS`.
+
+This compares the slotted `LIGOTimeGPS` against a reference class
+using the previous layout (per-instance ``__dict__`` and lambda-based
+properties).
+
+Run as::
+
+    python benchmarks/bench_slots.py
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+
+from _timing import (
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+from ligotimegps import LIGOTimeGPS
+
+NINSTANCES = 100000
+
+
+class DictLIGOTimeGPS:
+    """Reference implementation of the previous `LIGOTimeGPS` layout."""
+
+    def __init__(self, seconds: int, nanoseconds: int) -> None:
+        """Store the parts in the instance ``__dict__``."""
+        self._seconds = seconds + nanoseconds // 1000000000
+        self._nanoseconds = nanoseconds % 1000000000
+
+    gpsSeconds = property(fget=lambda self: self._seconds)  # noqa: N815
+    gpsNanoSeconds = property(fget=lambda self: self._nanoseconds)  # noqa: N815
+
+
+def bytes_per_instance(cls: type, n: int = NINSTANCES) -> float:
+    """Return the memory allocated per instance of ``cls``."""
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    objs = [cls(1000000000, 1) for _ in range(n)]
+    end = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # remove the cost of the list itself
+    return (end - start - objs.__sizeof__()) / n
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    rows = []
+    for name, cls in (
+        ("dict (before)", DictLIGOTimeGPS),
+        ("slots (after)", LIGOTimeGPS),
+    ):
+        namespace: dict[str, object] = {"obj": cls(1000000000, 1)}
+        rows.append((
+            name,
+            f"{bytes_per_instance(cls):.0f}",
+            format_time(time_per_call("obj.gpsSeconds", namespace=namespace)),
+            format_time(
+                time_per_call("obj.gpsNanoSeconds", namespace=namespace),
+            ),
+        ))
+    print_table(
+        ("layout", "bytes/instance", "gpsSeconds", "gpsNanoSeconds"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmark suite covering the `LIGOTimeGPS` hot paths.
+
+Each case is a single statement timed with `timeit`.
+Results are stored as JSON, and two result files can be compared to
+flag regressions.
+Where `lal` is installed, each case is also timed with
+`lal.LIGOTimeGPS` and the ratio reported.
+
+Run as::
+
+    python benchmarks/suite.py run --output before.json
+    # ... make changes ...
+    python benchmarks/suite.py run --output after.json
+    python benchmarks/suite.py compare before.json after.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import platform
+import re
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from _timing import (
+    MIN_TIME,
+    format_time,
+    print_table,
+    time_per_call,
+)
+
+import ligotimegps
+from ligotimegps import LIGOTimeGPS
+
+if TYPE_CHECKING:
+    from types import ModuleType
+    from typing import Any
+
+#: fractional slow-down above which a case is flagged as a regression
+THRESHOLD = 0.1
+
+#: errors raised by `lal.LIGOTimeGPS` for cases it doesn't support
+LAL_UNSUPPORTED = (AttributeError, TypeError)
+
+SETUP = """
+import pickle
+x = GPS(1234567890, 123456789)
+y = GPS(1000000000, 987654321)
+data = pickle.dumps(x)
+"""
+
+#: the benchmark cases, mapping name to statement
+CASES = {
+    "construct int": "GPS(1234567890)",
+    "construct int, int": "GPS(1234567890, 123456789)",
+    "construct float": "GPS(1234567890.125)",
+    "construct str": "GPS('1234567890.123456789')",
+    "construct bytes": "GPS(b'1234567890.123456789')",
+    "construct LIGOTimeGPS": "GPS(x)",
+    "construct LIGOTimeGPSLike": "GPS(foreign)",
+    "now": "GPS.now()",
+    "add LIGOTimeGPS": "x + y",
+    "add int": "x + 10",
+    "add float": "x + 0.5",
+    "sub LIGOTimeGPS": "x - y",
+    "sub float": "x - 0.5",
+    "mul int": "x * 3",
+    "mul float": "x * 1.5",
+    "truediv int": "x / 3",
+    "truediv float": "x / 1.5",
+    "mod int": "x % 7",
+    "mod float": "x % 1.5",
+    "eq LIGOTimeGPS": "x == y",
+    "eq int": "x == 1234567890",
+    "lt LIGOTimeGPS": "x < y",
+    "lt float": "x < 1234567890.5",
+    "hash": "hash(x)",
+    "str": "str(x)",
+    "repr": "repr(x)",
+    "float": "float(x)",
+    "pickle dumps": "pickle.dumps(x)",
+    "pickle loads": "pickle.loads(data)",
+}
+
+
+class ForeignGPS:
+    """A foreign `LIGOTimeGPSLike` type."""
+
+    gpsSeconds = 1234567890  # noqa: N815
+    gpsNanoSeconds = 123456789  # noqa: N815
+
+
+def _namespace(gps: type) -> dict[str, Any]:
+    """Return the namespace in which to time the cases for ``gps``."""
+    namespace: dict[str, Any] = {"GPS": gps, "foreign": ForeignGPS()}
+    exec(SETUP, namespace)  # noqa: S102
+    return namespace
+
+
+def _import_lal() -> ModuleType | None:
+    """Return the `lal` module, or `None` if it isn't installed."""
+    try:
+        import lal  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return lal
+
+
+def time_cases(
+    gps: type,
+    names: list[str],
+    min_time: float = MIN_TIME,
+    unsupported: tuple[type[Exception], ...] = (),
+) -> dict[str, float | None]:
+    """Time each of the named cases using ``gps`` as the time type.
+
+    Any error raised by a case is propagated, except those listed in
+    ``unsupported``, which mark a case that ``gps`` doesn't support.
+
+    Returns
+    -------
+    results : `dict`
+        the time per call (seconds) of each case, or `None` if the case
+        raised one of the ``unsupported`` errors
+    """
+    namespace = _namespace(gps)
+    results: dict[str, float | None] = {}
+    for name in names:
+        try:
+            results[name] = time_per_call(
+                CASES[name],
+                min_time=min_time,
+                namespace=namespace,
+            )
+        except unsupported:
+            results[name] = None
+    return results
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the suite and (optionally) write the results to JSON."""
+    names = [name for name in CASES if re.search(args.filter, name)]
+    results = time_cases(LIGOTimeGPS, names, min_time=args.min_time)
+    lal = None if args.no_lal else _import_lal()
+    lal_results = (
+        time_cases(
+            lal.LIGOTimeGPS,
+            names,
+            min_time=args.min_time,
+            unsupported=LAL_UNSUPPORTED,
+        )
+        if lal is not None else {}
+    )
+
+    rows = []
+    for name in names:
+        seconds = results[name]
+        row = [name, format_time(seconds)]
+        if lal is not None:
+            ref = lal_results[name]
+            row.append(f"{seconds / ref:.1f}x" if ref else "-")
+        rows.append(row)
+    header = ["case", "time"]
+    if lal is not None:
+        header.append("vs lal")
+    print_table(header, rows)
+
+    if args.output:
+        record = {
+            "metadata": {
+                "date": datetime.datetime.now(tz=datetime.UTC).isoformat(),
+                "python": sys.version,
+                "platform": platform.platform(),
+                "ligotimegps": ligotimegps.__version__,
+                "lal": getattr(lal, "__version__", None),
+                "min_time": args.min_time,
+            },
+            "results": results,
+            "lal": lal_results,
+        }
+        args.output.write_text(json.dumps(record, indent=2) + "\n")
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    """Compare two result files, returning 1 if any case regressed."""
+    before = json.loads(args.before.read_text())["results"]
+    after = json.loads(args.after.read_text())["results"]
+    rows = []
+    regressions = 0
+    for name, old in before.items():
+        new = after.get(name)
+        if not old:  # not timed in the earlier run
+            continue
+        if not new:  # a case that was removed, or failed
+            rows.append((name, format_time(old), "-", "-", "MISSING"))
+            regressions += 1
+            continue
+        ratio = new / old
+        flag = ""
+        if ratio > 1 + args.threshold:
+            flag = "REGRESSION"
+            regressions += 1
+        elif ratio < 1 / (1 + args.threshold):
+            flag = "improved"
+        rows.append((
+            name,
+            format_time(old),
+            format_time(new),
+            f"{ratio:.2f}",
+            flag,
+        ))
+    print_table(("case", "before", "after", "ratio", ""), rows)
+    if regressions:
+        print(f"\n{regressions} case(s) regressed by more than "
+              f"{args.threshold:.0%}, or are missing")
+        return 1
+    return 0
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the command-line parser."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmark suite")
+    run_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="path of JSON file in which to store results",
+    )
+    run_parser.add_argument(
+        "-k",
+        "--filter",
+        default="",
+        help="regular expression selecting which cases to run",
+    )
+    run_parser.add_argument(
+        "--min-time",
+        type=float,
+        default=MIN_TIME,
+        help="minimum wall time (seconds) of each measurement",
+    )
+    run_parser.add_argument(
+        "--no-lal",
+        action="store_true",
+        help="don't compare against lal.LIGOTimeGPS, even if installed",
+    )
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser(
+        "compare",
+        help="compare two result files",
+    )
+    compare_parser.add_argument("before", type=Path)
+    compare_parser.add_argument("after", type=Path)
+    compare_parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help="fractional slow-down above which to flag a regression",
+    )
+    compare_parser.set_defaults(func=compare)
+    return parser
+
+
+def main(args: list[str] | None = None) -> int:
+    """Run the benchmark suite command-line interface."""
+    parsed = create_parser().parse_args(args)
+    return parsed.func(parsed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the benchmark suite.
+
+These check that every case runs, and that ``suite.py compare`` fails
+when a case regresses, using a fake timer so that they run quickly.
+"""
+
+import json
+
+import pytest
+import suite
+
+from ligotimegps import LIGOTimeGPS
+
+pytestmark = pytest.mark.benchmark
+
+#: the time per call reported by the fake timer
+TIME = 1e-6
+
+
+@pytest.fixture
+def before(tmp_path, monkeypatch):
+    """Run the suite with a fake timer, returning the results file."""
+    monkeypatch.setattr(suite, "time_per_call", lambda *_args, **_kwargs: TIME)
+    path = tmp_path / "before.json"
+    assert suite.main(["run", "--no-lal", "--output", str(path)]) == 0
+    return path
+
+
+def _after(before, tmp_path, results):
+    """Write a copy of ``before`` with some results changed."""
+    record = json.loads(before.read_text())
+    record["results"].update(results)
+    path = tmp_path / "after.json"
+    path.write_text(json.dumps(record))
+    return path
+
+
+@pytest.mark.parametrize("statement", suite.CASES.values())
+def test_cases(statement):
+    """Test that each case runs with `LIGOTimeGPS`."""
+    namespace = suite._namespace(LIGOTimeGPS)  # noqa: SLF001
+    exec(statement, namespace)  # noqa: S102
+
+
+def test_run(before):
+    """Test that ``run`` records every case."""
+    record = json.loads(before.read_text())
+    assert record["results"] == dict.fromkeys(suite.CASES, TIME)
+    assert record["metadata"]["lal"] is None
+
+
+def test_run_error(monkeypatch):
+    """Test that ``run`` fails if a case raises an error."""
+    def time_per_call(*_args, **_kwargs):
+        raise ZeroDivisionError
+
+    monkeypatch.setattr(suite, "time_per_call", time_per_call)
+    with pytest.raises(ZeroDivisionError):
+        suite.main(["run", "--no-lal", "--filter", "^hash$"])
+
+
+@pytest.mark.parametrize(("results", "flag"), [
+    pytest.param({}, "", id="unchanged"),
+    pytest.param({"hash": TIME / 2}, "improved", id="improved"),
+    pytest.param({"hash": TIME * 1.05}, "", id="noise"),
+    pytest.param({"hash": TIME * 2}, "REGRESSION", id="regression"),
+    pytest.param({"hash": None}, "MISSING", id="missing"),
+])
+def test_compare(before, tmp_path, capsys, results, flag):
+    """Test that ``compare`` fails if any case regressed, or is missing."""
+    after = _after(before, tmp_path, results)
+    status = int(flag in ("REGRESSION", "MISSING"))
+    capsys.readouterr()
+    assert suite.main(["compare", str(before), str(after)]) == status
+    out = capsys.readouterr().out
+    assert flag in out
+    assert ("regressed by more than" in out) is bool(status)
+
+
+def test_compare_threshold(before, tmp_path):
+    """Test ``compare --threshold``."""
+    after = _after(before, tmp_path, {"hash": TIME * 1.05})
+    args = ["compare", str(before), str(after), "--threshold"]
+    assert suite.main([*args, "0.1"]) == 0
+    assert suite.main([*args, "0.01"]) == 1
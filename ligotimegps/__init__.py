@@ -26,7 +26,56 @@ by LAL, so if you really care about performance, don't use this module.
 """
 
 from .ligotimegps import LIGOTimeGPS
+from .gpsarray import LIGOTimeGPSArray
+from .buffer import (
+    LIGOTimeGPSView,
+    from_ns_array,
+    to_ns_array,
+)
+from .coinc import coincidences
+from .dd import (
+    dd_add,
+    dd_div,
+    dd_mul,
+    dd_sub,
+    from_dd_arrays,
+    to_dd_arrays,
+)
+from .gpsfile import (
+    read_times,
+    write_times,
+)
+from .gpsrange import GPSRange
+from .grid import SampleGrid
+from .index import GPSIndex
+from .intern import InternCache
+from .leapseconds import (
+    LeapSecondTable,
+    get_leap_second_table,
+    gps_to_unix_ns,
+    set_leap_second_table,
+    unix_to_gps_ns,
+)
+from .merge import merge_by_time
+from .packing import (
+    PACKED_SIZE,
+    pack_many,
+    unpack_many,
+)
+from .parse import parse_many
 from .protocol import LIGOTimeGPSLike
+from .reductions import (
+    argsort,
+    gps_max,
+    gps_mean,
+    gps_min,
+    gps_sum,
+    histogram,
+)
+from .segments import (
+    Segment,
+    SegmentList,
+)
 
 try:
     from ._version import version as __version__
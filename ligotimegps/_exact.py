@@ -0,0 +1,317 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Exact integer arithmetic helpers for nanosecond-resolution times.
+
+All functions in this module operate on plain `int` values, with
+non-integer operands represented exactly as ``(numerator, denominator)``
+ratios, so that results never depend on floating-point rounding.
+"""
+
+from __future__ import annotations
+
+from numbers import Real
+from typing import TYPE_CHECKING
+
+from .protocol import LIGOTimeGPSLike
+
+if TYPE_CHECKING:
+    from typing import SupportsFloat
+
+NANOSECONDS_PER_SECOND = 1000000000
+
+
+def as_integer_ratio(value: LIGOTimeGPSLike | SupportsFloat) -> tuple[int, int]:
+    """Return ``value`` (in seconds) as an exact integer ratio.
+
+    Parameters
+    ----------
+    value : `int`, `float`, `fractions.Fraction`, `decimal.Decimal`, `LIGOTimeGPSLike`
+        the value to convert; any other `numbers.Real` is converted via
+        `float`
+
+    Returns
+    -------
+    numerator, denominator : `int`
+        the exact ratio, with ``denominator > 0``
+
+    Raises
+    ------
+    TypeError
+        if ``value`` is not a real number or `LIGOTimeGPSLike`
+
+    OverflowError
+        if ``value`` is infinite
+
+    ValueError
+        if ``value`` is NaN
+    """
+    if isinstance(value, int):
+        return int(value), 1
+    try:
+        return value.as_integer_ratio()  # type: ignore[union-attr]
+    except AttributeError:
+        pass
+    if isinstance(value, LIGOTimeGPSLike):
+        return (
+            value.gpsSeconds * NANOSECONDS_PER_SECOND + value.gpsNanoSeconds,
+            NANOSECONDS_PER_SECOND,
+        )
+    if isinstance(value, Real):
+        return float(value).as_integer_ratio()
+    msg = f"cannot convert {type(value).__name__!r} to an exact ratio"
+    raise TypeError(msg)
+
+
+def round_ratio(numerator: int, denominator: int) -> int:
+    """Round ``numerator / denominator`` to the nearest integer.
+
+    Exact halves are rounded to the nearest even integer, matching the
+    built-in `round`.
+
+    Parameters
+    ----------
+    numerator : `int`
+        the numerator
+
+    denominator : `int`
+        the denominator, must be non-zero
+
+    Returns
+    -------
+    nearest : `int`
+        the nearest integer to the ratio
+
+    Examples
+    --------
+    >>> round_ratio(3, 2)
+    2
+    >>> round_ratio(-5, 2)
+    -2
+    >>> round_ratio(7, 4)
+    2
+    """
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    quotient, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient & 1):
+        quotient += 1
+    return quotient
+
+
+def divide_ns(nanoseconds: int, numerator: int, denominator: int) -> int:
+    """Divide a count of nanoseconds by an exact ratio.
+
+    Parameters
+    ----------
+    nanoseconds : `int`
+        the dividend
+
+    numerator, denominator : `int`
+        the divisor as an exact ratio
+
+    Returns
+    -------
+    quotient : `int`
+        the quotient in nanoseconds, rounded down to the nanosecond
+
+    Raises
+    ------
+    ZeroDivisionError
+        if the divisor is zero
+    """
+    if not numerator:
+        msg = "division by zero"
+        raise ZeroDivisionError(msg)
+    return nanoseconds * denominator // numerator
+
+
+def mod_ns(nanoseconds: int, numerator: int, denominator: int) -> int:
+    """Return the remainder of dividing nanoseconds by an exact ratio.
+
+    The integer quotient is the floor of the exact quotient, so that
+    ``x % y == x - int(x / y) * y``, with the product rounded to the
+    nearest nanosecond.
+
+    Parameters
+    ----------
+    nanoseconds : `int`
+        the dividend
+
+    numerator, denominator : `int`
+        the divisor as an exact ratio (in seconds)
+
+    Returns
+    -------
+    remainder : `int`
+        the remainder in nanoseconds
+
+    Raises
+    ------
+    ZeroDivisionError
+        if the divisor is zero
+    """
+    if not numerator:
+        msg = "modulo by zero"
+        raise ZeroDivisionError(msg)
+    # express the divisor in nanoseconds, over the same denominator
+    divisor_numerator = numerator * NANOSECONDS_PER_SECOND
+    quotient = nanoseconds * denominator // divisor_numerator
+    return nanoseconds - round_ratio(quotient * divisor_numerator, denominator)
+
+
+# -- grids -----------------------------
+#
+# The functions below work on a regular grid of boundaries at ``k * step``
+# nanoseconds, with ``step = numerator / denominator > 0``.
+# Each boundary is rounded (half up) to the nearest nanosecond, and the
+# index functions are defined relative to those rounded boundaries, so that
+# ``floor_index(boundary_ns(k, ...), ...) == k`` for any step of at least
+# one nanosecond.
+
+def step_ratio_ns(
+    step: LIGOTimeGPSLike | SupportsFloat,
+) -> tuple[int, int]:
+    """Return a grid step (in seconds) as an exact ratio of nanoseconds.
+
+    Raises
+    ------
+    ValueError
+        if ``step`` isn't positive
+
+    Examples
+    --------
+    >>> step_ratio_ns(1 / 16384)
+    (1000000000, 16384)
+    """
+    numerator, denominator = as_integer_ratio(step)
+    if numerator <= 0:
+        msg = f"step must be positive, not {step!r}"
+        raise ValueError(msg)
+    return numerator * NANOSECONDS_PER_SECOND, denominator
+
+
+def boundary_ns(index: int, numerator: int, denominator: int) -> int:
+    """Return the nanosecond of the grid boundary with the given index.
+
+    Examples
+    --------
+    >>> boundary_ns(3, 1000000000, 16384)
+    183105
+    """
+    return (2 * index * numerator + denominator) // (2 * denominator)
+
+
+def floor_index(nanoseconds: int, numerator: int, denominator: int) -> int:
+    """Return the index of the last grid boundary at or before a time.
+
+    Examples
+    --------
+    >>> floor_index(183105, 1000000000, 16384)
+    3
+    >>> floor_index(183104, 1000000000, 16384)
+    2
+    """
+    return (
+        ((2 * nanoseconds + 1) * denominator - 1)
+        // (2 * numerator)
+    )
+
+
+def ceil_index(nanoseconds: int, numerator: int, denominator: int) -> int:
+    """Return the index of the first grid boundary at or after a time.
+
+    Examples
+    --------
+    >>> ceil_index(183105, 1000000000, 16384)
+    3
+    >>> ceil_index(183106, 1000000000, 16384)
+    4
+    """
+    return -(((1 - 2 * nanoseconds) * denominator) // (2 * numerator))
+
+
+def nearest_index(nanoseconds: int, numerator: int, denominator: int) -> int:
+    """Return the index of the grid boundary nearest to a time.
+
+    Exact ties are rounded to the even index.
+
+    Examples
+    --------
+    >>> nearest_index(30517, 1000000000, 16384)
+    0
+    >>> nearest_index(30518, 1000000000, 16384)
+    1
+    """
+    return round_ratio(nanoseconds * denominator, numerator)
+
+
+# -- double-double ---------------------
+#
+# A double-double is an unevaluated sum ``hi + lo`` of two floats with
+# ``|lo| <= ulp(hi) / 2``, giving about 106 bits of precision.
+
+def ns_to_dd(nanoseconds: int) -> tuple[float, float]:
+    """Return a count of nanoseconds as a double-double number of seconds.
+
+    ``hi`` is the float nearest to the exact time, and ``lo`` is the float
+    nearest to the remainder, so ``hi + lo`` is within ``ulp(lo) / 2`` of
+    the exact time.
+
+    Examples
+    --------
+    >>> ns_to_dd(1400000000123456789)
+    (1400000000.1234567, 7.24625244140625e-08)
+    """
+    # int / int division is correctly rounded
+    hi = nanoseconds / NANOSECONDS_PER_SECOND
+    numerator, denominator = hi.as_integer_ratio()
+    lo = (
+        (nanoseconds * denominator - numerator * NANOSECONDS_PER_SECOND)
+        / (NANOSECONDS_PER_SECOND * denominator)
+    )
+    return hi, lo
+
+
+def dd_to_ns(hi: float, lo: float) -> int:
+    """Return a double-double number of seconds as a count of nanoseconds.
+
+    The exact value of ``hi + lo`` is rounded to the nearest nanosecond.
+
+    Raises
+    ------
+    OverflowError
+        if either part is infinite
+
+    ValueError
+        if either part is NaN
+
+    Examples
+    --------
+    >>> dd_to_ns(1400000000.1234567, 7.24625244140625e-08)
+    1400000000123456789
+    """
+    hi_numerator, hi_denominator = hi.as_integer_ratio()
+    lo_numerator, lo_denominator = lo.as_integer_ratio()
+    # both denominators are powers of two, so the larger is a multiple
+    denominator = max(hi_denominator, lo_denominator)
+    numerator = (
+        hi_numerator * (denominator // hi_denominator)
+        + lo_numerator * (denominator // lo_denominator)
+    )
+    return round_ratio(numerator * NANOSECONDS_PER_SECOND, denominator)
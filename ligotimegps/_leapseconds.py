@@ -0,0 +1,340 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Leap-second tables for exact conversion between GPS and Unix time.
+
+All conversions operate on `int` counts of nanoseconds, so are exact.
+See `ligotimegps.leapseconds` for the public interface.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from itertools import repeat
+from math import inf
+from operator import add
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Iterable,
+        Iterator,
+        Sequence,
+    )
+    from os import PathLike
+
+NANOSECONDS_PER_SECOND = 1000000000
+
+#: Unix time (seconds) of the GPS epoch, 1980-01-06T00:00:00 UTC
+UNIX_GPS_EPOCH = 315964800
+
+_UNIX_GPS_EPOCH_NS = UNIX_GPS_EPOCH * NANOSECONDS_PER_SECOND
+
+#: TAI - UTC (seconds) at the GPS epoch
+TAI_UTC_AT_GPS_EPOCH = 19
+
+#: Unix time (seconds) of the NTP epoch, 1900-01-01T00:00:00 UTC
+_UNIX_NTP_EPOCH = -2208988800
+
+#: (Unix time of the start of the UTC day, TAI - UTC from then on)
+#: for each change in TAI - UTC since integer offsets began in 1972
+_BUILTIN_LEAP_SECONDS = (
+    (63072000, 10),  # 1972-01-01
+    (78796800, 11),  # 1972-07-01
+    (94694400, 12),  # 1973-01-01
+    (126230400, 13),  # 1974-01-01
+    (157766400, 14),  # 1975-01-01
+    (189302400, 15),  # 1976-01-01
+    (220924800, 16),  # 1977-01-01
+    (252460800, 17),  # 1978-01-01
+    (283996800, 18),  # 1979-01-01
+    (315532800, 19),  # 1980-01-01
+    (362793600, 20),  # 1981-07-01
+    (394329600, 21),  # 1982-07-01
+    (425865600, 22),  # 1983-07-01
+    (489024000, 23),  # 1985-07-01
+    (567993600, 24),  # 1988-01-01
+    (631152000, 25),  # 1990-01-01
+    (662688000, 26),  # 1991-01-01
+    (709948800, 27),  # 1992-07-01
+    (741484800, 28),  # 1993-07-01
+    (773020800, 29),  # 1994-07-01
+    (820454400, 30),  # 1996-01-01
+    (867715200, 31),  # 1997-07-01
+    (915148800, 32),  # 1999-01-01
+    (1136073600, 33),  # 2006-01-01
+    (1230768000, 34),  # 2009-01-01
+    (1341100800, 35),  # 2012-07-01
+    (1435708800, 36),  # 2015-07-01
+    (1483228800, 37),  # 2017-01-01
+)
+
+
+class LeapSecondTable:
+    """A table of leap seconds used to convert between GPS and Unix time.
+
+    Unix time counts the seconds since 1970-01-01T00:00:00 UTC excluding
+    leap seconds, so differs from GPS time (plus a constant) by the number
+    of leap seconds since the GPS epoch.
+
+    Parameters
+    ----------
+    leaps : `Iterable` of `tuple`
+        ``(unix_seconds, tai_minus_utc)`` pairs giving the Unix time
+        of the start of the UTC day on which TAI - UTC changes, and its
+        (integer) value from then on, in increasing order of time
+
+    expires : `int`, optional
+        the Unix time (seconds) after which the table is out of date,
+        if known
+
+    Raises
+    ------
+    ValueError
+        if ``leaps`` is empty or not in increasing order of time
+
+    Notes
+    -----
+    Times before the first entry use the offset of the first entry, and
+    times after the last entry (including after ``expires``) use the
+    offset of the last entry.
+
+    A GPS time within an inserted leap second (e.g. ``23:59:60 UTC``)
+    converts to the Unix time of the preceding second (``23:59:59``),
+    which is repeated, so the reverse conversion of such Unix times
+    returns the earlier of the two GPS times.
+    """
+
+    __slots__ = (
+        "_gps",
+        "_leap",
+        "_to_gps",
+        "_to_unix",
+        "_unix",
+        "expires",
+        "leaps",
+    )
+
+    def __init__(
+        self,
+        leaps: Iterable[tuple[int, int]],
+        expires: int | None = None,
+    ) -> None:
+        """Create a new `LeapSecondTable`."""
+        self.leaps = tuple((int(unix), int(tai)) for unix, tai in leaps)
+        self.expires = expires
+        if not self.leaps:
+            msg = "leap-second table must have at least one entry"
+            raise ValueError(msg)
+        if any(
+            b[0] <= a[0]
+            for a, b in zip(self.leaps, self.leaps[1:], strict=False)
+        ):
+            msg = "leap-second table must be in increasing order of time"
+            raise ValueError(msg)
+
+        # Unix time at which each entry starts
+        self._unix = [
+            unix * NANOSECONDS_PER_SECOND
+            for unix, _ in self.leaps
+        ]
+        # leap seconds since the GPS epoch (in nanoseconds) indexed by
+        # bisect_right(self._gps, gps_ns), the first entry is repeated
+        # so that it also applies to earlier times
+        offsets = [
+            (tai - TAI_UTC_AT_GPS_EPOCH) * NANOSECONDS_PER_SECOND
+            for _, tai in self.leaps
+        ]
+        self._leap = [offsets[0], *offsets]
+        # GPS time at which each entry starts, an inserted leap second
+        # already uses the new offset (so repeats the previous Unix second)
+        self._gps = [
+            unix - _UNIX_GPS_EPOCH_NS + min(before, after)
+            for unix, before, after in zip(
+                self._unix,
+                self._leap,
+                offsets,
+                strict=False,
+            )
+        ]
+        # the shifts to add in each direction
+        self._to_unix = [_UNIX_GPS_EPOCH_NS - leap for leap in self._leap]
+        self._to_gps = [-shift for shift in self._to_unix]
+
+    def __repr__(self) -> str:
+        """Return a representation of this `LeapSecondTable`."""
+        last = self.leaps[-1]
+        return (
+            f"<{type(self).__name__}: {len(self.leaps)} entries, "
+            f"TAI-UTC={last[1]} from Unix {last[0]}>"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Return `True` if ``other`` is an identical table."""
+        if not isinstance(other, LeapSecondTable):
+            return NotImplemented
+        return (self.leaps, self.expires) == (other.leaps, other.expires)
+
+    def __hash__(self) -> int:
+        """Return the hash of this table."""
+        return hash((self.leaps, self.expires))
+
+    @classmethod
+    def read(cls, path: str | PathLike[str]) -> LeapSecondTable:
+        """Read a table in the IERS/NIST ``leap-seconds.list`` format.
+
+        Each data line holds the NTP time (seconds since 1900-01-01) at
+        which a value of TAI - UTC starts, followed by that value.
+        Lines starting with ``#`` are comments, except ``#@`` which gives
+        the NTP time at which the file expires.
+
+        Raises
+        ------
+        ValueError
+            if the file cannot be parsed
+        """
+        leaps = []
+        expires = None
+        with Path(path).open(encoding="utf-8") as file:
+            for lineno, line in enumerate(file, start=1):
+                try:
+                    if line.startswith("#@"):
+                        expires = int(line[2:].split()[0]) + _UNIX_NTP_EPOCH
+                        continue
+                    data = line.split("#", 1)[0].split()
+                    if not data:
+                        continue
+                    ntp, tai = map(int, data[:2])
+                except (IndexError, ValueError) as exc:
+                    msg = f"cannot parse line {lineno} of {path}: {line!r}"
+                    raise ValueError(msg) from exc
+                leaps.append((ntp + _UNIX_NTP_EPOCH, tai))
+        return cls(leaps, expires=expires)
+
+    def leap_ns(self, gps_ns: int) -> int:
+        """Return the leap seconds between the GPS epoch and a GPS time.
+
+        The result is in nanoseconds, and is negative before 1980.
+        """
+        return self._leap[bisect_right(self._gps, gps_ns)]
+
+    def gps_to_unix_ns(self, gps_ns: int) -> int:
+        """Convert a GPS time to Unix time, both in nanoseconds."""
+        return gps_ns + self._to_unix[bisect_right(self._gps, gps_ns)]
+
+    def unix_to_gps_ns(self, unix_ns: int) -> int:
+        """Convert a Unix time to GPS time, both in nanoseconds."""
+        return unix_ns + self._to_gps[bisect_right(self._unix, unix_ns)]
+
+    def unix_to_gps_shift(self, unix_ns: int) -> tuple[float, float, int]:
+        """Return the shift from Unix to GPS time valid at ``unix_ns``.
+
+        Returns
+        -------
+        start, end : `int`, `float`
+            the Unix times (nanoseconds) between which the shift applies,
+            including ``start`` but not ``end``, either may be infinite
+
+        shift : `int`
+            the nanoseconds to add to a Unix time to get the GPS time
+        """
+        idx = bisect_right(self._unix, unix_ns)
+        start = self._unix[idx - 1] if idx else -inf
+        end = self._unix[idx] if idx < len(self._unix) else inf
+        return start, end, self._to_gps[idx]
+
+    def gps_to_unix_ns_many(self, gps_ns: Sequence[int]) -> Iterator[int]:
+        """Convert many GPS times to Unix time, both in nanoseconds.
+
+        This is equivalent to ``map(self.gps_to_unix_ns, gps_ns)``, but
+        runs without calling any Python functions.
+        """
+        return _shift_many(gps_ns, self._gps, self._to_unix)
+
+    def unix_to_gps_ns_many(self, unix_ns: Sequence[int]) -> Iterator[int]:
+        """Convert many Unix times to GPS time, both in nanoseconds.
+
+        This is equivalent to ``map(self.unix_to_gps_ns, unix_ns)``, but
+        runs without calling any Python functions.
+        """
+        return _shift_many(unix_ns, self._unix, self._to_gps)
+
+
+def _shift_many(
+    values: Sequence[int],
+    bounds: list[int],
+    shifts: list[int],
+) -> Iterator[int]:
+    """Add ``shifts[bisect_right(bounds, value)]`` to each value."""
+    indices = map(bisect_right, repeat(bounds), values)
+    return map(add, values, map(shifts.__getitem__, indices))
+
+
+#: the leap-second table distributed with this package
+BUILTIN_TABLE = LeapSecondTable(_BUILTIN_LEAP_SECONDS)
+
+#: the table currently used for conversions
+_TABLE = [BUILTIN_TABLE]
+
+#: the ``(start, end, shift)`` from Unix to GPS time of the current table
+#: most recently used by `LIGOTimeGPS.now`, reset by `set_table`
+NOW_SHIFT = [(inf, -inf, 0)]
+
+
+def get_table() -> LeapSecondTable:
+    """Return the leap-second table currently used for conversions."""
+    return _TABLE[0]
+
+
+def set_table(
+    table: LeapSecondTable | str | PathLike[str] | None,
+) -> LeapSecondTable:
+    """Set the leap-second table used for conversions.
+
+    This affects all threads.
+
+    Parameters
+    ----------
+    table : `LeapSecondTable`, `str`, `os.PathLike`, `None`
+        the new table, or the path of a file in the IERS/NIST
+        ``leap-seconds.list`` format to read it from, or `None` to
+        restore the built-in table
+
+    Returns
+    -------
+    previous : `LeapSecondTable`
+        the table used before this call
+
+    Raises
+    ------
+    ValueError
+        if ``table`` is a file that cannot be parsed
+
+    Examples
+    --------
+    >>> previous = set_leap_second_table(
+    ...     "/usr/share/zoneinfo/leap-seconds.list",
+    ... )  # doctest: +SKIP
+    """
+    if table is None:
+        table = BUILTIN_TABLE
+    elif not isinstance(table, LeapSecondTable):
+        table = LeapSecondTable.read(table)
+    previous, _TABLE[0] = _TABLE[0], table
+    NOW_SHIFT[0] = (inf, -inf, 0)
+    return previous
@@ -0,0 +1,297 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Conversion between GPS times and buffers of int64 nanoseconds.
+
+These functions exchange GPS times with anything supporting the buffer
+protocol (e.g. `array.array`, `memoryview`, `numpy.ndarray`, or Arrow
+buffers) as a flat array of signed 64-bit counts of nanoseconds since
+the GPS epoch, without creating a Python object per element.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import (
+    TYPE_CHECKING,
+    Literal,
+    overload,
+)
+
+from .gpsarray import (
+    LIGOTimeGPSArray,
+    _as_ns,
+)
+from .gpsrange import GPSRange
+from .ligotimegps import LIGOTimeGPS
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Iterable,
+        Iterator,
+    )
+    from typing import Self
+
+    from typing_extensions import Buffer
+
+    from .gpsarray import GPSOperand
+
+# struct format characters for a native signed 64-bit integer,
+# optionally prefixed with a byte-order character matching this platform
+_INT64_FORMATS = {"q", "l"} if array("l").itemsize == 8 else {"q"}  # noqa: PLR2004
+_NATIVE_PREFIXES = ("", "@", "=", "<" if sys.byteorder == "little" else ">")
+
+
+def _ns_memoryview(buffer: Buffer) -> memoryview:
+    """Return a read-only, one-dimensional ``'q'`` view of ``buffer``.
+
+    Raises
+    ------
+    TypeError
+        if ``buffer`` doesn't support the buffer protocol, or its items
+        aren't native signed 64-bit integers
+
+    ValueError
+        if ``buffer`` isn't one-dimensional and C-contiguous
+    """
+    view = memoryview(buffer)
+    fmt = view.format
+    if fmt[:1] in "@=<>!":
+        prefix, fmt = fmt[:1], fmt[1:]
+    else:
+        prefix = ""
+    if (
+        view.itemsize != 8  # noqa: PLR2004
+        or fmt not in _INT64_FORMATS
+        or prefix not in _NATIVE_PREFIXES
+    ):
+        msg = (
+            "buffer must contain native signed 64-bit integers, "
+            f"not format {view.format!r}"
+        )
+        raise TypeError(msg)
+    if view.ndim != 1 or not view.c_contiguous:
+        msg = "buffer must be one-dimensional and C-contiguous"
+        raise ValueError(msg)
+    if view.format != "q":
+        view = view.cast("B").cast("q")
+    return view.toreadonly()
+
+
+# -- views -----------------------------
+
+
+class LIGOTimeGPSView:
+    """A read-only sequence of GPS times backed by an external buffer.
+
+    The view shares memory with ``buffer``; no data are copied, and each
+    element is only converted to a `LIGOTimeGPS` when it is accessed.
+    Slicing returns another view of the same memory.
+
+    Parameters
+    ----------
+    buffer : buffer-protocol object
+        a one-dimensional, C-contiguous buffer of native signed 64-bit
+        integer counts of nanoseconds since the GPS epoch,
+        e.g. an `array.array` of type ``'q'`` or an `int64`
+        `numpy.ndarray`
+
+    Notes
+    -----
+    Changes to the underlying buffer are visible through the view.
+
+    Examples
+    --------
+    >>> from array import array
+    >>> view = LIGOTimeGPSView(array("q", [1000000000500000000, -1]))
+    >>> view[0]
+    LIGOTimeGPS(1000000000, 500000000)
+    >>> list(view[1:])
+    [LIGOTimeGPS(-1, 999999999)]
+    """
+
+    __slots__ = ("_ns",)
+
+    _ns: memoryview
+
+    def __init__(self, buffer: Buffer) -> None:
+        """Create a new `LIGOTimeGPSView`."""
+        self._ns = _ns_memoryview(buffer)
+
+    def __len__(self) -> int:
+        """Return the number of times in this view."""
+        return len(self._ns)
+
+    @overload
+    def __getitem__(self, index: int) -> LIGOTimeGPS: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Self: ...
+
+    def __getitem__(self, index: int | slice) -> LIGOTimeGPS | Self:
+        """Return a single `LIGOTimeGPS`, or a view of a slice."""
+        if isinstance(index, slice):
+            new = type(self).__new__(type(self))
+            new._ns = self._ns[index]  # noqa: SLF001
+            return new
+        return LIGOTimeGPS.from_ns(self._ns[index])
+
+    def __iter__(self) -> Iterator[LIGOTimeGPS]:
+        """Iterate over this view, yielding `LIGOTimeGPS` objects."""
+        return map(LIGOTimeGPS.from_ns, self._ns)
+
+    def __repr__(self) -> str:
+        """Return a representation of this `LIGOTimeGPSView`."""
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def ns(self) -> memoryview:
+        """Return the underlying nanoseconds as a read-only `memoryview`.
+
+        Examples
+        --------
+        >>> from array import array
+        >>> LIGOTimeGPSView(array("q", [1, 2])).ns().tolist()
+        [1, 2]
+        """
+        return self._ns
+
+    def to_array(self) -> LIGOTimeGPSArray:
+        """Return a copy of this view as a `LIGOTimeGPSArray`."""
+        return from_ns_array(self._ns)
+
+
+# -- conversions -----------------------
+
+
+@overload
+def to_ns_array(
+    times: (
+        LIGOTimeGPSArray
+        | LIGOTimeGPSView
+        | GPSRange
+        | Iterable[GPSOperand]
+    ),
+    *,
+    copy: Literal[True] = True,
+) -> array[int]: ...
+
+
+@overload
+def to_ns_array(
+    times: (
+        LIGOTimeGPSArray
+        | LIGOTimeGPSView
+        | GPSRange
+        | Iterable[GPSOperand]
+    ),
+    *,
+    copy: bool,
+) -> array[int] | memoryview: ...
+
+
+def to_ns_array(
+    times: (
+        LIGOTimeGPSArray
+        | LIGOTimeGPSView
+        | GPSRange
+        | Iterable[GPSOperand]
+    ),
+    *,
+    copy: bool = True,
+) -> array[int] | memoryview:
+    """Convert GPS times to a buffer of int64 nanoseconds.
+
+    Parameters
+    ----------
+    times : `LIGOTimeGPSArray`, `LIGOTimeGPSView`, `GPSRange`, `Iterable`
+        the times to convert, either as an array, view, or range (which
+        are converted without per-element `LIGOTimeGPS` objects), or any
+        iterable of values accepted by `LIGOTimeGPS`
+
+    copy : `bool`, optional
+        if `False`, and ``times`` is a `LIGOTimeGPSArray` or
+        `LIGOTimeGPSView`, return a read-only `memoryview` sharing its
+        memory instead of a copy
+
+    Returns
+    -------
+    nanoseconds : `array.array`, `memoryview`
+        the counts of nanoseconds since the GPS epoch, with type code
+        ``'q'``; pass to `numpy.frombuffer` (``dtype="int64"``) to get
+        a NumPy array without another copy
+
+    Examples
+    --------
+    >>> to_ns_array([LIGOTimeGPS(1, 5), 2.5])
+    array('q', [1000000005, 2500000000])
+    >>> times = LIGOTimeGPSArray([1, 2])
+    >>> to_ns_array(times, copy=False).tolist()
+    [1000000000, 2000000000]
+    """
+    if isinstance(times, LIGOTimeGPSArray):
+        view = memoryview(times._ns).toreadonly()  # noqa: SLF001
+    elif isinstance(times, LIGOTimeGPSView):
+        view = times.ns()
+    elif isinstance(times, GPSRange):
+        return times.ns()
+    else:
+        return array("q", map(_as_ns, times))
+    if not copy:
+        return view
+    nanoseconds = array("q")
+    nanoseconds.frombytes(view.cast("B"))
+    return nanoseconds
+
+
+def from_ns_array(buffer: Buffer) -> LIGOTimeGPSArray:
+    """Create a `LIGOTimeGPSArray` from a buffer of int64 nanoseconds.
+
+    The data are copied in a single block; to wrap a buffer without
+    copying, use `LIGOTimeGPSView`.
+
+    Parameters
+    ----------
+    buffer : buffer-protocol object
+        a one-dimensional, C-contiguous buffer of native signed 64-bit
+        integer counts of nanoseconds since the GPS epoch,
+        e.g. an `array.array` of type ``'q'`` or an `int64`
+        `numpy.ndarray`
+
+    Returns
+    -------
+    times : `LIGOTimeGPSArray`
+        a new array holding a copy of the data
+
+    Raises
+    ------
+    TypeError
+        if ``buffer`` doesn't support the buffer protocol, or its items
+        aren't native signed 64-bit integers
+
+    ValueError
+        if ``buffer`` isn't one-dimensional and C-contiguous
+
+    Examples
+    --------
+    >>> from array import array
+    >>> from_ns_array(array("q", [1500000000]))[0]
+    LIGOTimeGPS(1, 500000000)
+    """
+    nanoseconds = array("q")
+    nanoseconds.frombytes(_ns_memoryview(buffer).cast("B"))
+    return LIGOTimeGPSArray._from_storage(nanoseconds)  # noqa: SLF001
@@ -0,0 +1,207 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Coincidence of events between streams of GPS times."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import (
+    bisect_left,
+    bisect_right,
+)
+from itertools import (
+    compress,
+    product,
+    repeat,
+)
+from operator import (
+    add,
+    and_,
+    le,
+)
+from typing import TYPE_CHECKING
+
+from .buffer import to_ns_array
+from .gpsarray import _as_ns
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Iterable,
+        Sequence,
+    )
+
+    from .buffer import LIGOTimeGPSView
+    from .gpsarray import (
+        GPSOperand,
+        LIGOTimeGPSArray,
+    )
+    from .gpsrange import GPSRange
+
+    Stream = (
+        LIGOTimeGPSArray
+        | LIGOTimeGPSView
+        | GPSRange
+        | Iterable[GPSOperand]
+    )
+
+
+def _sorted_stream(times: Stream, shift: int) -> tuple[list[int], list[int]]:
+    """Return the sorted (shifted) nanoseconds of a stream, and their order.
+
+    These are returned as lists, rather than arrays, since `bisect` and
+    `sorted` index lists without creating a new `int` for every access.
+    """
+    keys = to_ns_array(times).tolist()
+    if shift:
+        keys = list(map(add, keys, repeat(shift)))
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    return list(map(keys.__getitem__, order)), order
+
+
+def coincidences(
+    *streams: Stream,
+    window: GPSOperand,
+    shifts: Sequence[GPSOperand] | None = None,
+) -> tuple[array[int], ...]:
+    """Find all coincident events between two or more streams of GPS times.
+
+    A coincidence is one event from each stream such that every pair of
+    events is within ``window`` of each other (inclusive), i.e. the
+    latest event is at most ``window`` after the earliest.
+
+    Each stream is sorted once, then each event is taken in turn as the
+    earliest event of a coincidence and the candidates from every other
+    stream are found by binary search, so the cost is
+    ``O(N log N + k)`` for ``N`` total events and ``k`` coincidences,
+    rather than the ``O(n * m)`` of comparing every pair.
+    All comparisons are made on exact integer nanoseconds.
+
+    Parameters
+    ----------
+    *streams : `LIGOTimeGPSArray`, `GPSRange`, or `Iterable` of `LIGOTimeGPS`
+        two or more streams of event times, each in any order
+
+    window : `LIGOTimeGPS`, `int`, `float`, `str`
+        the coincidence window in seconds
+
+    shifts : `Sequence` of `LIGOTimeGPS`, `int`, `float`, `str`, optional
+        the time shift (in seconds) to add to every event of each stream
+        before testing for coincidence, e.g. for time slides,
+        one per stream
+
+    Returns
+    -------
+    indices : `tuple` of `array.array`
+        one array (of type code ``'q'``) per stream, holding the index in
+        that stream of the event in each coincidence, so that
+        coincidence ``i`` is ``tuple(idx[i] for idx in indices)``
+
+    Raises
+    ------
+    ValueError
+        if fewer than two streams are given, ``window`` is negative, or
+        the number of ``shifts`` doesn't match the number of streams
+
+    Examples
+    --------
+    >>> h1 = ["100.005", 200, 300]
+    >>> l1 = [299.995, 100, 250]
+    >>> h1_idx, l1_idx = coincidences(h1, l1, window=0.01)
+    >>> list(zip(h1_idx, l1_idx))
+    [(0, 1), (2, 0)]
+    >>> coincidences(h1, l1, window=0.01, shifts=[0, -50])
+    (array('q', [1]), array('q', [2]))
+    """
+    nstreams = len(streams)
+    if nstreams < 2:  # noqa: PLR2004
+        msg = f"coincidences() requires at least two streams, got {nstreams}"
+        raise ValueError(msg)
+    width = _as_ns(window)
+    if width < 0:
+        msg = f"window must not be negative, not {window!r}"
+        raise ValueError(msg)
+    if shifts is None:
+        offsets = [0] * nstreams
+    elif len(shifts) != nstreams:
+        msg = f"got {len(shifts)} shifts for {nstreams} streams"
+        raise ValueError(msg)
+    else:
+        offsets = list(map(_as_ns, shifts))
+
+    keys, orders = zip(
+        *map(_sorted_stream, streams, offsets),
+        strict=True,
+    )
+    indices = tuple(array("q") for _ in range(nstreams))
+
+    # take each event in turn as the earliest of a coincidence (with ties
+    # broken by stream number), so every coincidence is found exactly once
+    for anchor in range(nstreams):
+        _anchored_coincidences(keys, orders, anchor, width, indices)
+    return indices
+
+
+def _anchored_coincidences(
+    keys: Sequence[list[int]],
+    orders: Sequence[list[int]],
+    anchor: int,
+    width: int,
+    indices: tuple[array[int], ...],
+) -> None:
+    """Append the coincidences whose earliest event is in stream ``anchor``.
+
+    ``keys`` are the sorted nanoseconds of each stream and ``orders`` map
+    sorted positions back to input indices.
+    Events in earlier streams must be strictly after the anchor event,
+    and events in later streams at or after it.
+    """
+    anchor_keys = keys[anchor]
+    if not anchor_keys:
+        return
+    ends = list(map(add, anchor_keys, repeat(width)))
+    # find the first candidate in each other stream for every anchor event
+    # with the bisections run in bulk by map, then keep only the anchors
+    # where every first candidate is before the end of the window
+    starts = []
+    matched: Iterable[bool] = repeat(True)  # noqa: FBT003
+    for other in range(len(keys)):
+        if other == anchor:
+            continue
+        other_keys = keys[other]
+        find_start = bisect_right if other < anchor else bisect_left
+        firsts = list(map(find_start, repeat(other_keys), anchor_keys))
+        # pad with a value beyond every window, so each first is valid
+        padded = [*other_keys, ends[-1] + 1]
+        matched = list(map(
+            and_,
+            matched,
+            map(le, map(padded.__getitem__, firsts), ends),
+        ))
+        starts.append((other_keys, firsts))
+
+    for position in compress(range(len(anchor_keys)), matched):
+        end = ends[position]
+        ranges = [
+            range(first, bisect_right(other_keys, end, first))
+            for other_keys, firsts in starts
+            for first in (firsts[position],)
+        ]
+        ranges.insert(anchor, range(position, position + 1))
+        for match in product(*ranges):
+            for stream, sorted_index in enumerate(match):
+                indices[stream].append(orders[stream][sorted_index])
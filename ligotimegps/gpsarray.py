@@ -0,0 +1,441 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""A vectorised container of GPS times backed by integer nanoseconds.
+
+Bulk operations on a `LIGOTimeGPSArray` are applied with `map` over the
+`int` storage and C-level callables (bound `int` methods and `operator`
+functions), so no Python bytecode runs per element.
+"""
+
+from __future__ import annotations
+
+import operator
+from array import array
+from fractions import Fraction
+from itertools import repeat
+from math import (
+    isinf,
+    isnan,
+)
+from typing import (
+    TYPE_CHECKING,
+    overload,
+)
+
+from .ligotimegps import (
+    HALF_SECOND_IN_NANOSECONDS,
+    LIGOTimeGPS,
+)
+from .protocol import LIGOTimeGPSLike
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Callable,
+        Iterable,
+        Iterator,
+    )
+    from typing import (
+        Self,
+        SupportsFloat,
+    )
+
+    GPSOperand = LIGOTimeGPSLike | SupportsFloat | str | bytes
+
+NANOSECONDS_PER_SECOND = 1000000000
+
+
+def _as_ns(value: GPSOperand) -> int:
+    """Convert a single GPS-like value to a count of nanoseconds.
+
+    `LIGOTimeGPSLike` objects and `int` values are converted directly,
+    everything else is converted using the `LIGOTimeGPS` constructor so that
+    the normalisation rules are identical.
+    """
+    if isinstance(value, LIGOTimeGPS):
+        return value._seconds * NANOSECONDS_PER_SECOND + value._nanoseconds  # noqa: SLF001
+    if isinstance(value, int):
+        return value * NANOSECONDS_PER_SECOND
+    if isinstance(value, LIGOTimeGPSLike):
+        return value.gpsSeconds * NANOSECONDS_PER_SECOND + value.gpsNanoSeconds
+    return LIGOTimeGPS(value).ns()
+
+
+def _compare_ns(value: GPSOperand) -> int | Fraction:
+    """Convert a single GPS-like value to nanoseconds to compare against.
+
+    This matches the comparison rules of `LIGOTimeGPS`: exact rational
+    numbers (e.g. `~fractions.Fraction` or `~decimal.Decimal`) are not
+    truncated to a whole nanosecond, strings are not comparable, and
+    everything else is converted as by `_as_ns`.
+    """
+    if isinstance(value, (str, bytes)):
+        msg = f"cannot compare LIGOTimeGPS with {type(value).__name__!r}"
+        raise TypeError(msg)
+    if isinstance(value, (int, float, LIGOTimeGPS, LIGOTimeGPSLike)):
+        return _as_ns(value)
+    try:
+        num, den = value.as_integer_ratio()  # type: ignore[union-attr]
+    except AttributeError:
+        return _as_ns(value)
+    nanoseconds = Fraction(num * NANOSECONDS_PER_SECOND, den)
+    if nanoseconds.denominator == 1:
+        return nanoseconds.numerator
+    return nanoseconds
+
+
+def _element(ns: int) -> LIGOTimeGPS:
+    """Return a `LIGOTimeGPS` for a count of nanoseconds."""
+    return LIGOTimeGPS.from_ns(ns)
+
+
+class LIGOTimeGPSArray:
+    """A sequence of GPS times stored as 64-bit integer nanoseconds.
+
+    Each element is stored as a single signed count of nanoseconds since the
+    GPS epoch, giving a range of roughly +/- 292 years with exact nanosecond
+    resolution, at 8 bytes per element.
+    Arithmetic and comparisons operate on the whole array at once and
+    follow the same normalisation rules as `LIGOTimeGPS`.
+
+    Indexing a single element returns a `LIGOTimeGPS`, slicing returns a
+    new `LIGOTimeGPSArray`.
+
+    The underlying storage is an `array.array` of type code ``'q'``, which
+    supports the buffer protocol, so can be wrapped by `numpy.frombuffer`
+    (or similar) without copying.
+
+    Parameters
+    ----------
+    times : `Iterable` of `LIGOTimeGPSLike`, `int`, `float`, `str`, `bytes`
+        the times to store
+
+    Examples
+    --------
+    >>> times = LIGOTimeGPSArray([100.5, LIGOTimeGPS(200, 1), "300"])
+    >>> times[1]
+    LIGOTimeGPS(200, 1)
+    >>> (times + 1)[0]
+    LIGOTimeGPS(101, 500000000)
+    >>> times < 250
+    [True, True, False]
+    """
+
+    __slots__ = ("_ns",)
+
+    _ns: array[int]
+
+    def __init__(self, times: Iterable[GPSOperand] = ()) -> None:
+        """Create a new `LIGOTimeGPSArray`."""
+        if isinstance(times, LIGOTimeGPSArray):
+            self._ns = array("q", times._ns)  # noqa: SLF001
+        else:
+            self._ns = array("q", map(_as_ns, times))
+
+    @classmethod
+    def from_ns(cls, nanoseconds: Iterable[int]) -> Self:
+        """Create a new `LIGOTimeGPSArray` from counts of nanoseconds.
+
+        Parameters
+        ----------
+        nanoseconds : `Iterable` of `int`
+            the times as nanoseconds since the GPS epoch
+
+        Returns
+        -------
+        array : `LIGOTimeGPSArray`
+            a new array
+
+        Examples
+        --------
+        >>> LIGOTimeGPSArray.from_ns([1500000000])[0]
+        LIGOTimeGPS(1, 500000000)
+        """
+        return cls._from_storage(array("q", nanoseconds))
+
+    @classmethod
+    def _from_storage(cls, nanoseconds: array[int]) -> Self:
+        """Create a new `LIGOTimeGPSArray` that takes ownership of storage.
+
+        ``nanoseconds`` must be an `array.array` of type ``'q'`` that no
+        other object will modify.
+        """
+        new = cls.__new__(cls)
+        new._ns = nanoseconds  # noqa: SLF001
+        return new
+
+    # -- sequence --------------------
+
+    def __len__(self) -> int:
+        """Return the number of times in this array."""
+        return len(self._ns)
+
+    @overload
+    def __getitem__(self, index: int) -> LIGOTimeGPS: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Self: ...
+
+    def __getitem__(self, index: int | slice) -> LIGOTimeGPS | Self:
+        """Return a single `LIGOTimeGPS`, or a slice of this array."""
+        if isinstance(index, slice):
+            return type(self).from_ns(self._ns[index])
+        return _element(self._ns[index])
+
+    def __iter__(self) -> Iterator[LIGOTimeGPS]:
+        """Iterate over this array, yielding `LIGOTimeGPS` objects."""
+        return map(_element, self._ns)
+
+    def __repr__(self) -> str:
+        """Return a representation of this `LIGOTimeGPSArray`."""
+        return f"{type(self).__name__}({list(self)!r})"
+
+    # -- conversions -----------------
+
+    def seconds(self) -> array[int]:
+        """Return the integer seconds part of each element.
+
+        Examples
+        --------
+        >>> LIGOTimeGPSArray([-0.5]).seconds()
+        array('q', [-1])
+        """
+        return array("q", map(NANOSECONDS_PER_SECOND.__rfloordiv__, self._ns))
+
+    def nanoseconds(self) -> array[int]:
+        """Return the residual nanoseconds part of each element.
+
+        Examples
+        --------
+        >>> LIGOTimeGPSArray([-0.5]).nanoseconds()
+        array('q', [500000000])
+        """
+        return array("q", map(NANOSECONDS_PER_SECOND.__rmod__, self._ns))
+
+    def ns(self) -> array[int]:
+        """Return a copy of this array as counts of nanoseconds.
+
+        Examples
+        --------
+        >>> LIGOTimeGPSArray([100.5]).ns()
+        array('q', [100500000000])
+        """
+        return array("q", self._ns)
+
+    def float(self) -> array[float]:
+        """Return this array as seconds in double precision.
+
+        Each element is identical to ``float(x)`` for the equivalent
+        `LIGOTimeGPS` ``x``.
+
+        Examples
+        --------
+        >>> LIGOTimeGPSArray([100.5]).float()
+        array('d', [100.5])
+        """
+        return array("d", map(
+            operator.add,
+            self.seconds(),
+            map((1e-9).__rmul__, self.nanoseconds()),
+        ))
+
+    # -- comparison ------------------
+
+    def _other_ns(
+        self,
+        other: object,
+        convert: Callable[[GPSOperand], int] = _as_ns,
+    ) -> Iterable[int] | int:
+        """Return the nanoseconds of ``other`` as a scalar or a sequence.
+
+        Each value is converted using ``convert``.
+        """
+        if isinstance(other, LIGOTimeGPSArray):
+            values: Iterable[int] = other._ns  # noqa: SLF001
+        elif isinstance(other, (list, tuple)):
+            values = list(map(convert, other))
+        else:
+            return convert(other)  # type: ignore[arg-type]
+        if len(values) != len(self._ns):  # type: ignore[arg-type]
+            msg = (
+                f"operands could not be broadcast together with lengths "
+                f"{len(self._ns)} and {len(values)}"  # type: ignore[arg-type]
+            )
+            raise ValueError(msg)
+        return values
+
+    def _compare(
+        self,
+        other: object,
+        op: Callable[[int, int], bool],
+    ) -> list[bool] | None:
+        """Compare each element of this array with ``other``.
+
+        Returns `None` if ``other`` is infinite, or cannot be converted.
+        Comparisons with NaN are always `False`.
+        """
+        try:
+            if isinf(other):  # type: ignore[arg-type]
+                return None
+            if isnan(other):  # type: ignore[arg-type]
+                return [False] * len(self._ns)
+        except TypeError:
+            pass
+        try:
+            values = self._other_ns(other, _compare_ns)  # type: ignore[arg-type]
+        except TypeError:
+            return None
+        if isinstance(values, (int, Fraction)):
+            return list(map(op, self._ns, repeat(values)))
+        return list(map(op, self._ns, values))
+
+    def __eq__(self, other: object) -> list[bool]:  # type: ignore[override]
+        """Test element-wise equality."""
+        result = self._compare(other, operator.eq)
+        if result is None:
+            return [False] * len(self._ns)
+        return result
+
+    def __ne__(self, other: object) -> list[bool]:  # type: ignore[override]
+        """Test element-wise inequality."""
+        return list(map(operator.not_, self.__eq__(other)))
+
+    def __lt__(self, other: object) -> list[bool]:
+        """Test element-wise 'less than'."""
+        result = self._compare(other, operator.lt)
+        if result is None:
+            return self._infinite(other, positive=True)
+        return result
+
+    def __le__(self, other: object) -> list[bool]:
+        """Test element-wise 'less than or equal to'."""
+        result = self._compare(other, operator.le)
+        if result is None:
+            return self._infinite(other, positive=True)
+        return result
+
+    def __gt__(self, other: object) -> list[bool]:
+        """Test element-wise 'greater than'."""
+        result = self._compare(other, operator.gt)
+        if result is None:
+            return self._infinite(other, positive=False)
+        return result
+
+    def __ge__(self, other: object) -> list[bool]:
+        """Test element-wise 'greater than or equal to'."""
+        result = self._compare(other, operator.ge)
+        if result is None:
+            return self._infinite(other, positive=False)
+        return result
+
+    def _infinite(self, other: object, *, positive: bool) -> list[bool]:
+        """Return the result of an ordering comparison with infinity.
+
+        Raises `TypeError` if ``other`` is not infinite.
+        """
+        try:
+            inf = isinf(other)  # type: ignore[arg-type]
+        except TypeError:
+            inf = False
+        if not inf:
+            msg = (
+                "comparison not supported between instances of "
+                f"'{type(self).__name__}' and '{type(other).__name__}'"
+            )
+            raise TypeError(msg)
+        truth = (other > 0) is positive  # type: ignore[operator]
+        return [truth] * len(self._ns)
+
+    # arrays compare element-wise, so cannot be hashed
+    __hash__ = None  # type: ignore[assignment]
+
+    # -- arithmetic ------------------
+
+    def _binary(
+        self,
+        other: object,
+        op: Callable[[int, int], int],
+        *,
+        reflected: bool = False,
+    ) -> Self:
+        """Apply a binary operation element-wise.
+
+        If ``reflected`` is `True`, ``other`` is the left-hand operand.
+        """
+        values = self._other_ns(other)
+        if isinstance(values, int):
+            values = repeat(values)
+        if reflected:
+            return type(self).from_ns(map(op, values, self._ns))
+        return type(self).from_ns(map(op, self._ns, values))
+
+    def __add__(self, other: GPSOperand | Iterable[GPSOperand]) -> Self:
+        """Add a value, or a sequence of values, to this array.
+
+        Examples
+        --------
+        >>> LIGOTimeGPSArray([1, 2]) + 0.5
+        LIGOTimeGPSArray([LIGOTimeGPS(1, 500000000), LIGOTimeGPS(2, 500000000)])
+        """
+        return self._binary(other, operator.add)
+
+    # addition is commutative
+    __radd__ = __add__
+
+    def __sub__(self, other: GPSOperand | Iterable[GPSOperand]) -> Self:
+        """Subtract a value, or a sequence of values, from this array.
+
+        Examples
+        --------
+        >>> LIGOTimeGPSArray([1, 2]) - 0.5
+        LIGOTimeGPSArray([LIGOTimeGPS(0, 500000000), LIGOTimeGPS(1, 500000000)])
+        """
+        return self._binary(other, operator.sub)
+
+    def __rsub__(self, other: GPSOperand | Iterable[GPSOperand]) -> Self:
+        """Subtract this array from a value, or a sequence of values."""
+        return self._binary(other, operator.sub, reflected=True)
+
+    def __pos__(self) -> Self:
+        """Return a copy of this array."""
+        return type(self).from_ns(self._ns)
+
+    def __neg__(self) -> Self:
+        """Return the element-wise negation of this array."""
+        return type(self).from_ns(map(operator.neg, self._ns))
+
+    def __abs__(self) -> Self:
+        """Return the element-wise absolute value of this array."""
+        return type(self).from_ns(map(abs, self._ns))
+
+    def __round__(self, n: int = 0) -> Self:
+        """Round each element of this array as `LIGOTimeGPS.__round__` does."""
+        n = int(n)
+        if n == 0:  # round half up to whole seconds
+            return type(self).from_ns(map(
+                NANOSECONDS_PER_SECOND.__mul__,
+                map(
+                    NANOSECONDS_PER_SECOND.__rfloordiv__,
+                    map(HALF_SECOND_IN_NANOSECONDS.__add__, self._ns),
+                ),
+            ))
+        # otherwise round the nanoseconds to n decimal places of seconds
+        return type(self).from_ns(map(
+            operator.add,
+            map(NANOSECONDS_PER_SECOND.__mul__, self.seconds()),
+            map(round, self.nanoseconds(), repeat(n - 9)),
+        ))
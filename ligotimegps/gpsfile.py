@@ -0,0 +1,406 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Streaming reading and writing of files of GPS times.
+
+Three file formats are supported, each storing one time per record:
+
+``"text"``
+    one decimal number of seconds per line, as written by
+    ``str(LIGOTimeGPS)``; blank lines are ignored
+
+``"int64"``
+    little-endian signed 64-bit integer counts of nanoseconds, 8 bytes
+    per record
+
+``"packed"``
+    little-endian signed 64-bit integer seconds followed by unsigned
+    32-bit integer nanoseconds, 12 bytes per record, as written by
+    `pack_many`
+
+`read_times` memory-maps the file and yields the times in chunks, so
+files much larger than the available memory can be processed.
+"""
+
+from __future__ import annotations
+
+import mmap
+import sys
+from array import array
+from bisect import bisect_left
+from itertools import islice
+from pathlib import Path
+from struct import Struct
+from typing import (
+    TYPE_CHECKING,
+    Literal,
+    overload,
+)
+
+from .buffer import (
+    LIGOTimeGPSView,
+    to_ns_array,
+)
+from .gpsarray import LIGOTimeGPSArray
+from .ligotimegps import (
+    _PACKED,
+    NANOSECONDS_PER_SECOND,
+    LIGOTimeGPS,
+)
+from .packing import (
+    pack_many,
+    unpack_many,
+)
+from .parse import parse_ns
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Iterable,
+        Iterator,
+    )
+    from os import PathLike
+
+    from .gpsarray import GPSOperand
+    from .gpsrange import GPSRange
+
+    Format = Literal["text", "int64", "packed"]
+
+#: default number of times in each chunk
+DEFAULT_CHUNK_SIZE = 65536
+
+_INT64 = Struct("<q")
+
+#: size in bytes of each record of the binary formats
+_RECORD_SIZE = {
+    "int64": _INT64.size,
+    "packed": _PACKED.size,
+}
+
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+def _check_format(fmt: str) -> None:
+    """Raise a `ValueError` if ``fmt`` isn't a supported format."""
+    if fmt != "text" and fmt not in _RECORD_SIZE:
+        msg = (
+            f"unsupported format {fmt!r}, "
+            "expected one of 'text', 'int64', 'packed'"
+        )
+        raise ValueError(msg)
+
+
+def _check_chunk_size(chunk_size: int) -> None:
+    """Raise a `ValueError` if ``chunk_size`` isn't positive."""
+    if chunk_size < 1:
+        msg = f"chunk_size must be positive, not {chunk_size}"
+        raise ValueError(msg)
+
+
+# -- reading ---------------------------
+
+
+def _record_ns(data: mmap.mmap, fmt: Format, index: int) -> int:
+    """Return the time of record ``index`` of a binary file in nanoseconds."""
+    if fmt == "int64":
+        return _INT64.unpack_from(data, index * _INT64.size)[0]
+    seconds, nanoseconds = _PACKED.unpack_from(data, index * _PACKED.size)
+    return seconds * NANOSECONDS_PER_SECOND + nanoseconds
+
+
+def _binary_chunks(
+    data: mmap.mmap,
+    fmt: Format,
+    chunk_size: int,
+    start: int | None,
+) -> Iterator[array[int]]:
+    """Yield chunks of nanoseconds from a memory-mapped binary file."""
+    size = _RECORD_SIZE[fmt]
+    nrecords, remainder = divmod(len(data), size)
+    if remainder:
+        msg = (
+            f"file size ({len(data)} bytes) is not a multiple "
+            f"of the {size}-byte {fmt!r} record size"
+        )
+        raise ValueError(msg)
+
+    first = 0
+    if start is not None:
+        first = bisect_left(
+            range(nrecords),
+            start,
+            key=lambda i: _record_ns(data, fmt, i),
+        )
+
+    for offset in range(first * size, nrecords * size, chunk_size * size):
+        block = data[offset:offset + chunk_size * size]
+        if fmt == "packed":
+            yield unpack_many(block, as_array=True).ns()
+            continue
+        nanoseconds = array("q")
+        nanoseconds.frombytes(block)
+        if _BIG_ENDIAN:
+            nanoseconds.byteswap()
+        yield nanoseconds
+
+
+def _text_chunks(
+    data: mmap.mmap,
+    chunk_size: int,
+    start: int | None,
+) -> Iterator[array[int]]:
+    """Yield chunks of nanoseconds from a memory-mapped text file."""
+    lines = iter(data.readline, b"")
+    while block := list(islice(lines, chunk_size)):
+        nanoseconds = array(
+            "q",
+            map(parse_ns, filter(None, map(bytes.strip, block))),
+        )
+        if not nanoseconds:  # only blank lines
+            continue
+        if start is not None:
+            # text files aren't searchable, so skip early records
+            if nanoseconds[-1] < start:
+                continue
+            nanoseconds = array(
+                "q",
+                nanoseconds[bisect_left(nanoseconds, start):],
+            )
+            start = None
+        yield nanoseconds
+
+
+@overload
+def read_times(
+    path: str | PathLike[str],
+    fmt: Format = "text",
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    start: GPSOperand | None = None,
+    as_ns: Literal[False] = False,
+) -> Iterator[list[LIGOTimeGPS]]: ...
+
+
+@overload
+def read_times(
+    path: str | PathLike[str],
+    fmt: Format = "text",
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    start: GPSOperand | None = None,
+    as_ns: Literal[True],
+) -> Iterator[array[int]]: ...
+
+
+def read_times(
+    path: str | PathLike[str],
+    fmt: Format = "text",
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    start: GPSOperand | None = None,
+    as_ns: bool = False,
+) -> Iterator[list[LIGOTimeGPS]] | Iterator[array[int]]:
+    """Read GPS times from a file, in chunks.
+
+    The file is memory-mapped and read one chunk at a time, so memory use
+    is bounded by ``chunk_size`` however large the file is.
+
+    Parameters
+    ----------
+    path : `str`, `os.PathLike`
+        the file to read
+
+    fmt : `str`, optional
+        the file format, one of ``"text"``, ``"int64"``, or ``"packed"``,
+        see `ligotimegps.gpsfile`
+
+    chunk_size : `int`, optional
+        the (maximum) number of times in each chunk; for ``"text"``
+        files this is the number of lines read per chunk, including
+        blank lines
+
+    start : `LIGOTimeGPS`, `int`, `float`, `str`, optional
+        if given, skip all records before the first record at or after
+        this time; the file must be sorted in time.
+        Binary files are searched without reading the earlier records,
+        while text files are read from the start
+
+    as_ns : `bool`, optional
+        if `True` yield each chunk as an `array.array` of int64
+        nanoseconds (type code ``'q'``), otherwise yield a `list` of
+        `LIGOTimeGPS`
+
+    Returns
+    -------
+    chunks : `Iterator` of `list` of `LIGOTimeGPS`, or of `array.array`
+        an iterator over the chunks of times, none of which is empty;
+        the file is opened on the first iteration, and closed once the
+        iterator is exhausted (or closed)
+
+    Raises
+    ------
+    ValueError
+        if ``fmt`` isn't supported, ``chunk_size`` isn't positive, or
+        the size of a binary file isn't a multiple of its record size,
+        or a ``"packed"`` record has invalid nanoseconds
+
+    TypeError
+        if a line of a ``"text"`` file cannot be parsed
+
+    Examples
+    --------
+    >>> import tempfile, os
+    >>> path = os.path.join(tempfile.mkdtemp(), "times.bin")
+    >>> write_times(path, range(5), "int64")
+    5
+    >>> list(read_times(path, "int64", chunk_size=2, start=1, as_ns=True))
+    [array('q', [1000000000, 2000000000]), array('q', [3000000000, 4000000000])]
+    """
+    _check_format(fmt)
+    _check_chunk_size(chunk_size)
+    start_ns = None if start is None else LIGOTimeGPS(start).ns()
+    chunks = _read_chunks(Path(path), fmt, chunk_size, start_ns)
+    if as_ns:
+        return chunks
+    return (list(map(LIGOTimeGPS.from_ns, chunk)) for chunk in chunks)
+
+
+def _read_chunks(
+    path: Path,
+    fmt: Format,
+    chunk_size: int,
+    start: int | None,
+) -> Iterator[array[int]]:
+    """Memory-map a file and yield chunks of nanoseconds from it."""
+    with path.open("rb") as file:
+        if not path.stat().st_size:  # empty files cannot be mapped
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if fmt == "text":
+                yield from _text_chunks(data, chunk_size, start)
+            else:
+                yield from _binary_chunks(data, fmt, chunk_size, start)
+
+
+# -- writing ---------------------------
+
+
+def _ns_chunks(
+    times: (
+        LIGOTimeGPSArray
+        | LIGOTimeGPSView
+        | GPSRange
+        | Iterable[GPSOperand]
+    ),
+    chunk_size: int,
+) -> Iterator[array[int] | memoryview]:
+    """Yield chunks of int64 nanoseconds from ``times``."""
+    if isinstance(times, (LIGOTimeGPSArray, LIGOTimeGPSView)):
+        nanoseconds = to_ns_array(times, copy=False)
+        for i in range(0, len(nanoseconds), chunk_size):
+            yield nanoseconds[i:i + chunk_size]
+        return
+    times = iter(times)
+    while chunk := to_ns_array(islice(times, chunk_size)):
+        yield chunk
+
+
+def _encode(chunk: array[int] | memoryview, fmt: Format) -> bytes:
+    """Encode a chunk of nanoseconds in the given file format."""
+    if fmt == "packed":
+        return pack_many(LIGOTimeGPSView(chunk))
+    if fmt == "int64":
+        if _BIG_ENDIAN:
+            chunk = array("q", chunk)
+            chunk.byteswap()
+        return bytes(chunk)
+    return "".join(
+        f"{LIGOTimeGPS.from_ns(ns)}\n" for ns in chunk
+    ).encode("ascii")
+
+
+def write_times(
+    path: str | PathLike[str],
+    times: (
+        LIGOTimeGPSArray
+        | LIGOTimeGPSView
+        | GPSRange
+        | Iterable[GPSOperand]
+    ),
+    fmt: Format = "text",
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    append: bool = False,
+) -> int:
+    """Write GPS times to a file, in chunks.
+
+    The output can be read back with `read_times`.
+    ``times`` are consumed one chunk at a time, so may be a generator
+    (e.g. the output of `read_times` flattened with
+    `itertools.chain.from_iterable`) producing more times than fit in
+    memory.
+
+    Parameters
+    ----------
+    path : `str`, `os.PathLike`
+        the file to write
+
+    times : `LIGOTimeGPSArray`, `LIGOTimeGPSView`, `GPSRange`, `Iterable`
+        the times to write, any iterable of values accepted by
+        `LIGOTimeGPS`
+
+    fmt : `str`, optional
+        the file format, one of ``"text"``, ``"int64"``, or ``"packed"``,
+        see `ligotimegps.gpsfile`
+
+    chunk_size : `int`, optional
+        the number of times to encode and write at once
+
+    append : `bool`, optional
+        if `True` append to the file, otherwise replace it
+
+    Returns
+    -------
+    count : `int`
+        the number of times written
+
+    Raises
+    ------
+    ValueError
+        if ``fmt`` isn't supported, or ``chunk_size`` isn't positive
+
+    OverflowError
+        if a time cannot be stored in the chosen format
+
+    Examples
+    --------
+    >>> import tempfile, os
+    >>> path = os.path.join(tempfile.mkdtemp(), "times.txt")
+    >>> write_times(path, [1, 2.5, "-0.25"])
+    3
+    >>> print(Path(path).read_text(), end="")
+    1
+    2.5
+    -0.25
+    """
+    _check_format(fmt)
+    _check_chunk_size(chunk_size)
+    count = 0
+    with Path(path).open("ab" if append else "wb") as file:
+        for chunk in _ns_chunks(times, chunk_size):
+            file.write(_encode(chunk, fmt))
+            count += len(chunk)
+    return count
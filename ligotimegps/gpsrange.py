@@ -0,0 +1,315 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""A lazy, exact arithmetic sequence of GPS times."""
+
+from __future__ import annotations
+
+from array import array
+from fractions import Fraction
+from typing import (
+    TYPE_CHECKING,
+    overload,
+)
+
+from ._exact import (
+    NANOSECONDS_PER_SECOND,
+    as_integer_ratio,
+)
+from .gpsarray import (
+    LIGOTimeGPSArray,
+    _as_ns,
+)
+from .ligotimegps import LIGOTimeGPS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import (
+        Self,
+        SupportsFloat,
+    )
+
+    from .gpsarray import GPSOperand
+    from .protocol import LIGOTimeGPSLike
+
+
+class GPSRange:
+    """An immutable sequence of GPS times at a fixed step.
+
+    This is modelled on the built-in `range`: elements are computed on
+    demand, so a `GPSRange` uses constant memory, and `len`, indexing,
+    slicing, ``in``, and `~GPSRange.index` all take constant time.
+
+    Element ``k`` is ``start + k * step`` computed exactly, with ``step``
+    held as a rational number, then rounded to the nearest nanosecond
+    (exact halves round up), so there is no accumulated rounding error
+    however long the range.
+
+    Parameters
+    ----------
+    start : `LIGOTimeGPS`, `int`, `float`, `str`
+        the first time in the range
+
+    stop : `LIGOTimeGPS`, `int`, `float`, `str`
+        the end of the range (exclusive)
+
+    step : `int`, `float`, `fractions.Fraction`, `LIGOTimeGPSLike`, optional
+        the step in seconds, may be negative, but its magnitude must be
+        at least one nanosecond
+
+    Raises
+    ------
+    ValueError
+        if ``step`` is zero, or smaller than one nanosecond
+
+    Examples
+    --------
+    >>> times = GPSRange(1000000000, 1000000001, 1 / 16384)
+    >>> len(times)
+    16384
+    >>> times[1]
+    LIGOTimeGPS(1000000000, 61035)
+    >>> times[-1]
+    LIGOTimeGPS(1000000000, 999938965)
+    >>> LIGOTimeGPS(1000000000, 500000000) in times
+    True
+    >>> times[::4096]
+    GPSRange(LIGOTimeGPS(1000000000, 0), LIGOTimeGPS(1000000001, 0), Fraction(1, 4))
+    """
+
+    __slots__ = (
+        "_denominator",
+        "_length",
+        "_numerator",
+        "_offset",
+    )
+
+    # element k is (_offset + k * _numerator) / _denominator nanoseconds,
+    # rounded half up to an integer
+    _offset: int
+    _numerator: int
+    _denominator: int
+    _length: int
+
+    def __init__(
+        self,
+        start: GPSOperand,
+        stop: GPSOperand,
+        step: LIGOTimeGPSLike | SupportsFloat = 1,
+    ) -> None:
+        """Create a new `GPSRange`."""
+        numerator, denominator = as_integer_ratio(step)
+        if not numerator:
+            msg = "GPSRange() arg 3 must not be zero"
+            raise ValueError(msg)
+        # step in nanoseconds, in lowest terms
+        step_ns = Fraction(numerator * NANOSECONDS_PER_SECOND, denominator)
+        if abs(step_ns) < 1:
+            msg = f"step must be at least one nanosecond, not {step!r}"
+            raise ValueError(msg)
+        self._numerator = step_ns.numerator
+        self._denominator = step_ns.denominator
+        self._offset = _as_ns(start) * self._denominator
+        self._length = self._count(_as_ns(stop))
+
+    @classmethod
+    def _from_parts(
+        cls,
+        offset: int,
+        numerator: int,
+        denominator: int,
+        length: int,
+    ) -> Self:
+        """Create a new `GPSRange` directly from its internal state."""
+        new = object.__new__(cls)
+        new._offset = offset
+        new._numerator = numerator
+        new._denominator = denominator
+        new._length = length
+        return new
+
+    def _count(self, stop: int) -> int:
+        """Return the number of elements before ``stop`` nanoseconds."""
+        offset = self._offset
+        numerator = self._numerator
+        denominator = self._denominator
+        if numerator > 0:
+            # count k >= 0 with element(k) < stop
+            limit = (2 * stop - 1) * denominator - 2 * offset
+            return max(0, -(-limit // (2 * numerator)))
+        # count k >= 0 with element(k) > stop
+        limit = (2 * stop + 1) * denominator - 2 * offset
+        return max(0, limit // (2 * numerator) + 1)
+
+    def _ns(self, index: int) -> int:
+        """Return element ``index`` (not bounds-checked) in nanoseconds."""
+        return (
+            (2 * (self._offset + index * self._numerator) + self._denominator)
+            // (2 * self._denominator)
+        )
+
+    # -- attributes ------------------
+
+    @property
+    def start(self) -> LIGOTimeGPS:
+        """The first time in this range."""
+        return LIGOTimeGPS.from_ns(self._ns(0))
+
+    @property
+    def stop(self) -> LIGOTimeGPS:
+        """The time one step beyond the last element of this range."""
+        return LIGOTimeGPS.from_ns(self._ns(self._length))
+
+    @property
+    def step(self) -> Fraction:
+        """The exact step between elements, in seconds."""
+        return Fraction(
+            self._numerator,
+            self._denominator * NANOSECONDS_PER_SECOND,
+        )
+
+    def __repr__(self) -> str:
+        """Return a representation of this `GPSRange`."""
+        return (
+            f"{type(self).__name__}"
+            f"({self.start!r}, {self.stop!r}, {self.step!r})"
+        )
+
+    # -- sequence --------------------
+
+    def __len__(self) -> int:
+        """Return the number of times in this range."""
+        return self._length
+
+    def __bool__(self) -> bool:
+        """Return `True` if this range is not empty."""
+        return bool(self._length)
+
+    @overload
+    def __getitem__(self, index: int) -> LIGOTimeGPS: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Self: ...
+
+    def __getitem__(self, index: int | slice) -> LIGOTimeGPS | Self:
+        """Return a single `LIGOTimeGPS`, or a `GPSRange` for a slice."""
+        if isinstance(index, slice):
+            indices = range(*index.indices(self._length))
+            return self._from_parts(
+                self._offset + indices.start * self._numerator,
+                self._numerator * indices.step,
+                self._denominator,
+                len(indices),
+            )
+        length = self._length
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            msg = "GPSRange object index out of range"
+            raise IndexError(msg)
+        return LIGOTimeGPS.from_ns(self._ns(index))
+
+    def __iter__(self) -> Iterator[LIGOTimeGPS]:
+        """Iterate over this range, yielding `LIGOTimeGPS` objects."""
+        return map(LIGOTimeGPS.from_ns, self._iter_ns(range(self._length)))
+
+    def __reversed__(self) -> Iterator[LIGOTimeGPS]:
+        """Iterate over this range in reverse order."""
+        return map(
+            LIGOTimeGPS.from_ns,
+            self._iter_ns(range(self._length - 1, -1, -1)),
+        )
+
+    def _iter_ns(self, indices: range) -> Iterator[int]:
+        """Iterate over the nanoseconds of the given elements."""
+        base = 2 * self._offset + self._denominator
+        numerator = 2 * self._numerator
+        denominator = 2 * self._denominator
+        return ((base + k * numerator) // denominator for k in indices)
+
+    def _find(self, value: object) -> int | None:
+        """Return the index of ``value`` in this range, or `None`."""
+        try:
+            ns = _as_ns(value)  # type: ignore[arg-type]
+        except (TypeError, ValueError, OverflowError):
+            return None
+        offset = self._offset
+        numerator = self._numerator
+        denominator = self._denominator
+        if numerator > 0:
+            # the last k with element(k) <= ns
+            index = (
+                ((2 * ns + 1) * denominator - 2 * offset - 1)
+                // (2 * numerator)
+            )
+        else:
+            # the last k with element(k) >= ns
+            index = (
+                ((2 * ns - 1) * denominator - 2 * offset)
+                // (2 * numerator)
+            )
+        if 0 <= index < self._length and self._ns(index) == ns:
+            return index
+        return None
+
+    def __contains__(self, value: object) -> bool:
+        """Return `True` if ``value`` is one of the times in this range."""
+        return self._find(value) is not None
+
+    def index(self, value: GPSOperand) -> int:
+        """Return the index of ``value`` in this range.
+
+        Raises
+        ------
+        ValueError
+            if ``value`` is not in this range
+
+        Examples
+        --------
+        >>> GPSRange(10, 20, 0.5).index(12.5)
+        5
+        """
+        index = self._find(value)
+        if index is None:
+            msg = f"{value!r} is not in {type(self).__name__}"
+            raise ValueError(msg)
+        return index
+
+    def count(self, value: GPSOperand) -> int:
+        """Return the number of occurrences (0 or 1) of ``value``."""
+        return int(self._find(value) is not None)
+
+    # -- conversions -----------------
+
+    def ns(self) -> array[int]:
+        """Return all times in this range as counts of nanoseconds.
+
+        Returns
+        -------
+        nanoseconds : `array.array`
+            the times, with type code ``'q'``
+
+        Examples
+        --------
+        >>> GPSRange(0, 1, 0.25).ns()
+        array('q', [0, 250000000, 500000000, 750000000])
+        """
+        return array("q", self._iter_ns(range(self._length)))
+
+    def to_array(self) -> LIGOTimeGPSArray:
+        """Return all times in this range as a `LIGOTimeGPSArray`."""
+        return LIGOTimeGPSArray._from_storage(self.ns())  # noqa: SLF001
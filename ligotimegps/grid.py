@@ -0,0 +1,276 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Mapping between GPS times and the sample indices of a regular grid."""
+
+from __future__ import annotations
+
+from array import array
+from fractions import Fraction
+from typing import (
+    TYPE_CHECKING,
+    Literal,
+)
+
+from ._exact import (
+    NANOSECONDS_PER_SECOND,
+    as_integer_ratio,
+    boundary_ns,
+    ceil_index,
+    floor_index,
+    nearest_index,
+)
+from .buffer import to_ns_array
+from .gpsarray import (
+    LIGOTimeGPSArray,
+    _as_ns,
+)
+from .ligotimegps import LIGOTimeGPS
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Callable,
+        Iterable,
+    )
+    from typing import SupportsFloat
+
+    from .gpsarray import GPSOperand
+    from .protocol import LIGOTimeGPSLike
+
+    Rounding = Literal["floor", "ceil", "nearest"]
+
+_INDEX_FUNCTIONS: dict[str, Callable[[int, int, int], int]] = {
+    "floor": floor_index,
+    "ceil": ceil_index,
+    "nearest": nearest_index,
+}
+
+
+def _index_function(rounding: str) -> Callable[[int, int, int], int]:
+    """Return the index function for the given rounding mode."""
+    try:
+        return _INDEX_FUNCTIONS[rounding]
+    except KeyError:
+        msg = (
+            f"invalid rounding {rounding!r}, "
+            f"must be one of {', '.join(map(repr, _INDEX_FUNCTIONS))}"
+        )
+        raise ValueError(msg) from None
+
+
+class SampleGrid:
+    """A regular grid of sample times starting at ``t0``.
+
+    Sample ``i`` is at ``t0 + i / rate``, computed exactly and rounded to
+    the nearest nanosecond.
+    The step is stored as an exact rational number of nanoseconds, so
+    mapping between times and indices uses only integer arithmetic,
+    with no accumulated error however far a time is from ``t0``.
+
+    Parameters
+    ----------
+    t0 : `LIGOTimeGPS`, `int`, `float`, `str`
+        the time of sample zero
+
+    rate : `int`, `float`, `fractions.Fraction`
+        the sample rate in Hz, at most 1 GHz
+
+    Raises
+    ------
+    ValueError
+        if ``rate`` isn't positive, or is greater than 1 GHz
+
+    Examples
+    --------
+    >>> grid = SampleGrid(1000000000, 16384)
+    >>> grid.index(LIGOTimeGPS(1000000001, 123456789))
+    18406
+    >>> grid.time(18406)
+    LIGOTimeGPS(1000000001, 123413086)
+    >>> grid.index("1000000001.123456789", rounding="nearest")
+    18407
+    """
+
+    __slots__ = ("_denominator", "_numerator", "_t0_ns", "rate", "t0")
+
+    def __init__(
+        self,
+        t0: LIGOTimeGPSLike | SupportsFloat | str | bytes,
+        rate: SupportsFloat,
+    ) -> None:
+        """Create a new `SampleGrid`."""
+        self.t0 = LIGOTimeGPS(t0)
+        self.rate = rate
+        rate_numerator, rate_denominator = as_integer_ratio(rate)
+        if rate_numerator <= 0:
+            msg = f"rate must be positive, not {rate!r}"
+            raise ValueError(msg)
+        # step = 1 / rate seconds = numerator / denominator nanoseconds
+        numerator = rate_denominator * NANOSECONDS_PER_SECOND
+        if numerator < rate_numerator:
+            msg = f"rate must be at most 1 GHz, not {rate!r}"
+            raise ValueError(msg)
+        step = Fraction(numerator, rate_numerator)
+        self._numerator = step.numerator
+        self._denominator = step.denominator
+        self._t0_ns = self.t0.ns()
+
+    def __repr__(self) -> str:
+        """Return a representation of this `SampleGrid`."""
+        return f"{type(self).__name__}({self.t0!r}, {self.rate!r})"
+
+    @property
+    def step(self) -> Fraction:
+        """The exact sample spacing in seconds.
+
+        Examples
+        --------
+        >>> SampleGrid(0, 16384).step
+        Fraction(1, 16384)
+        """
+        return Fraction(self._numerator, self._denominator * NANOSECONDS_PER_SECOND)
+
+    # -- scalar ----------------------
+
+    def index(
+        self,
+        time: GPSOperand,
+        rounding: Rounding = "floor",
+    ) -> int:
+        """Return the index of the sample at (or nearest to) a time.
+
+        Parameters
+        ----------
+        time : `LIGOTimeGPS`, `int`, `float`, `str`
+            the time to map
+
+        rounding : `str`, optional
+            how to choose a sample when ``time`` isn't exactly on the grid,
+            one of ``"floor"`` (the last sample at or before ``time``),
+            ``"ceil"`` (the first sample at or after ``time``), or
+            ``"nearest"`` (ties go to the even index)
+
+        Returns
+        -------
+        index : `int`
+            the sample index, negative for times before ``t0``
+
+        Raises
+        ------
+        ValueError
+            if ``rounding`` isn't a valid mode
+        """
+        return _index_function(rounding)(
+            _as_ns(time) - self._t0_ns,
+            self._numerator,
+            self._denominator,
+        )
+
+    def time(self, index: int) -> LIGOTimeGPS:
+        """Return the time of the sample with the given index.
+
+        Parameters
+        ----------
+        index : `int`
+            the sample index
+
+        Returns
+        -------
+        time : `LIGOTimeGPS`
+            the time of the sample, rounded to the nearest nanosecond
+        """
+        return LIGOTimeGPS.from_ns(self._t0_ns + boundary_ns(
+            index,
+            self._numerator,
+            self._denominator,
+        ))
+
+    def snap(
+        self,
+        time: GPSOperand,
+        rounding: Rounding = "floor",
+    ) -> LIGOTimeGPS:
+        """Return the time of the sample selected by `SampleGrid.index`.
+
+        Examples
+        --------
+        >>> SampleGrid(0.5, 4).snap(LIGOTimeGPS(10, 400000000), "ceil")
+        LIGOTimeGPS(10, 500000000)
+        """
+        return self.time(self.index(time, rounding=rounding))
+
+    # -- bulk ------------------------
+
+    def indices(
+        self,
+        times: LIGOTimeGPSArray | Iterable[GPSOperand],
+        rounding: Rounding = "floor",
+    ) -> array[int]:
+        """Return the sample index for each of many times.
+
+        Parameters
+        ----------
+        times : `LIGOTimeGPSArray`, `Iterable`
+            the times to map
+
+        rounding : `str`, optional
+            the rounding mode, see `SampleGrid.index`
+
+        Returns
+        -------
+        indices : `array.array`
+            the sample indices, with type code ``'q'``
+
+        Examples
+        --------
+        >>> SampleGrid(0, 4).indices(LIGOTimeGPSArray([0, 0.3, 1]))
+        array('q', [0, 1, 4])
+        """
+        index = _index_function(rounding)
+        t0_ns = self._t0_ns
+        numerator = self._numerator
+        denominator = self._denominator
+        return array("q", [
+            index(ns - t0_ns, numerator, denominator)
+            for ns in to_ns_array(times, copy=False)
+        ])
+
+    def times(self, indices: Iterable[int]) -> LIGOTimeGPSArray:
+        """Return the sample times for each of many indices.
+
+        Parameters
+        ----------
+        indices : `Iterable` of `int`
+            the sample indices, e.g. a `range`
+
+        Returns
+        -------
+        times : `LIGOTimeGPSArray`
+            the times of each sample
+
+        Examples
+        --------
+        >>> list(SampleGrid(10, 4).times(range(3)))
+        [LIGOTimeGPS(10, 0), LIGOTimeGPS(10, 250000000), LIGOTimeGPS(10, 500000000)]
+        """
+        t0_ns = self._t0_ns
+        numerator = self._numerator
+        denominator = self._denominator
+        return LIGOTimeGPSArray._from_storage(array("q", [  # noqa: SLF001
+            t0_ns + boundary_ns(index, numerator, denominator)
+            for index in indices
+        ]))
@@ -0,0 +1,313 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""A sorted index of GPS times for fast range and nearest-neighbour queries."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import (
+    bisect_left,
+    bisect_right,
+)
+from typing import TYPE_CHECKING
+
+from .buffer import to_ns_array
+from .gpsarray import (
+    LIGOTimeGPSArray,
+    _as_ns,
+)
+from .ligotimegps import LIGOTimeGPS
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Iterable,
+        Iterator,
+    )
+    from typing import Self
+
+    from .buffer import LIGOTimeGPSView
+    from .gpsarray import GPSOperand
+    from .gpsrange import GPSRange
+
+
+class GPSIndex:
+    """A sorted index of GPS times, each carrying an integer row ID.
+
+    Times are stored as sorted 64-bit integer nanoseconds (as returned by
+    `LIGOTimeGPS.ns`), alongside the row ID of each time, so that range,
+    count, and nearest-neighbour queries are binary searches over plain
+    integers, without creating or comparing `LIGOTimeGPS` objects.
+
+    Times that are equal keep the order in which they were added.
+
+    Parameters
+    ----------
+    times : `Iterable` of `LIGOTimeGPS`, `int`, `float`, `str`
+        the times to index, in any order; a `LIGOTimeGPSArray`,
+        `LIGOTimeGPSView`, or `GPSRange` is converted in bulk
+
+    rows : `Iterable` of `int`, optional
+        the row ID of each time, e.g. the index into a table of events,
+        defaults to the position of each time in ``times``
+
+    Raises
+    ------
+    ValueError
+        if ``rows`` is given with a different length from ``times``
+
+    Examples
+    --------
+    >>> index = GPSIndex([30, 10.5, 20, 10])
+    >>> index.range(10, 20)
+    array('q', [3, 1])
+    >>> index.count_between(10, 30)
+    3
+    >>> index.nearest(19)
+    (LIGOTimeGPS(20, 0), 2)
+    """
+
+    __slots__ = ("_keys", "_rows")
+
+    _keys: array[int]
+    _rows: array[int]
+
+    def __init__(
+        self,
+        times: (
+            LIGOTimeGPSArray
+            | LIGOTimeGPSView
+            | GPSRange
+            | Iterable[GPSOperand]
+        ) = (),
+        rows: Iterable[int] | None = None,
+    ) -> None:
+        """Create a new `GPSIndex`."""
+        keys = to_ns_array(times)
+        if rows is None:
+            rows = range(len(keys))
+        else:
+            rows = array("q", rows)
+            if len(rows) != len(keys):
+                msg = (
+                    f"rows has length {len(rows)}, "
+                    f"but times has length {len(keys)}"
+                )
+                raise ValueError(msg)
+        # stable sort of positions by key, then reorder both in bulk
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._keys = array("q", map(keys.__getitem__, order))
+        self._rows = array("q", map(rows.__getitem__, order))
+
+    @classmethod
+    def from_ns(
+        cls,
+        nanoseconds: Iterable[int],
+        rows: Iterable[int] | None = None,
+    ) -> Self:
+        """Create a new `GPSIndex` from counts of nanoseconds.
+
+        Parameters
+        ----------
+        nanoseconds : `Iterable` of `int`
+            the times as nanoseconds since the GPS epoch, in any order
+
+        rows : `Iterable` of `int`, optional
+            the row ID of each time, defaults to its position
+
+        Returns
+        -------
+        index : `GPSIndex`
+            a new index
+
+        Examples
+        --------
+        >>> GPSIndex.from_ns([2000000000, 1000000000]).times()[0]
+        LIGOTimeGPS(1, 0)
+        """
+        return cls(
+            LIGOTimeGPSArray._from_storage(array("q", nanoseconds)),  # noqa: SLF001
+            rows,
+        )
+
+    # -- sequence --------------------
+
+    def __len__(self) -> int:
+        """Return the number of times in this index."""
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[tuple[LIGOTimeGPS, int]]:
+        """Iterate over ``(time, row)`` pairs in time order."""
+        return zip(
+            map(LIGOTimeGPS.from_ns, self._keys),
+            self._rows,
+            strict=True,
+        )
+
+    def __repr__(self) -> str:
+        """Return a representation of this `GPSIndex`."""
+        return f"<{type(self).__name__}: {len(self)} times>"
+
+    def __contains__(self, time: object) -> bool:
+        """Return `True` if ``time`` is in this index."""
+        try:
+            ns = _as_ns(time)  # type: ignore[arg-type]
+        except (TypeError, ValueError, OverflowError):
+            return False
+        keys = self._keys
+        index = bisect_left(keys, ns)
+        return index < len(keys) and keys[index] == ns
+
+    def times(self) -> LIGOTimeGPSArray:
+        """Return all times in this index, in sorted order."""
+        return LIGOTimeGPSArray._from_storage(array("q", self._keys))  # noqa: SLF001
+
+    def rows(self) -> array[int]:
+        """Return the row IDs of all times in this index, in time order."""
+        return array("q", self._rows)
+
+    # -- modification ----------------
+
+    def insert(self, time: GPSOperand, row: int | None = None) -> None:
+        """Insert a new time into this index.
+
+        Each insertion is a binary search plus a single block move of
+        the stored arrays, so to add many times at once it is faster to
+        build a new index.
+
+        Parameters
+        ----------
+        time : `LIGOTimeGPS`, `int`, `float`, `str`
+            the time to insert
+
+        row : `int`, optional
+            the row ID of the new time, defaults to one more than the
+            largest row ID in this index (or ``0`` if it is empty), so
+            that it never collides with an existing row ID
+
+        Examples
+        --------
+        >>> index = GPSIndex([10, 30])
+        >>> index.insert(20)
+        >>> index.range(15, 25)
+        array('q', [2])
+        """
+        ns = _as_ns(time)
+        if row is None:
+            row = max(self._rows, default=-1) + 1
+        position = bisect_right(self._keys, ns)
+        self._keys.insert(position, ns)
+        self._rows.insert(position, row)
+
+    # -- queries ---------------------
+
+    def _slice(
+        self,
+        start: GPSOperand | None,
+        stop: GPSOperand | None,
+    ) -> tuple[int, int]:
+        """Return the positions of the times in ``[start, stop)``."""
+        keys = self._keys
+        first = 0 if start is None else bisect_left(keys, _as_ns(start))
+        last = len(keys) if stop is None else bisect_left(keys, _as_ns(stop))
+        return first, max(first, last)
+
+    def range(
+        self,
+        start: GPSOperand | None = None,
+        stop: GPSOperand | None = None,
+    ) -> array[int]:
+        """Return the row IDs of the times in ``[start, stop)``.
+
+        Parameters
+        ----------
+        start : `LIGOTimeGPS`, `int`, `float`, `str`, optional
+            the start of the range (inclusive), default is unbounded
+
+        stop : `LIGOTimeGPS`, `int`, `float`, `str`, optional
+            the end of the range (exclusive), default is unbounded
+
+        Returns
+        -------
+        rows : `array.array`
+            the row IDs, in time order, with type code ``'q'``
+
+        Examples
+        --------
+        >>> GPSIndex([5, 1, 3], rows=[50, 10, 30]).range(2)
+        array('q', [30, 50])
+        """
+        first, last = self._slice(start, stop)
+        return self._rows[first:last]
+
+    def range_times(
+        self,
+        start: GPSOperand | None = None,
+        stop: GPSOperand | None = None,
+    ) -> LIGOTimeGPSArray:
+        """Return the times in ``[start, stop)``, in sorted order.
+
+        Examples
+        --------
+        >>> list(GPSIndex([5, 1, 3]).range_times(2, 5))
+        [LIGOTimeGPS(3, 0)]
+        """
+        first, last = self._slice(start, stop)
+        return LIGOTimeGPSArray._from_storage(self._keys[first:last])  # noqa: SLF001
+
+    def count_between(
+        self,
+        start: GPSOperand | None = None,
+        stop: GPSOperand | None = None,
+    ) -> int:
+        """Return the number of times in ``[start, stop)``.
+
+        Examples
+        --------
+        >>> GPSIndex([5, 1, 3]).count_between(1, 5)
+        2
+        """
+        first, last = self._slice(start, stop)
+        return last - first
+
+    def nearest(self, time: GPSOperand) -> tuple[LIGOTimeGPS, int]:
+        """Return the time in this index nearest to ``time``, and its row ID.
+
+        If two times are equally near, the earlier one is returned.
+
+        Raises
+        ------
+        ValueError
+            if this index is empty
+
+        Examples
+        --------
+        >>> GPSIndex([10, 20]).nearest(15)
+        (LIGOTimeGPS(10, 0), 0)
+        """
+        keys = self._keys
+        if not keys:
+            msg = "nearest() of an empty GPSIndex"
+            raise ValueError(msg)
+        ns = _as_ns(time)
+        position = bisect_left(keys, ns)
+        if position == len(keys) or (
+            position
+            and ns - keys[position - 1] <= keys[position] - ns
+        ):
+            position -= 1
+        return LIGOTimeGPS.from_ns(keys[position]), self._rows[position]
@@ -0,0 +1,131 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Interning of `LIGOTimeGPS` objects built from repeated inputs."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from functools import _CacheInfo
+
+T = TypeVar("T")
+
+#: default maximum number of entries in an `InternCache`
+DEFAULT_MAXSIZE = 4096
+
+
+class InternCache(Generic[T]):
+    """A thread-safe, size-bounded LRU cache of objects keyed by input.
+
+    Calling the cache with a value returns the object previously created
+    for an identical input (same type and value), or calls ``factory``
+    to create one.
+    When the cache is full the least-recently-used entry is discarded.
+
+    This is a thin wrapper around `functools.lru_cache`, whose C
+    implementation keeps cache hits cheap.
+    Unhashable inputs bypass the cache, and exceptions raised by
+    ``factory`` are propagated without caching anything.
+
+    Parameters
+    ----------
+    factory : `callable`
+        the function used to create an object from a new input,
+        normally a `LIGOTimeGPS` type
+
+    maxsize : `int`, `None`, optional
+        the maximum number of entries to store, `None` for no limit,
+        or ``0`` to disable caching
+
+    Notes
+    -----
+    Cached objects are shared between all callers, so must be treated
+    as immutable.
+
+    Examples
+    --------
+    >>> from ligotimegps import LIGOTimeGPS
+    >>> cache = InternCache(LIGOTimeGPS, maxsize=2)
+    >>> cache("1000000000.5") is cache("1000000000.5")
+    True
+    >>> cache.cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[Any], T],
+        maxsize: int | None = DEFAULT_MAXSIZE,
+    ) -> None:
+        """Create a new `InternCache`."""
+        self.factory = factory
+        self.maxsize = maxsize
+
+    @property
+    def maxsize(self) -> int | None:
+        """The maximum number of entries, or `None` for no limit.
+
+        Setting this clears the cache and its statistics.
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int | None) -> None:
+        if maxsize is not None and maxsize < 0:
+            msg = f"maxsize must be non-negative or None, not {maxsize}"
+            raise ValueError(msg)
+        self._maxsize = maxsize
+        self._cached = lru_cache(maxsize=maxsize, typed=True)(self.factory)
+
+    def __call__(self, value: Any) -> T:  # noqa: ANN401
+        """Return the (shared) object for ``value``."""
+        try:
+            return self._cached(value)
+        except TypeError:
+            try:
+                hash(value)
+            except TypeError:  # unhashable, so bypass the cache
+                return self.factory(value)
+            raise
+
+    def __len__(self) -> int:
+        """Return the number of entries in the cache."""
+        return self._cached.cache_info().currsize
+
+    def cache_info(self) -> _CacheInfo:
+        """Return the hit/miss statistics for this cache.
+
+        Returns
+        -------
+        info : `tuple`
+            a named tuple of ``(hits, misses, maxsize, currsize)``,
+            as for `functools.lru_cache`
+        """
+        return self._cached.cache_info()
+
+    def cache_clear(self) -> None:
+        """Discard all entries and reset the statistics."""
+        self._cached.cache_clear()
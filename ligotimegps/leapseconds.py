@@ -0,0 +1,134 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Exact conversion between GPS time and UTC (Unix) time.
+
+GPS time runs continuously, while UTC (and so Unix time) skips or
+repeats a second at each leap second.
+Conversions use a table of leap seconds distributed with this package,
+so work offline, and are exact to the nanosecond.
+
+The built-in table includes every leap second up to 2017-01-01.
+To use a newer table, for example the ``leap-seconds.list`` file
+distributed by the IERS and by most operating systems, pass its path to
+`set_leap_second_table`.
+
+Use the `LIGOTimeGPS` methods ``to_unix``, ``from_unix``,
+``to_datetime``, and ``from_datetime`` to convert single times, or
+`gps_to_unix_ns` and `unix_to_gps_ns` to convert buffers of int64
+nanoseconds.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+from ._leapseconds import (
+    BUILTIN_TABLE,
+    UNIX_GPS_EPOCH,
+    LeapSecondTable,
+    get_table as get_leap_second_table,
+    set_table as set_leap_second_table,
+)
+from .buffer import _ns_memoryview
+
+if TYPE_CHECKING:
+    from typing_extensions import Buffer
+
+__all__ = [
+    "BUILTIN_TABLE",
+    "UNIX_GPS_EPOCH",
+    "LeapSecondTable",
+    "get_leap_second_table",
+    "gps_to_unix_ns",
+    "set_leap_second_table",
+    "unix_to_gps_ns",
+]
+
+
+def gps_to_unix_ns(buffer: Buffer) -> array[int]:
+    """Convert a buffer of GPS nanoseconds to Unix nanoseconds.
+
+    Parameters
+    ----------
+    buffer : buffer-protocol object
+        a one-dimensional, C-contiguous buffer of native signed 64-bit
+        integer counts of nanoseconds since the GPS epoch,
+        e.g. an `array.array` of type ``'q'`` or an `int64`
+        `numpy.ndarray`
+
+    Returns
+    -------
+    unix : `array.array`
+        the counts of nanoseconds since the Unix epoch, with type code
+        ``'q'``
+
+    Raises
+    ------
+    TypeError
+        if ``buffer`` doesn't support the buffer protocol, or its items
+        aren't native signed 64-bit integers
+
+    ValueError
+        if ``buffer`` isn't one-dimensional and C-contiguous
+
+    Examples
+    --------
+    >>> from array import array
+    >>> gps_to_unix_ns(array("q", [0, 1400000000000000005]))
+    array('q', [315964800000000000, 1715964782000000005])
+    """
+    table = get_leap_second_table()
+    return array("q", table.gps_to_unix_ns_many(_ns_memoryview(buffer)))
+
+
+def unix_to_gps_ns(buffer: Buffer) -> array[int]:
+    """Convert a buffer of Unix nanoseconds to GPS nanoseconds.
+
+    This is the inverse of `gps_to_unix_ns`, except that a Unix time
+    within a repeated second converts to the first occurrence.
+
+    Parameters
+    ----------
+    buffer : buffer-protocol object
+        a one-dimensional, C-contiguous buffer of native signed 64-bit
+        integer counts of nanoseconds since the Unix epoch
+
+    Returns
+    -------
+    gps : `array.array`
+        the counts of nanoseconds since the GPS epoch, with type code
+        ``'q'``
+
+    Raises
+    ------
+    TypeError
+        if ``buffer`` doesn't support the buffer protocol, or its items
+        aren't native signed 64-bit integers
+
+    ValueError
+        if ``buffer`` isn't one-dimensional and C-contiguous
+
+    Examples
+    --------
+    >>> from array import array
+    >>> unix_to_gps_ns(array("q", [1715964782000000005]))
+    array('q', [1400000000000000005])
+    """
+    table = get_leap_second_table()
+    return array("q", table.unix_to_gps_ns_many(_ns_memoryview(buffer)))
@@ -20,28 +20,81 @@
 
 from __future__ import annotations
 
-from decimal import Decimal
-from functools import total_ordering
+from datetime import (
+    UTC,
+    datetime,
+    timedelta,
+)
+from fractions import Fraction
+from functools import partial
 from math import (
     isinf,
     log2,
     modf,
 )
-from typing import TYPE_CHECKING
+from operator import (
+    attrgetter,
+    index,
+)
+from struct import (
+    Struct,
+    error as struct_error,
+)
+from sys import hash_info
+from time import time_ns
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
 
+from ._exact import (
+    as_integer_ratio,
+    boundary_ns,
+    ceil_index,
+    dd_to_ns,
+    divide_ns,
+    floor_index,
+    mod_ns,
+    nearest_index,
+    ns_to_dd,
+    step_ratio_ns,
+)
+from ._leapseconds import (
+    NOW_SHIFT,
+    get_table as get_leap_second_table,
+)
+from .intern import InternCache
+from .parse import parse_ns
 from .protocol import LIGOTimeGPSLike
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import (
         Self,
         SupportsFloat,
     )
 
-HALF_NANOSECOND = 0.5e-9
+    Converter = Callable[[Any], tuple[int, float]]
+
 HALF_SECOND_IN_NANOSECONDS = 500000000
+NANOSECONDS_PER_SECOND = 1000000000
+
+# modular inverse of 1e9 used to hash a time as the exact rational
+# ``nanoseconds / 1e9``, following the scheme used by the numeric types
+_HASH_MODULUS = hash_info.modulus
+_HASH_INVERSE_NS = pow(1000000000, -1, _HASH_MODULUS)
+
+# cache of the hash term of each nanoseconds value, bounded in size
+_HASH_NS_CACHE: dict[int, int] = {}
+_HASH_NS_CACHE_SIZE = 65536
+
+# binary layout: little-endian int64 seconds, uint32 nanoseconds
+_PACKED = Struct("<qI")
+
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
 
 
-@total_ordering
 class LIGOTimeGPS:
     """An object for storing times with nanosecond resolution.
 
@@ -77,13 +130,18 @@ class LIGOTimeGPS:
     >>> LIGOTimeGPS("0.0000000012")
     LIGOTimeGPS(0, 1)
     >>> LIGOTimeGPS("0.0000000018")
-    LIGOTimeGPS(0, 2)
+    LIGOTimeGPS(0, 1)
     >>> LIGOTimeGPS("-0.8")
     LIGOTimeGPS(-1, 200000000)
     >>> LIGOTimeGPS("-1.2")
     LIGOTimeGPS(-2, 800000000)
     """
 
+    __slots__ = ("_nanoseconds", "_seconds")
+
+    _seconds: int
+    _nanoseconds: int
+
     @staticmethod
     def _from_float(seconds: SupportsFloat) -> tuple[int, float]:
         """Convert a float to (seconds_int, nanoseconds_float).
@@ -104,8 +162,30 @@ class LIGOTimeGPS:
         return int(sec), ns * 1e9
 
     @staticmethod
-    def _from_str_or_bytes(seconds: str | bytes) -> tuple[int, float]:
-        """Convert a string or bytes to (seconds_int, nanoseconds_float).
+    def _float_parts(seconds: float) -> tuple[int, int]:
+        """Convert a float to normalised (seconds_int, nanoseconds_int).
+
+        This gives the same parts as ``LIGOTimeGPS(seconds)``.
+
+        Parameters
+        ----------
+        seconds : float
+            The time in seconds as a float.
+
+        Returns
+        -------
+        seconds_int : int
+            The integer seconds part.
+        nanoseconds_int : int
+            The nanoseconds part, in the range ``[0, 1000000000)``.
+        """
+        ns, sec = modf(seconds)
+        ns *= 1e9
+        return int(sec) + int(ns // 1000000000), int(ns % 1000000000)
+
+    @staticmethod
+    def _from_str_or_bytes(seconds: str | bytes) -> tuple[int, int]:
+        """Convert a string or bytes to (seconds_int, nanoseconds_int).
 
         Parameters
         ----------
@@ -116,33 +196,15 @@ class LIGOTimeGPS:
         -------
         seconds_int : int
             The integer seconds part.
-        nanoseconds_float : float
-            The nanoseconds part as a float.
+        nanoseconds_int : int
+            The nanoseconds part.
 
         Raises
         ------
         TypeError
             If the string cannot be parsed as a decimal number.
         """
-        try:
-            seconds_str = str(
-                Decimal(
-                    seconds.decode() if isinstance(seconds, bytes) else seconds,
-                ),
-            )
-        except ArithmeticError as exc:
-            msg = f"invalid literal for LIGOTimeGPS: {seconds!r}"
-            raise TypeError(msg) from exc
-
-        sign = -1 if seconds_str.startswith("-") else +1
-        if "." in seconds_str:
-            sec_str, ns_str = seconds_str.split(".")
-            ns_val = sign * int(ns_str.ljust(9, "0")[:9])
-        else:
-            sec_str = seconds_str
-            ns_val = 0
-
-        return int(sec_str), float(ns_val)
+        return divmod(parse_ns(seconds), 1000000000)
 
     @staticmethod
     def _from_lal_ligotimegps(seconds: LIGOTimeGPSLike) -> tuple[int, float]:
@@ -165,48 +227,524 @@ class LIGOTimeGPS:
             seconds.gpsNanoSeconds,
         )
 
+    @staticmethod
+    def _from_int(seconds: int) -> tuple[int, int]:
+        """Convert an int to (seconds_int, nanoseconds_int).
+
+        Parameters
+        ----------
+        seconds : int
+            The time in seconds as an int.
+
+        Returns
+        -------
+        seconds_int : int
+            The integer seconds part.
+        nanoseconds_int : int
+            The nanoseconds part (always zero).
+        """
+        return seconds, 0
+
+    @staticmethod
+    def _from_ligotimegps(seconds: LIGOTimeGPS) -> tuple[int, int]:
+        """Convert a `LIGOTimeGPS` to (seconds_int, nanoseconds_int).
+
+        This reads the underlying slots directly, bypassing the properties.
+
+        Parameters
+        ----------
+        seconds : `LIGOTimeGPS`
+            The time to copy.
+
+        Returns
+        -------
+        seconds_int : int
+            The integer seconds part.
+        nanoseconds_int : int
+            The nanoseconds part.
+        """
+        return seconds._seconds, seconds._nanoseconds
+
     def __init__(
         self,
         seconds: LIGOTimeGPSLike | SupportsFloat | str | bytes = 0,
         nanoseconds: float = 0,
     ) -> None:
         """Create a LIGOTimeGPS instance."""
-        nanoseconds_value = float(nanoseconds)
-
-        seconds_int: int
-        if isinstance(seconds, LIGOTimeGPSLike):
-            sec_int, ns_float = self._from_lal_ligotimegps(seconds)
-            seconds_int = sec_int
-            nanoseconds_value += ns_float
-        elif isinstance(seconds, int):
-            seconds_int = seconds
-        elif isinstance(seconds, float):
-            sec_int, ns_float = self._from_float(seconds)
-            seconds_int = sec_int
-            nanoseconds_value += ns_float
-        elif isinstance(seconds, (str, bytes)):
-            sec_int, ns_float = self._from_str_or_bytes(seconds)
-            seconds_int = sec_int
-            nanoseconds_value += ns_float
-        else:
+        converter: Converter | None
+        try:
+            converter = _CONVERTERS[type(seconds)]
+        except KeyError:
+            converter = _find_converter(seconds)
+        if converter is None:
             msg = (
                 f"cannot convert {seconds!r} ({seconds.__class__.__name__})"
                 f" to {type(self).__name__}"
             )
             raise TypeError(msg)
+        seconds_int, ns_part = converter(seconds)
+        if type(nanoseconds) is int and type(ns_part) is int:
+            # exact integer path
+            carry, self._nanoseconds = divmod(
+                nanoseconds + ns_part,
+                1000000000,
+            )
+            self._seconds = seconds_int + carry
+            return
+        nanoseconds_value = float(nanoseconds) + ns_part
         self._seconds = seconds_int + int(nanoseconds_value // 1000000000)
         self._nanoseconds = int(nanoseconds_value % 1000000000)
 
+    @classmethod
+    def _from_parts(cls, seconds: int, nanoseconds: int) -> Self:
+        """Create a new instance from already-normalised parts.
+
+        This is a trusted constructor for internal use, no validation is
+        performed and ``__init__`` is not called.
+
+        Parameters
+        ----------
+        seconds : `int`
+            the integer seconds part
+
+        nanoseconds : `int`
+            the nanoseconds part, must satisfy
+            ``0 <= nanoseconds < 1000000000``
+
+        Returns
+        -------
+        gps : `LIGOTimeGPS`
+            the new instance
+        """
+        new = object.__new__(cls)
+        new._seconds = seconds
+        new._nanoseconds = nanoseconds
+        return new
+
+    @classmethod
+    def from_ns(cls, nanoseconds: int) -> Self:
+        """Create a new `LIGOTimeGPS` from a count of nanoseconds.
+
+        This is exact for any integer, no floating-point arithmetic is used.
+
+        Parameters
+        ----------
+        nanoseconds : `int`
+            the count of nanoseconds since the GPS epoch
+
+        Returns
+        -------
+        gps : `LIGOTimeGPS`
+            the new instance
+
+        Examples
+        --------
+        >>> LIGOTimeGPS.from_ns(100500000000)
+        LIGOTimeGPS(100, 500000000)
+        >>> LIGOTimeGPS.from_ns(-1)
+        LIGOTimeGPS(-1, 999999999)
+        >>> LIGOTimeGPS.from_ns(2**64).ns() == 2**64
+        True
+        """
+        return cls._from_parts(*divmod(index(nanoseconds), 1000000000))
+
+    @classmethod
+    def intern(
+        cls,
+        value: LIGOTimeGPSLike | SupportsFloat | str | bytes,
+    ) -> Self:
+        """Return a shared `LIGOTimeGPS` for ``value``.
+
+        Repeated calls with an identical input (same type and value)
+        return the same object, without converting the input again.
+        Instances are held in a size-bounded, thread-safe LRU cache, see
+        `LIGOTimeGPS.intern_cache` to configure it or inspect its statistics.
+
+        The returned object is shared, so must not be modified.
+
+        Parameters
+        ----------
+        value : `LIGOTimeGPSLike`, `float`, `str`, `bytes`
+            the time to convert, as for ``LIGOTimeGPS(value)``
+
+        Returns
+        -------
+        gps : `LIGOTimeGPS`
+            the (possibly shared) instance
+
+        Examples
+        --------
+        >>> a = LIGOTimeGPS.intern("1000000000.5")
+        >>> a
+        LIGOTimeGPS(1000000000, 500000000)
+        >>> LIGOTimeGPS.intern("1000000000.5") is a
+        True
+        """
+        try:
+            cache = _INTERN_CACHES[cls]
+        except KeyError:
+            cache = cls.intern_cache()
+        return cache(value)
+
+    @classmethod
+    def intern_cache(cls) -> InternCache[Self]:
+        """Return the cache used by `LIGOTimeGPS.intern` for this class.
+
+        Each (sub)class has its own cache.
+
+        Returns
+        -------
+        cache : `~ligotimegps.intern.InternCache`
+            the cache, whose ``maxsize`` may be changed, and which
+            provides ``cache_info()`` and ``cache_clear()`` methods
+
+        Examples
+        --------
+        >>> LIGOTimeGPS.intern_cache().maxsize
+        4096
+        """
+        try:
+            return _INTERN_CACHES[cls]
+        except KeyError:
+            return _INTERN_CACHES.setdefault(cls, InternCache(cls))
+
+    @classmethod
+    def lazy(cls, value: str | bytes) -> Self:
+        """Return a `LIGOTimeGPS` that parses ``value`` only when used.
+
+        The string is stored as given, and only parsed on first access
+        to the time, e.g. via `gpsSeconds`, arithmetic, or comparison.
+        This makes loading many times cheap when most are never used,
+        for example when filtering the rows of a large table.
+
+        The result is an instance of a private subclass of ``cls``, but
+        otherwise behaves the same as ``cls(value)``; arithmetic results
+        (and pickles) are plain ``cls`` instances.
+
+        Parameters
+        ----------
+        value : `str`, `bytes`
+            the time to parse, as for ``LIGOTimeGPS(value)``
+
+        Returns
+        -------
+        gps : `LIGOTimeGPS`
+            the new (unparsed) instance
+
+        Raises
+        ------
+        TypeError
+            if ``value`` isn't a `str` or `bytes`; note that an invalid
+            string only raises (a `TypeError`) when it is first used
+
+        Examples
+        --------
+        >>> gps = LIGOTimeGPS.lazy(b"1000000000.5")
+        >>> gps + 1
+        LIGOTimeGPS(1000000001, 500000000)
+        >>> isinstance(gps, LIGOTimeGPS)
+        True
+        """
+        if not isinstance(value, (str, bytes)):
+            msg = (
+                f"cannot lazily convert {value!r} "
+                f"({value.__class__.__name__}) to {cls.__name__}"
+            )
+            raise TypeError(msg)
+        try:
+            lazy_type = _LAZY_TYPES[cls]
+        except KeyError:
+            lazy_type = _LAZY_TYPES.setdefault(cls, _lazy_type(cls))
+        new = object.__new__(lazy_type)
+        new._raw = value
+        return new
+
+    @staticmethod
+    def _operand_parts(
+        other: LIGOTimeGPSLike | SupportsFloat | str | bytes,
+    ) -> tuple[int, int]:
+        """Return the normalised (seconds, nanoseconds) of an operand.
+
+        This is the slow path for arithmetic operands other than
+        `LIGOTimeGPS`, `int`, and `float`, which are converted to a
+        `LIGOTimeGPS` first.
+
+        Raises
+        ------
+        TypeError
+            If ``other`` cannot be converted to a `LIGOTimeGPS`.
+        """
+        other = LIGOTimeGPS(other)
+        return other._seconds, other._nanoseconds
+
     # define read-only properties to access each part
+    # (attrgetter keeps the read in C, avoiding a python-level call)
     gpsSeconds = property(  # noqa: N815
-        fget=lambda self: self._seconds,
+        fget=attrgetter("_seconds"),
         doc="Seconds since 0h UTC 6 Jan 1980",
     )
     gpsNanoSeconds = property(  # noqa: N815
-        fget=lambda self: self._nanoseconds,
+        fget=attrgetter("_nanoseconds"),
         doc="residual nanoseconds",
     )
 
+    # -- pickling --------------------
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Return the arguments to recreate this `LIGOTimeGPS` when unpickling.
+
+        The object is pickled as its two integer parts (plus its class, for
+        subclasses), and is recreated without calling ``__init__``.
+        """
+        cls = type(self)
+        args: tuple[Any, ...] = (self._seconds, self._nanoseconds)
+        if cls is not LIGOTimeGPS:
+            args = (*args, cls)
+        state = getattr(self, "__dict__", None)
+        if state:
+            return _unpickle, args, state
+        return _unpickle, args
+
+    def __setstate__(
+        self,
+        state: (
+            tuple[int, int]
+            | tuple[int, int, dict[str, Any]]
+            | dict[str, Any]
+        ),
+    ) -> None:
+        """Restore the state of this `LIGOTimeGPS` when unpickling.
+
+        ``state`` is either an instance ``__dict__``, or the
+        ``(seconds, nanoseconds[, __dict__])`` tuple pickled by earlier
+        versions.
+        Pickles from versions without ``__slots__`` store ``_seconds`` and
+        ``_nanoseconds`` in the ``__dict__``; these are restored to the
+        slots, and any other keys to the instance ``__dict__``.
+        """
+        if isinstance(state, dict):
+            state = dict(state)
+            if "_seconds" in state:
+                self._seconds = state.pop("_seconds")
+                self._nanoseconds = state.pop("_nanoseconds", 0)
+            if state:
+                self.__dict__.update(state)
+            return
+        self._seconds, self._nanoseconds, *rest = state
+        if rest:
+            self.__dict__.update(rest[0])
+
+    def to_bytes(self) -> bytes:
+        """Return this `LIGOTimeGPS` packed into 12 bytes.
+
+        The layout is a little-endian signed 64-bit integer of seconds,
+        followed by a little-endian unsigned 32-bit integer of
+        nanoseconds.
+
+        Raises
+        ------
+        OverflowError
+            if the seconds don't fit in a signed 64-bit integer
+
+        Examples
+        --------
+        >>> LIGOTimeGPS(1, 2).to_bytes().hex()
+        '010000000000000002000000'
+        """
+        try:
+            return _PACKED.pack(self._seconds, self._nanoseconds)
+        except struct_error as exc:
+            msg = f"{self!r} is out of range for packing"
+            raise OverflowError(msg) from exc
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> Self:
+        """Create a new `LIGOTimeGPS` from 12 bytes packed by `to_bytes`.
+
+        Raises
+        ------
+        ValueError
+            if ``data`` isn't 12 bytes long, or the nanoseconds are out of
+            range
+
+        Examples
+        --------
+        >>> LIGOTimeGPS.from_bytes(LIGOTimeGPS(-1, 5).to_bytes())
+        LIGOTimeGPS(-1, 5)
+        """
+        try:
+            seconds, nanoseconds = _PACKED.unpack(data)
+        except struct_error as exc:
+            msg = f"expected {_PACKED.size} bytes, got {len(data)}"
+            raise ValueError(msg) from exc
+        if nanoseconds >= NANOSECONDS_PER_SECOND:
+            msg = f"invalid nanoseconds {nanoseconds}"
+            raise ValueError(msg)
+        return cls._from_parts(seconds, nanoseconds)
+
+    def to_dd(self) -> tuple[float, float]:
+        """Return this `LIGOTimeGPS` in seconds as a double-double.
+
+        A double-double is the unevaluated sum of two floats ``hi + lo``.
+        ``hi`` is ``float(self)`` correctly rounded, and ``lo`` is the
+        remainder, so the sum is within about ``1e-32`` relative
+        (``1e-23`` seconds at current GPS times) of the exact time,
+        compared with about ``1e-7`` seconds for `float`.
+
+        See `ligotimegps.dd` for arithmetic on double-double numbers.
+
+        Examples
+        --------
+        >>> LIGOTimeGPS(1400000000, 123456789).to_dd()
+        (1400000000.1234567, 7.24625244140625e-08)
+        """
+        return ns_to_dd(self.ns())
+
+    @classmethod
+    def from_dd(cls, hi: float, lo: float = 0.) -> Self:
+        """Create a new `LIGOTimeGPS` from a double-double number of seconds.
+
+        The exact sum ``hi + lo`` is rounded to the nearest nanosecond.
+
+        Raises
+        ------
+        OverflowError
+            if either part is infinite
+
+        ValueError
+            if either part is NaN
+
+        Examples
+        --------
+        >>> LIGOTimeGPS.from_dd(1400000000.1234567, 7.24625244140625e-08)
+        LIGOTimeGPS(1400000000, 123456789)
+        """
+        return cls.from_ns(dd_to_ns(float(hi), float(lo)))
+
+    # -- UTC conversions -------------
+
+    def to_unix_ns(self) -> int:
+        """Return this `LIGOTimeGPS` as a count of Unix nanoseconds.
+
+        Unix time excludes leap seconds, which are taken from the table
+        in `ligotimegps.leapseconds`, so the conversion is exact and
+        doesn't need network access.
+
+        Examples
+        --------
+        >>> LIGOTimeGPS(1400000000, 5).to_unix_ns()
+        1715964782000000005
+        """
+        return get_leap_second_table().gps_to_unix_ns(self.ns())
+
+    def to_unix(self) -> float:
+        """Return this `LIGOTimeGPS` as Unix time in seconds.
+
+        Use `to_unix_ns` for an exact result.
+
+        Examples
+        --------
+        >>> LIGOTimeGPS(1400000000, 500000000).to_unix()
+        1715964782.5
+        """
+        seconds, nanoseconds = divmod(self.to_unix_ns(), 1000000000)
+        return seconds + nanoseconds * 1e-9
+
+    @classmethod
+    def from_unix_ns(cls, nanoseconds: int) -> Self:
+        """Create a new `LIGOTimeGPS` from a count of Unix nanoseconds.
+
+        Examples
+        --------
+        >>> LIGOTimeGPS.from_unix_ns(1715964782000000005)
+        LIGOTimeGPS(1400000000, 5)
+        """
+        return cls.from_ns(
+            get_leap_second_table().unix_to_gps_ns(index(nanoseconds)),
+        )
+
+    @classmethod
+    def from_unix(
+        cls,
+        seconds: LIGOTimeGPSLike | SupportsFloat | str | bytes,
+    ) -> Self:
+        """Create a new `LIGOTimeGPS` from Unix time in seconds.
+
+        ``seconds`` may be any value accepted by `LIGOTimeGPS`, so is
+        converted exactly from `int`, `str`, or `bytes`.
+
+        Examples
+        --------
+        >>> LIGOTimeGPS.from_unix("1715964782.000000005")
+        LIGOTimeGPS(1400000000, 5)
+        """
+        return cls.from_unix_ns(LIGOTimeGPS(seconds).ns())
+
+    @classmethod
+    def now(cls) -> Self:
+        """Return the current GPS time, from the system clock.
+
+        This reads `time.time_ns` and converts it to GPS time using only
+        integer arithmetic, so keeps the full resolution of the clock.
+        The offset between Unix and GPS time is cached, and only looked
+        up again when the clock crosses a leap second (or after
+        `~ligotimegps.leapseconds.set_leap_second_table` is called).
+
+        Returns
+        -------
+        gps : `LIGOTimeGPS`
+            the current time
+
+        Examples
+        --------
+        >>> LIGOTimeGPS.now() > 1400000000
+        True
+        """
+        unix_ns = time_ns()
+        start, end, shift = NOW_SHIFT[0]
+        if not start <= unix_ns < end:
+            start, end, shift = NOW_SHIFT[0] = (
+                get_leap_second_table().unix_to_gps_shift(unix_ns)
+            )
+        seconds, nanoseconds = divmod(unix_ns + shift, 1000000000)
+        new = object.__new__(cls)
+        new._seconds = seconds
+        new._nanoseconds = nanoseconds
+        return new
+
+    def to_datetime(self) -> datetime:
+        """Return this `LIGOTimeGPS` as a UTC `datetime.datetime`.
+
+        `~datetime.datetime` has microsecond resolution, so the time is
+        rounded down to the microsecond.
+        A time within a leap second is returned as the preceding second,
+        as `~datetime.datetime` cannot represent ``23:59:60``.
+
+        Examples
+        --------
+        >>> LIGOTimeGPS(1400000000, 123456789).to_datetime()
+        datetime.datetime(2024, 5, 17, 16, 53, 2, 123456, tzinfo=datetime.timezone.utc)
+        """
+        return _UNIX_EPOCH + timedelta(
+            microseconds=self.to_unix_ns() // 1000,
+        )
+
+    @classmethod
+    def from_datetime(cls, dt: datetime) -> Self:
+        """Create a new `LIGOTimeGPS` from a `datetime.datetime`.
+
+        A naive ``dt`` (without ``tzinfo``) is taken to be in UTC.
+
+        Examples
+        --------
+        >>> from datetime import datetime
+        >>> LIGOTimeGPS.from_datetime(datetime(2024, 5, 17, 16, 53, 2))
+        LIGOTimeGPS(1400000000, 0)
+        """
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=UTC)
+        return cls.from_unix_ns((dt - _UNIX_EPOCH) // _MICROSECOND * 1000)
+
     # -- representations -------------
 
     def __repr__(self) -> str:
@@ -256,50 +794,281 @@ class LIGOTimeGPS:
         """
         return self._seconds * 1000000000 + self._nanoseconds
 
+    # -- grid rounding ---------------
+
+    def floor(self, step: LIGOTimeGPSLike | SupportsFloat) -> Self:
+        """Round down to a multiple of ``step`` seconds.
+
+        Boundaries are at exact multiples of ``step`` since the GPS epoch,
+        each rounded to the nearest nanosecond, and are computed exactly
+        using integer arithmetic.
+
+        Parameters
+        ----------
+        step : `int`, `float`, `fractions.Fraction`, `LIGOTimeGPSLike`
+            the grid step in seconds, must be positive
+
+        Returns
+        -------
+        floor : `LIGOTimeGPS`
+            the last grid boundary at or before this time
+
+        Raises
+        ------
+        ValueError
+            if ``step`` isn't positive
+
+        Examples
+        --------
+        >>> LIGOTimeGPS(1000000000, 123456789).floor(1 / 16384)
+        LIGOTimeGPS(1000000000, 123413086)
+        >>> LIGOTimeGPS(1000000007).floor(4)
+        LIGOTimeGPS(1000000004, 0)
+        """
+        numerator, denominator = step_ratio_ns(step)
+        index = floor_index(self.ns(), numerator, denominator)
+        return self.from_ns(boundary_ns(index, numerator, denominator))
+
+    def ceil(self, step: LIGOTimeGPSLike | SupportsFloat) -> Self:
+        """Round up to a multiple of ``step`` seconds.
+
+        See `LIGOTimeGPS.floor` for details.
+
+        Parameters
+        ----------
+        step : `int`, `float`, `fractions.Fraction`, `LIGOTimeGPSLike`
+            the grid step in seconds, must be positive
+
+        Returns
+        -------
+        ceil : `LIGOTimeGPS`
+            the first grid boundary at or after this time
+
+        Raises
+        ------
+        ValueError
+            if ``step`` isn't positive
+
+        Examples
+        --------
+        >>> LIGOTimeGPS(1000000000, 123456789).ceil(1 / 16384)
+        LIGOTimeGPS(1000000000, 123474121)
+        """
+        numerator, denominator = step_ratio_ns(step)
+        index = ceil_index(self.ns(), numerator, denominator)
+        return self.from_ns(boundary_ns(index, numerator, denominator))
+
+    def round_to(self, step: LIGOTimeGPSLike | SupportsFloat) -> Self:
+        """Round to the nearest multiple of ``step`` seconds.
+
+        Exact ties are rounded to the even multiple.
+        See `LIGOTimeGPS.floor` for details.
+
+        Parameters
+        ----------
+        step : `int`, `float`, `fractions.Fraction`, `LIGOTimeGPSLike`
+            the grid step in seconds, must be positive
+
+        Returns
+        -------
+        nearest : `LIGOTimeGPS`
+            the grid boundary nearest to this time
+
+        Raises
+        ------
+        ValueError
+            if ``step`` isn't positive
+
+        Examples
+        --------
+        >>> LIGOTimeGPS(1000000000, 123456789).round_to(1 / 16384)
+        LIGOTimeGPS(1000000000, 123474121)
+        >>> LIGOTimeGPS(1000000001, 500000000).round_to(1)
+        LIGOTimeGPS(1000000002, 0)
+        """
+        numerator, denominator = step_ratio_ns(step)
+        index = nearest_index(self.ns(), numerator, denominator)
+        return self.from_ns(boundary_ns(index, numerator, denominator))
+
     # -- comparison ------------------
 
-    def __eq__(self, other: object) -> bool:
-        """Test equality between `LIGOTimeGPS` objects."""
+    def _compare_key(self, other: object) -> tuple[Any, Any] | None:
+        """Return a ``(seconds, nanoseconds)`` key to compare against.
+
+        This handles everything except `LIGOTimeGPS` and `int`, for which
+        each comparison method has its own fast path.
+        Infinite (and NaN) values are returned as ``(other, 0)`` so that
+        tuple comparison gives the right answer against finite times.
+
+        Returns `None` if ``other`` cannot be compared to a `LIGOTimeGPS`.
+        """
+        if isinstance(other, float):
+            if other - other:  # infinite or NaN
+                return other, 0
+            return self._float_parts(other)
+        try:  # LIGOTimeGPSLike
+            return other.gpsSeconds, other.gpsNanoSeconds  # type: ignore[attr-defined]
+        except AttributeError:
+            pass
         try:
-            if isinf(other):  # type: ignore[arg-type]
-                return False
-            if not isinstance(other, LIGOTimeGPS):
-                other = LIGOTimeGPS(other)  # type: ignore[arg-type]
+            infinite = isinf(other)  # type: ignore[arg-type]
         except TypeError:
-            return False
-        return (
-            self._seconds == other._seconds
-            and self._nanoseconds == other._nanoseconds
-        )
+            return None
+        if infinite:
+            return float(other), 0  # type: ignore[arg-type]
+        return self._exact_key(other)
+
+    @staticmethod
+    def _exact_key(other: object) -> tuple[Any, Any] | None:
+        """Return an exact ``(seconds, nanoseconds)`` key for ``other``.
+
+        Returns `None` if ``other`` cannot be converted.
+        """
+        try:  # rational number, e.g. Fraction or Decimal
+            num, den = other.as_integer_ratio()  # type: ignore[attr-defined]
+        except AttributeError:
+            pass
+        except ValueError:  # NaN
+            return float("nan"), 0
+        else:
+            return divmod(Fraction(num * 1000000000, den), 1000000000)
+        try:
+            gps = LIGOTimeGPS(other)  # type: ignore[arg-type]
+        except TypeError:
+            return None
+        return gps._seconds, gps._nanoseconds
+
+    def __eq__(self, other: object) -> bool:
+        """Test equality between `LIGOTimeGPS` objects."""
+        if isinstance(other, LIGOTimeGPS):
+            return (
+                self._seconds == other._seconds
+                and self._nanoseconds == other._nanoseconds
+            )
+        if isinstance(other, int):
+            return self._seconds == other and not self._nanoseconds
+        key = self._compare_key(other)
+        if key is None:
+            return NotImplemented
+        return (self._seconds, self._nanoseconds) == key
 
     def __ne__(self, other: object) -> bool:
         """Test inequality between `LIGOTimeGPS` objects."""
-        return not (self == other)
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
 
     def __lt__(self, other: SupportsFloat) -> bool:
         """Test if this `LIGOTimeGPS` is less than another."""
-        try:
-            # +infinity
-            if isinf(other) and other > 0:  # type: ignore[operator]
-                return True
-            # -infinity
-            if isinf(other):
-                return False
-            if not isinstance(other, LIGOTimeGPS):
-                other = LIGOTimeGPS(other)
-        except TypeError:
+        if isinstance(other, LIGOTimeGPS):
+            return (
+                self._seconds < other._seconds
+                or (
+                    self._seconds == other._seconds
+                    and self._nanoseconds < other._nanoseconds
+                )
+            )
+        if isinstance(other, int):
+            return self._seconds < other
+        key = self._compare_key(other)
+        if key is None:
             return NotImplemented
-        return (
-            self._seconds < other._seconds
-            or (
-                self._seconds == other._seconds
-                and self._nanoseconds < other._nanoseconds
+        return (self._seconds, self._nanoseconds) < key
+
+    def __le__(self, other: SupportsFloat) -> bool:
+        """Test if this `LIGOTimeGPS` is less than or equal to another."""
+        if isinstance(other, LIGOTimeGPS):
+            return (
+                self._seconds < other._seconds
+                or (
+                    self._seconds == other._seconds
+                    and self._nanoseconds <= other._nanoseconds
+                )
             )
-        )
+        if isinstance(other, int):
+            return self._seconds < other or (
+                self._seconds == other and not self._nanoseconds
+            )
+        key = self._compare_key(other)
+        if key is None:
+            return NotImplemented
+        return (self._seconds, self._nanoseconds) <= key
+
+    def __gt__(self, other: SupportsFloat) -> bool:
+        """Test if this `LIGOTimeGPS` is greater than another."""
+        if isinstance(other, LIGOTimeGPS):
+            return (
+                self._seconds > other._seconds
+                or (
+                    self._seconds == other._seconds
+                    and self._nanoseconds > other._nanoseconds
+                )
+            )
+        if isinstance(other, int):
+            return self._seconds > other or (
+                self._seconds == other and self._nanoseconds > 0
+            )
+        key = self._compare_key(other)
+        if key is None:
+            return NotImplemented
+        return (self._seconds, self._nanoseconds) > key
+
+    def __ge__(self, other: SupportsFloat) -> bool:
+        """Test if this `LIGOTimeGPS` is greater than or equal to another."""
+        if isinstance(other, LIGOTimeGPS):
+            return (
+                self._seconds > other._seconds
+                or (
+                    self._seconds == other._seconds
+                    and self._nanoseconds >= other._nanoseconds
+                )
+            )
+        if isinstance(other, int):
+            return self._seconds >= other
+        key = self._compare_key(other)
+        if key is None:
+            return NotImplemented
+        return (self._seconds, self._nanoseconds) >= key
 
     def __hash__(self) -> int:
-        """Return hash of the `LIGOTimeGPS`."""
-        return self._seconds ^ self._nanoseconds
+        """Return hash of the `LIGOTimeGPS`.
+
+        The hash is that of the exact rational value of the time, so it
+        matches the hash of an equal `int` or `fractions.Fraction`, or of
+        an equal `float` that is exactly a whole number of nanoseconds
+        (e.g. ``0.5``).
+        Other floats (e.g. ``0.1``) compare equal to the `LIGOTimeGPS` they
+        convert to, but are not guaranteed to hash the same.
+
+        Examples
+        --------
+        >>> hash(LIGOTimeGPS(5)) == hash(5)
+        True
+        >>> hash(LIGOTimeGPS(0, 500000000)) == hash(0.5)
+        True
+        """
+        seconds = self._seconds
+        nanoseconds = self._nanoseconds
+        if not nanoseconds:
+            return hash(seconds)
+        # seconds + nanoseconds / 1e9 (mod P), with the sign of the time,
+        # caching the nanoseconds term, which repeats on sample grids
+        try:
+            term = _HASH_NS_CACHE[nanoseconds]
+        except KeyError:
+            term = nanoseconds * _HASH_INVERSE_NS % _HASH_MODULUS
+            if len(_HASH_NS_CACHE) < _HASH_NS_CACHE_SIZE:
+                _HASH_NS_CACHE[nanoseconds] = term
+        if 0 <= seconds < _HASH_MODULUS:
+            value = seconds + term
+            return value - _HASH_MODULUS if value >= _HASH_MODULUS else value
+        value = (seconds + term) % _HASH_MODULUS
+        if seconds < 0 and value:
+            value -= _HASH_MODULUS
+            if value == -1:
+                return -2
+        return value
 
     def __bool__(self) -> bool:
         """Return True if the `LIGOTimeGPS` is nonzero.
@@ -316,11 +1085,13 @@ class LIGOTimeGPS:
     def __round__(self, n: int = 0) -> Self:
         """Round a `LIGOTimeGPS` to the given precision."""
         n = int(n)
-        if n == 0 and self.gpsNanoSeconds >= HALF_SECOND_IN_NANOSECONDS:
-            return type(self)(self._seconds+1)
+        if n == 0 and self._nanoseconds >= HALF_SECOND_IN_NANOSECONDS:
+            return self._from_parts(self._seconds + 1, 0)
         if n == 0:
-            return type(self)(self._seconds)
-        return type(self)(self._seconds, round(self._nanoseconds, -9 + n))
+            return self._from_parts(self._seconds, 0)
+        return self.from_ns(
+            self._seconds * 1000000000 + round(self._nanoseconds, -9 + n),
+        )
 
     def __add__(self, other: LIGOTimeGPSLike | float | str | bytes) -> Self:
         """Add a value to a `LIGOTimeGPS`.
@@ -337,12 +1108,20 @@ class LIGOTimeGPS:
         >>> LIGOTimeGPS(100.5) + "3"
         LIGOTimeGPS(103, 500000000)
         """
-        if not isinstance(other, LIGOTimeGPS):
-            other = LIGOTimeGPS(other)
-        return type(self)(
-            self._seconds + other._seconds,
-            self._nanoseconds + other._nanoseconds,
-        )
+        if isinstance(other, LIGOTimeGPS):
+            other_seconds = other._seconds
+            other_nanoseconds = other._nanoseconds
+        elif type(other) is int:
+            return self._from_parts(self._seconds + other, self._nanoseconds)
+        elif type(other) is float:
+            other_seconds, other_nanoseconds = self._float_parts(other)
+        else:
+            other_seconds, other_nanoseconds = self._operand_parts(other)
+        seconds = self._seconds + other_seconds
+        nanoseconds = self._nanoseconds + other_nanoseconds
+        if nanoseconds >= NANOSECONDS_PER_SECOND:
+            return self._from_parts(seconds + 1, nanoseconds - 1000000000)
+        return self._from_parts(seconds, nanoseconds)
 
     # addition is commutative.
     __radd__ = __add__
@@ -363,21 +1142,38 @@ class LIGOTimeGPS:
         >>> LIGOTimeGPS(100.5) - "3"
         LIGOTimeGPS(97, 500000000)
         """
-        if not isinstance(other, LIGOTimeGPS):
-            other = LIGOTimeGPS(other)
-        return type(self)(
-            self._seconds - other._seconds,
-            self._nanoseconds - other._nanoseconds,
-        )
+        if isinstance(other, LIGOTimeGPS):
+            other_seconds = other._seconds
+            other_nanoseconds = other._nanoseconds
+        elif type(other) is int:
+            return self._from_parts(self._seconds - other, self._nanoseconds)
+        elif type(other) is float:
+            other_seconds, other_nanoseconds = self._float_parts(other)
+        else:
+            other_seconds, other_nanoseconds = self._operand_parts(other)
+        seconds = self._seconds - other_seconds
+        nanoseconds = self._nanoseconds - other_nanoseconds
+        if nanoseconds < 0:
+            return self._from_parts(seconds - 1, nanoseconds + 1000000000)
+        return self._from_parts(seconds, nanoseconds)
 
     def __rsub__(self, other: LIGOTimeGPSLike | float | str | bytes) -> Self:
         """Subtract a `LIGOTimeGPS` from a value."""
-        if not isinstance(other, LIGOTimeGPS):
-            other = LIGOTimeGPS(other)
-        return type(self)(
-            other._seconds - self._seconds,
-            other._nanoseconds - self._nanoseconds,
-        )
+        if isinstance(other, LIGOTimeGPS):
+            other_seconds = other._seconds
+            other_nanoseconds = other._nanoseconds
+        elif type(other) is int:
+            other_seconds = other
+            other_nanoseconds = 0
+        elif type(other) is float:
+            other_seconds, other_nanoseconds = self._float_parts(other)
+        else:
+            other_seconds, other_nanoseconds = self._operand_parts(other)
+        seconds = other_seconds - self._seconds
+        nanoseconds = other_nanoseconds - self._nanoseconds
+        if nanoseconds < 0:
+            return self._from_parts(seconds - 1, nanoseconds + 1000000000)
+        return self._from_parts(seconds, nanoseconds)
 
     def __mul__(self, other: float) -> Self:
         """Multiply a `LIGOTimeGPS` by a number.
@@ -411,34 +1207,41 @@ class LIGOTimeGPS:
     # multiplication is commutative
     __rmul__ = __mul__
 
-    def __truediv__(self, other: float) -> Self:
+    def __truediv__(self, other: LIGOTimeGPSLike | SupportsFloat) -> Self:
         """Divide a `LIGOTimeGPS` by a number.
 
+        The quotient is computed exactly using integer arithmetic
+        and rounded down to the nearest nanosecond.
+
         Examples
         --------
         >>> LIGOTimeGPS(100.5) / 2
         LIGOTimeGPS(50, 250000000)
         """
-        quotient = type(self)(float(self) / float(other))
-        for _ in range(100):
-            residual = float(self - quotient * other) / float(other)
-            quotient += residual
-            if abs(residual) <= HALF_NANOSECOND:
-                break
-        return quotient
+        try:
+            ratio = as_integer_ratio(other)
+        except TypeError:
+            return NotImplemented
+        return self.from_ns(divide_ns(self.ns(), *ratio))
 
     __div__ = __truediv__
 
-    def __mod__(self, other: float) -> Self:
+    def __mod__(self, other: LIGOTimeGPSLike | SupportsFloat) -> Self:
         """Compute the remainder when a `LIGOTimeGPS` is divided by a number.
 
+        This is equivalent to ``self - int(self / other) * other``,
+        computed exactly using integer arithmetic.
+
         Examples
         --------
         >>> LIGOTimeGPS(100.5) % 3
         LIGOTimeGPS(1, 500000000)
         """
-        quotient = int(self / other)
-        return self - quotient * other
+        try:
+            ratio = as_integer_ratio(other)
+        except TypeError:
+            return NotImplemented
+        return self.from_ns(mod_ns(self.ns(), *ratio))
 
     # -- unary arithmetic ------------
 
@@ -448,10 +1251,127 @@ class LIGOTimeGPS:
 
     def __neg__(self) -> Self:
         """Return the negation of the `LIGOTimeGPS`."""
-        return type(self)(0, -self.ns())
+        if self._nanoseconds:
+            return self._from_parts(
+                -self._seconds - 1,
+                1000000000 - self._nanoseconds,
+            )
+        return self._from_parts(-self._seconds, 0)
 
     def __abs__(self) -> Self:
         """Return the absolute value of the `LIGOTimeGPS`."""
         if self._seconds >= 0:
             return self
         return -self
+
+
+# -- interning -------------------------
+
+#: map of class to the cache used by `LIGOTimeGPS.intern`
+_INTERN_CACHES: dict[type, InternCache[Any]] = {}
+
+# -- lazy parsing ----------------------
+
+#: map of class to the subclass used by `LIGOTimeGPS.lazy`
+_LAZY_TYPES: dict[type, Any] = {}
+
+
+def _lazy_type(cls: type[LIGOTimeGPS]) -> type[LIGOTimeGPS]:
+    """Create the subclass of ``cls`` used by `LIGOTimeGPS.lazy`.
+
+    Instances store the input string in ``_raw`` and leave the
+    ``_seconds`` and ``_nanoseconds`` slots empty, so that reading
+    either falls through to ``__getattr__``, which parses the string
+    and fills both slots; later reads cost the same as for ``cls``.
+    ``_raw`` is kept after parsing, so that threads racing to parse the
+    same instance each assign the same values, rather than one of them
+    finding the string already gone.
+    """
+
+    class Lazy(cls):  # type: ignore[valid-type,misc]
+        __slots__ = ("_raw",)
+
+        _raw: str | bytes
+
+        # arithmetic results are plain instances of cls
+        _from_parts = staticmethod(cls._from_parts)
+
+        def __getattr__(self, name: str) -> int:
+            """Parse the input string on first access to the time."""
+            if name in _LAZY_ATTRS:
+                seconds, nanoseconds = self._from_str_or_bytes(self._raw)
+                self._seconds = seconds
+                self._nanoseconds = nanoseconds
+                return seconds if name == "_seconds" else nanoseconds
+            msg = f"{type(self).__name__!r} object has no attribute {name!r}"
+            raise AttributeError(msg)
+
+        def __reduce__(self) -> tuple[Any, ...]:
+            """Return the arguments to recreate this time as a ``cls``."""
+            new = cls._from_parts(self._seconds, self._nanoseconds)
+            state = getattr(self, "__dict__", None)
+            if state:
+                new.__dict__.update(state)
+            return new.__reduce__()
+
+    Lazy.__name__ = f"Lazy{cls.__name__}"
+    Lazy.__qualname__ = f"Lazy{cls.__qualname__}"
+    _CONVERTERS[Lazy] = LIGOTimeGPS._from_ligotimegps  # noqa: SLF001
+    _LAZY_TYPES[Lazy] = Lazy
+    return Lazy
+
+
+_LAZY_ATTRS = frozenset(("_seconds", "_nanoseconds"))
+
+# -- type dispatch ---------------------
+
+#: map of input type to (seconds, nanoseconds) converter, extended at runtime
+#: as new types are seen by `_find_converter`
+_CONVERTERS: dict[type, Converter] = {
+    int: LIGOTimeGPS._from_int,  # noqa: SLF001
+    float: LIGOTimeGPS._from_float,  # noqa: SLF001
+    str: LIGOTimeGPS._from_str_or_bytes,  # noqa: SLF001
+    bytes: LIGOTimeGPS._from_str_or_bytes,  # noqa: SLF001
+    LIGOTimeGPS: LIGOTimeGPS._from_ligotimegps,  # noqa: SLF001
+}
+
+_PROTOCOL_ATTRS = ("gpsSeconds", "gpsNanoSeconds")
+
+
+def _find_converter(value: object) -> Converter | None:
+    """Find the converter for a value whose type isn't in `_CONVERTERS`.
+
+    The result is stored in `_CONVERTERS` so that the (slow) runtime
+    `LIGOTimeGPSLike` protocol check is only performed once per type,
+    unless conformance depends on instance attributes, in which case
+    it is checked for every value.
+    """
+    type_ = type(value)
+    converter: Converter
+    if isinstance(value, LIGOTimeGPSLike):
+        converter = LIGOTimeGPS._from_lal_ligotimegps  # noqa: SLF001
+        if not all(map(partial(hasattr, type_), _PROTOCOL_ATTRS)):
+            # attributes are set per-instance, so don't cache the result
+            return converter
+    elif isinstance(value, int):
+        converter = LIGOTimeGPS._from_int  # noqa: SLF001
+    elif isinstance(value, float):
+        converter = LIGOTimeGPS._from_float  # noqa: SLF001
+    elif isinstance(value, (str, bytes)):
+        converter = LIGOTimeGPS._from_str_or_bytes  # noqa: SLF001
+    else:
+        return None
+    _CONVERTERS[type_] = converter
+    return converter
+
+
+def _unpickle(
+    seconds: int,
+    nanoseconds: int,
+    cls: type[LIGOTimeGPS] = LIGOTimeGPS,
+) -> LIGOTimeGPS:
+    """Recreate a `LIGOTimeGPS` from the arguments of its ``__reduce__``."""
+    new = object.__new__(cls)
+    new._seconds = seconds
+    new._nanoseconds = nanoseconds
+    return new
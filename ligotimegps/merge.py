@@ -0,0 +1,247 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Lazy merging of time-ordered event streams."""
+
+from __future__ import annotations
+
+from heapq import (
+    heapify,
+    heappop,
+    heappush,
+    heapreplace,
+)
+from itertools import count
+from typing import (
+    TYPE_CHECKING,
+    Literal,
+    TypeVar,
+)
+
+from .gpsarray import _as_ns
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Callable,
+        Iterable,
+        Iterator,
+    )
+
+    from .gpsarray import GPSOperand
+
+    LatePolicy = Literal["raise", "drop", "emit"]
+
+T = TypeVar("T")
+
+_LATE_POLICIES = ("raise", "drop", "emit")
+
+
+def _late(ns: int, previous: int, stream: int, on_late: str) -> bool:
+    """Handle an item that is earlier than one already seen.
+
+    Returns `True` if the item should be emitted, or `False` to drop it.
+    """
+    if on_late == "raise":
+        msg = (
+            f"item at {ns} ns from stream {stream} is earlier than "
+            f"an item already merged at {previous} ns"
+        )
+        raise ValueError(msg)
+    return on_late == "emit"
+
+
+def _ns_function(
+    key: Callable[[T], GPSOperand] | None,
+) -> Callable[[T], int]:
+    """Return a function that returns the nanoseconds of an item."""
+    if key is None:
+        return _as_ns  # type: ignore[return-value]
+
+    def to_ns(item: T) -> int:
+        return _as_ns(key(item))
+
+    return to_ns
+
+
+def _ordered(
+    iterable: Iterable[T],
+    to_ns: Callable[[T], int],
+    stream: int,
+    on_late: str,
+) -> Iterator[tuple[int, T]]:
+    """Yield ``(nanoseconds, item)`` for each item, handling any out of order."""
+    previous = None
+    for item in iterable:
+        ns = to_ns(item)
+        if previous is not None and ns < previous:
+            if _late(ns, previous, stream, on_late):
+                yield ns, item
+            continue
+        previous = ns
+        yield ns, item
+
+
+def _reorder(
+    iterable: Iterable[T],
+    to_ns: Callable[[T], int],
+    lateness: int,
+    stream: int,
+    on_late: str,
+) -> Iterator[tuple[int, T]]:
+    """Yield ``(nanoseconds, item)`` for each item, sorted to within ``lateness``.
+
+    Items are held in a heap until an item at least ``lateness`` later
+    has been seen, so the buffer only holds the items in that window.
+    """
+    buffer: list[tuple[int, int, T]] = []
+    sequence = count()
+    latest = emitted = None
+    for item in iterable:
+        ns = to_ns(item)
+        if emitted is not None and ns < emitted:
+            if _late(ns, emitted, stream, on_late):
+                yield ns, item
+            continue
+        heappush(buffer, (ns, next(sequence), item))
+        if latest is None or ns > latest:
+            latest = ns
+        threshold = latest - lateness
+        while buffer and buffer[0][0] <= threshold:
+            emitted, _, out = heappop(buffer)
+            yield emitted, out
+    while buffer:
+        emitted, _, out = heappop(buffer)
+        yield emitted, out
+
+
+def merge_by_time(
+    *iterables: Iterable[T],
+    key: Callable[[T], GPSOperand] | None = None,
+    lateness: GPSOperand = 0,
+    on_late: LatePolicy = "raise",
+) -> Iterator[T]:
+    """Lazily merge streams of events into a single time-ordered stream.
+
+    This is like `heapq.merge`, but the time of each item is converted
+    once to an integer count of nanoseconds, and the merge compares only
+    those integers, never `LIGOTimeGPS` objects.
+    Items with equal times are yielded in the order of their streams.
+
+    Each stream is consumed lazily, so memory use is bounded by the
+    number of streams, plus the items held for reordering (see
+    ``lateness``).
+
+    Parameters
+    ----------
+    *iterables : `Iterable`
+        the streams to merge, each in time order (to within ``lateness``)
+
+    key : `callable`, optional
+        a function that returns the GPS time of an item, as a
+        `LIGOTimeGPS`, any `LIGOTimeGPSLike`, or anything accepted by
+        `LIGOTimeGPS`; by default each item is itself a time
+
+    lateness : `LIGOTimeGPS`, `int`, `float`, `str`, optional
+        how far (in seconds) an item may arrive after a later item from
+        the same stream; each stream is passed through a reorder buffer
+        that holds items until an item this much later has been seen,
+        default is ``0`` (no reordering)
+
+    on_late : `str`, optional
+        what to do with an item that arrives after a later item from the
+        same stream has already been merged (i.e. later than
+        ``lateness`` allows), one of
+
+        - ``'raise'``: raise a `ValueError` (default)
+        - ``'drop'``: skip the item
+        - ``'emit'``: yield the item immediately, out of order
+
+    Yields
+    ------
+    item
+        the items of all streams, in time order
+
+    Raises
+    ------
+    ValueError
+        if ``lateness`` is negative, ``on_late`` isn't valid, or (with
+        ``on_late='raise'``) an item arrives too late
+
+    Examples
+    --------
+    >>> from ligotimegps import LIGOTimeGPS
+    >>> h1 = [("H1", LIGOTimeGPS(1)), ("H1", LIGOTimeGPS(3))]
+    >>> l1 = [("L1", LIGOTimeGPS(2)), ("L1", LIGOTimeGPS(3))]
+    >>> [ifo for ifo, _ in merge_by_time(h1, l1, key=lambda x: x[1])]
+    ['H1', 'L1', 'H1', 'L1']
+    >>> list(merge_by_time([1, 3, 2, 5], [4], lateness=1))
+    [1, 2, 3, 4, 5]
+    """
+    if on_late not in _LATE_POLICIES:
+        msg = (
+            f"invalid on_late {on_late!r}, "
+            f"must be one of {', '.join(map(repr, _LATE_POLICIES))}"
+        )
+        raise ValueError(msg)
+    window = _as_ns(lateness)
+    if window < 0:
+        msg = f"lateness must not be negative, not {lateness!r}"
+        raise ValueError(msg)
+    return _merge(iterables, key, window, on_late)
+
+
+def _merge(
+    iterables: tuple[Iterable[T], ...],
+    key: Callable[[T], GPSOperand] | None,
+    window: int,
+    on_late: str,
+) -> Iterator[T]:
+    """Merge streams of items (implementation of `merge_by_time`)."""
+    to_ns = _ns_function(key)
+
+    # each heap entry is [nanoseconds, stream, item, next], so ties in
+    # time are broken by the stream number, and items are never compared
+    heap: list[list] = []
+    for stream, iterable in enumerate(iterables):
+        if window:
+            pairs = _reorder(iterable, to_ns, window, stream, on_late)
+        else:
+            pairs = _ordered(iterable, to_ns, stream, on_late)
+        next_ = pairs.__next__
+        try:
+            ns, item = next_()
+        except StopIteration:
+            continue
+        heap.append([ns, stream, item, next_])
+    heapify(heap)
+
+    while len(heap) > 1:
+        entry = heap[0]
+        yield entry[2]
+        try:
+            entry[0], entry[2] = entry[3]()
+        except StopIteration:
+            heappop(heap)
+        else:
+            heapreplace(heap, entry)
+
+    if heap:
+        # only one stream left, so no more merging
+        _, _, item, next_ = heap[0]
+        yield item
+        for _, item in iter(next_, None):
+            yield item
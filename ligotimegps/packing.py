@@ -0,0 +1,154 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Compact binary packing of many GPS times."""
+
+from __future__ import annotations
+
+from itertools import starmap
+from operator import itemgetter
+from struct import error as struct_error
+from typing import (
+    TYPE_CHECKING,
+    Literal,
+    overload,
+)
+
+from .buffer import to_ns_array
+from .gpsarray import LIGOTimeGPSArray
+from .ligotimegps import (
+    _PACKED,
+    NANOSECONDS_PER_SECOND,
+    LIGOTimeGPS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .buffer import LIGOTimeGPSView
+    from .gpsarray import GPSOperand
+    from .gpsrange import GPSRange
+
+#: the number of bytes used to pack each GPS time
+PACKED_SIZE = _PACKED.size
+
+
+def pack_many(
+    times: (
+        LIGOTimeGPSArray
+        | LIGOTimeGPSView
+        | GPSRange
+        | Iterable[GPSOperand]
+    ),
+) -> bytes:
+    """Pack many GPS times into a single `bytes` buffer.
+
+    Each time is packed into `PACKED_SIZE` (12) bytes using the same
+    layout as `LIGOTimeGPS.to_bytes`, a little-endian signed 64-bit
+    integer of seconds followed by a little-endian unsigned 32-bit
+    integer of nanoseconds, so the output is portable between platforms.
+
+    Parameters
+    ----------
+    times : `LIGOTimeGPSArray`, `LIGOTimeGPSView`, `GPSRange`, `Iterable`
+        the times to pack
+
+    Returns
+    -------
+    data : `bytes`
+        the packed times
+
+    Examples
+    --------
+    >>> data = pack_many([1.5, LIGOTimeGPS(2, 1)])
+    >>> len(data)
+    24
+    >>> unpack_many(data)
+    [LIGOTimeGPS(1, 500000000), LIGOTimeGPS(2, 1)]
+    """
+    parts = (
+        divmod(ns, NANOSECONDS_PER_SECOND)
+        for ns in to_ns_array(times, copy=False)
+    )
+    return b"".join(starmap(_PACKED.pack, parts))
+
+
+@overload
+def unpack_many(
+    data: bytes | bytearray | memoryview,
+    *,
+    as_array: Literal[False] = False,
+) -> list[LIGOTimeGPS]: ...
+
+
+@overload
+def unpack_many(
+    data: bytes | bytearray | memoryview,
+    *,
+    as_array: Literal[True],
+) -> LIGOTimeGPSArray: ...
+
+
+def unpack_many(
+    data: bytes | bytearray | memoryview,
+    *,
+    as_array: bool = False,
+) -> list[LIGOTimeGPS] | LIGOTimeGPSArray:
+    """Unpack many GPS times from a buffer written by `pack_many`.
+
+    Parameters
+    ----------
+    data : `bytes`, `bytearray`, `memoryview`
+        the packed times, a multiple of `PACKED_SIZE` (12) bytes long
+
+    as_array : `bool`, optional
+        if `True` return a `LIGOTimeGPSArray`, otherwise return a
+        `list` of `LIGOTimeGPS`
+
+    Returns
+    -------
+    times : `list` of `LIGOTimeGPS`, or `LIGOTimeGPSArray`
+        the unpacked times
+
+    Raises
+    ------
+    ValueError
+        if the length of ``data`` isn't a multiple of `PACKED_SIZE`, or
+        any nanoseconds are out of range
+
+    Examples
+    --------
+    >>> unpack_many(pack_many([1, 2]), as_array=True).ns()
+    array('q', [1000000000, 2000000000])
+    """
+    try:
+        parts = list(_PACKED.iter_unpack(data))
+    except struct_error as exc:
+        msg = (
+            f"buffer length ({len(data)}) is not a multiple "
+            f"of {PACKED_SIZE} bytes"
+        )
+        raise ValueError(msg) from exc
+    if parts and max(map(itemgetter(1), parts)) >= NANOSECONDS_PER_SECOND:
+        msg = "invalid nanoseconds in packed data"
+        raise ValueError(msg)
+    if as_array:
+        return LIGOTimeGPSArray.from_ns(
+            seconds * NANOSECONDS_PER_SECOND + nanoseconds
+            for seconds, nanoseconds in parts
+        )
+    return list(starmap(LIGOTimeGPS._from_parts, parts))  # noqa: SLF001
@@ -0,0 +1,233 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Parsing of GPS times from decimal strings."""
+
+from __future__ import annotations
+
+import re
+from typing import (
+    TYPE_CHECKING,
+    Literal,
+    overload,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .gpsarray import LIGOTimeGPSArray
+    from .ligotimegps import LIGOTimeGPS
+
+
+# a decimal number, as accepted by decimal.Decimal (excluding NaN/Infinity)
+_DIGITS = r"\d(?:_?\d)*"
+_DECIMAL = re.compile(
+    r"\s*"
+    r"(?P<sign>[-+])?"
+    rf"(?=\d|\.\d)(?P<int>{_DIGITS})?"
+    rf"(?:\.(?P<frac>{_DIGITS})?)?"
+    rf"(?:[eE](?P<exp>[-+]?{_DIGITS}))?"
+    r"\s*",
+)
+
+
+#: the most digits in a parsed count of nanoseconds, this only guards
+#: against pathological input (e.g. ``"1e999999999"``), and is below the
+#: limit on converting strings to `int` (see `sys.get_int_max_str_digits`)
+_MAX_NS_DIGITS = 4000
+
+# the most integer digits handled by the fast path of `parse_ns`
+_MAX_FAST_DIGITS = 10
+
+
+def _invalid(value: str | bytes) -> TypeError:
+    """Return the `TypeError` for an unparseable GPS string."""
+    return TypeError(f"invalid literal for LIGOTimeGPS: {value!r}")
+
+
+def _out_of_range(value: str | bytes) -> TypeError:
+    """Return the `TypeError` for a GPS string with too many digits."""
+    return TypeError(f"LIGOTimeGPS literal out of range: {value!r}")
+
+
+def parse_ns(value: str | bytes) -> int:
+    """Parse a decimal string as a count of nanoseconds.
+
+    The string may include a sign and exponent, e.g. ``"-1.5e3"``.
+    Digits beyond nanosecond precision are truncated (towards zero).
+    The result is not limited to 64 bits, but strings whose result would
+    have more than 4000 digits are rejected.
+
+    Parameters
+    ----------
+    value : `str`, `bytes`
+        the decimal string to parse
+
+    Returns
+    -------
+    nanoseconds : `int`
+        the count of nanoseconds
+
+    Raises
+    ------
+    TypeError
+        if ``value`` cannot be parsed as a decimal number, or its result
+        has too many digits
+
+    Examples
+    --------
+    >>> parse_ns("1.5")
+    1500000000
+    >>> parse_ns(b"-1.2345678987e-3")
+    -1234567
+    """
+    text = value.decode() if isinstance(value, (bytes, bytearray)) else value
+
+    # fast path for plain '[-+]digits[.digits]'
+    intpart, _, frac = text.partition(".")
+    sign = intpart[:1]
+    if sign in ("-", "+"):
+        intpart = intpart[1:]
+    if (
+        (intpart.isdigit() or (not intpart and frac))
+        and (frac.isdigit() or not frac)
+        and text.isascii()
+        and len(intpart) <= _MAX_FAST_DIGITS
+    ):
+        nanoseconds = int(intpart + frac[:9].ljust(9, "0"))
+        return -nanoseconds if sign == "-" else nanoseconds
+
+    return _parse_ns_regex(value, text)
+
+
+def _parse_ns_regex(value: str | bytes, text: str) -> int:
+    """Parse a decimal string using the full regular expression.
+
+    This supports surrounding whitespace, underscores between digits,
+    and exponents.
+    The number of digits in the result is checked before any digits are
+    converted, so huge exponents or digit strings fail fast.
+    """
+    match = _DECIMAL.fullmatch(text)
+    if match is None:
+        raise _invalid(value)
+    intpart, frac, exp = match.group("int", "frac", "exp")
+    frac = (frac or "").replace("_", "")
+    # the significant digits, and the power of ten to scale them by
+    digits = ((intpart or "").replace("_", "") + frac).lstrip("0")
+    if not digits:
+        return 0
+    shift = 9 - len(frac)
+    if exp:
+        exp = exp.replace("_", "")
+        if len(exp.lstrip("+-0")) > _MAX_NS_DIGITS:
+            # an exponent this large is out of range, or rounds to zero
+            if exp[0] != "-":
+                raise _out_of_range(value)
+            return 0
+        shift += int(exp)
+    if len(digits) + shift > _MAX_NS_DIGITS:
+        raise _out_of_range(value)
+    if shift >= 0:
+        nanoseconds = int(digits) * 10 ** shift
+    elif -shift >= len(digits):
+        nanoseconds = 0
+    else:  # truncate
+        nanoseconds = int(digits[:shift])
+    return -nanoseconds if match.group("sign") == "-" else nanoseconds
+
+
+def _tokens(
+    values: str | bytes | bytearray | memoryview | Iterable[str | bytes],
+    sep: str | None,
+) -> Iterable[str | bytes]:
+    """Return the tokens to parse from ``values``."""
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        values = bytes(values).decode()
+    if isinstance(values, str):
+        return filter(str.strip, values.split(sep))
+    return values
+
+
+@overload
+def parse_many(
+    values: str | bytes | bytearray | memoryview | Iterable[str | bytes],
+    *,
+    sep: str | None = None,
+    as_array: Literal[False] = False,
+) -> list[LIGOTimeGPS]: ...
+
+
+@overload
+def parse_many(
+    values: str | bytes | bytearray | memoryview | Iterable[str | bytes],
+    *,
+    sep: str | None = None,
+    as_array: Literal[True],
+) -> LIGOTimeGPSArray: ...
+
+
+def parse_many(
+    values: str | bytes | bytearray | memoryview | Iterable[str | bytes],
+    *,
+    sep: str | None = None,
+    as_array: bool = False,
+) -> list[LIGOTimeGPS] | LIGOTimeGPSArray:
+    """Parse many GPS times from strings in bulk.
+
+    Parameters
+    ----------
+    values : `str`, `bytes`, or `Iterable` of `str` or `bytes`
+        either a sequence of decimal strings, or a single buffer of
+        delimited decimal strings
+
+    sep : `str`, optional
+        the delimiter to use when ``values`` is a single buffer,
+        defaults to any whitespace; empty fields are ignored
+
+    as_array : `bool`, optional
+        if `True` return a `LIGOTimeGPSArray`, otherwise return a
+        `list` of `LIGOTimeGPS`
+
+    Returns
+    -------
+    times : `list` of `LIGOTimeGPS`, or `LIGOTimeGPSArray`
+        the parsed times
+
+    Raises
+    ------
+    TypeError
+        if any value cannot be parsed as a decimal number
+
+    OverflowError
+        if ``as_array=True`` and any time is beyond the signed 64-bit
+        nanoseconds of a `LIGOTimeGPSArray`
+
+    Examples
+    --------
+    >>> parse_many(b"100.5 200 -0.25")
+    [LIGOTimeGPS(100, 500000000), LIGOTimeGPS(200, 0), LIGOTimeGPS(-1, 750000000)]
+    >>> parse_many("1,2.5", sep=",", as_array=True).ns()
+    array('q', [1000000000, 2500000000])
+    """
+    nanoseconds = list(map(parse_ns, _tokens(values, sep)))
+    if as_array:
+        from .gpsarray import LIGOTimeGPSArray
+        return LIGOTimeGPSArray.from_ns(nanoseconds)
+
+    from .ligotimegps import LIGOTimeGPS
+    return list(map(LIGOTimeGPS.from_ns, nanoseconds))
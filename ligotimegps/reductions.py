@@ -0,0 +1,247 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Exact reductions over collections of GPS times."""
+
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from ._exact import (
+    NANOSECONDS_PER_SECOND,
+    as_integer_ratio,
+    floor_index,
+)
+from .buffer import to_ns_array
+from .gpsarray import _as_ns
+from .ligotimegps import LIGOTimeGPS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import SupportsFloat
+
+    from .buffer import LIGOTimeGPSView
+    from .gpsarray import (
+        GPSOperand,
+        LIGOTimeGPSArray,
+    )
+    from .gpsrange import GPSRange
+    from .protocol import LIGOTimeGPSLike
+
+    Times = (
+        LIGOTimeGPSArray
+        | LIGOTimeGPSView
+        | GPSRange
+        | Iterable[GPSOperand]
+    )
+
+
+def _ns(times: Times) -> array[int] | memoryview:
+    """Return the nanoseconds of some times, without copying if possible."""
+    return to_ns_array(times, copy=False)
+
+
+def gps_sum(times: Times) -> LIGOTimeGPS:
+    """Return the exact sum of some GPS times.
+
+    Parameters
+    ----------
+    times : `LIGOTimeGPSArray`, `LIGOTimeGPSView`, `GPSRange`, `Iterable`
+        the times to sum
+
+    Returns
+    -------
+    total : `LIGOTimeGPS`
+        the sum, `LIGOTimeGPS(0)` if ``times`` is empty
+
+    Examples
+    --------
+    >>> gps_sum([LIGOTimeGPS(1, 500000000), 2, "0.75"])
+    LIGOTimeGPS(4, 250000000)
+    """
+    return LIGOTimeGPS.from_ns(sum(_ns(times)))
+
+
+def gps_mean(times: Times) -> LIGOTimeGPS:
+    """Return the mean of some GPS times.
+
+    The mean is computed exactly from the integer sum, then rounded
+    down to the nanosecond, matching ``gps_sum(times) / len(times)``.
+
+    Parameters
+    ----------
+    times : `LIGOTimeGPSArray`, `LIGOTimeGPSView`, `GPSRange`, `Iterable`
+        the times to average
+
+    Returns
+    -------
+    mean : `LIGOTimeGPS`
+        the mean
+
+    Raises
+    ------
+    ValueError
+        if ``times`` is empty
+
+    Examples
+    --------
+    >>> gps_mean([1000000000, 1000000001, LIGOTimeGPS(1000000001, 1)])
+    LIGOTimeGPS(1000000000, 666666667)
+    """
+    nanoseconds = _ns(times)
+    if not len(nanoseconds):
+        msg = "gps_mean() of an empty sequence"
+        raise ValueError(msg)
+    return LIGOTimeGPS.from_ns(sum(nanoseconds) // len(nanoseconds))
+
+
+def gps_min(times: Times) -> LIGOTimeGPS:
+    """Return the earliest of some GPS times.
+
+    Raises
+    ------
+    ValueError
+        if ``times`` is empty
+
+    Examples
+    --------
+    >>> gps_min([3, LIGOTimeGPS(1, 5), "2"])
+    LIGOTimeGPS(1, 5)
+    """
+    nanoseconds = _ns(times)
+    if not len(nanoseconds):
+        msg = "gps_min() of an empty sequence"
+        raise ValueError(msg)
+    return LIGOTimeGPS.from_ns(min(nanoseconds))
+
+
+def gps_max(times: Times) -> LIGOTimeGPS:
+    """Return the latest of some GPS times.
+
+    Raises
+    ------
+    ValueError
+        if ``times`` is empty
+
+    Examples
+    --------
+    >>> gps_max([3, LIGOTimeGPS(1, 5), "2"])
+    LIGOTimeGPS(3, 0)
+    """
+    nanoseconds = _ns(times)
+    if not len(nanoseconds):
+        msg = "gps_max() of an empty sequence"
+        raise ValueError(msg)
+    return LIGOTimeGPS.from_ns(max(nanoseconds))
+
+
+def argsort(times: Times) -> array[int]:
+    """Return the indices that would sort some GPS times.
+
+    The sort is stable, so equal times keep their original order.
+
+    Returns
+    -------
+    indices : `array.array`
+        the sorting indices, with type code ``'q'``
+
+    Examples
+    --------
+    >>> argsort([3, LIGOTimeGPS(1, 5), "2", "1.000000005"])
+    array('q', [1, 3, 2, 0])
+    """
+    nanoseconds = _ns(times).tolist()
+    return array(
+        "q",
+        sorted(range(len(nanoseconds)), key=nanoseconds.__getitem__),
+    )
+
+
+def histogram(
+    times: Times,
+    start: GPSOperand,
+    bin_width: LIGOTimeGPSLike | SupportsFloat,
+    nbins: int | None = None,
+) -> array[int]:
+    """Count GPS times in fixed-width bins.
+
+    Bin ``i`` covers ``[start + i * bin_width, start + (i + 1) * bin_width)``,
+    with each boundary computed exactly and rounded to the nearest
+    nanosecond, as for `SampleGrid`.
+    Times outside of all bins are ignored.
+
+    Parameters
+    ----------
+    times : `LIGOTimeGPSArray`, `LIGOTimeGPSView`, `GPSRange`, `Iterable`
+        the times to count
+
+    start : `LIGOTimeGPS`, `int`, `float`, `str`
+        the start of the first bin
+
+    bin_width : `int`, `float`, `fractions.Fraction`, `LIGOTimeGPSLike`
+        the width of each bin in seconds, at least one nanosecond
+
+    nbins : `int`, optional
+        the number of bins, by default just enough to include the latest
+        time
+
+    Returns
+    -------
+    counts : `array.array`
+        the number of times in each bin, with type code ``'q'``
+
+    Raises
+    ------
+    ValueError
+        if ``bin_width`` is less than one nanosecond, or ``nbins`` is
+        negative
+
+    Examples
+    --------
+    >>> histogram([0.5, 1, 1.25, 3.9, -1], 0, 1)
+    array('q', [1, 2, 0, 1])
+    >>> histogram([0.5, 1, 1.25, 3.9, -1], 0, 0.5, nbins=2)
+    array('q', [0, 1])
+    """
+    numerator, denominator = as_integer_ratio(bin_width)
+    # the bin width as an exact ratio of nanoseconds
+    numerator *= NANOSECONDS_PER_SECOND
+    if numerator < denominator:
+        msg = f"bin_width must be at least one nanosecond, not {bin_width!r}"
+        raise ValueError(msg)
+    if nbins is not None and nbins < 0:
+        msg = f"nbins must not be negative, not {nbins}"
+        raise ValueError(msg)
+
+    offset = _as_ns(start)
+    if denominator == 1:
+        # whole nanosecond bins, so the bin index is a floor division
+        indices = (
+            (ns - offset) // numerator
+            for ns in _ns(times)
+        )
+    else:
+        indices = (
+            floor_index(ns - offset, numerator, denominator)
+            for ns in _ns(times)
+        )
+    counter = Counter(indices)
+    if nbins is None:
+        nbins = max(counter, default=-1) + 1
+    return array("q", map(counter.__getitem__, range(nbins)))
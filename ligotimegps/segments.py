@@ -0,0 +1,550 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Half-open time segments, and lists of them, on integer nanoseconds."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from typing import (
+    TYPE_CHECKING,
+    overload,
+)
+
+from .gpsarray import _as_ns
+from .ligotimegps import LIGOTimeGPS
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Iterable,
+        Iterator,
+    )
+    from typing import Self
+
+    from .gpsarray import GPSOperand
+
+
+class Segment:
+    """A half-open interval ``[start, end)`` of GPS time.
+
+    Parameters
+    ----------
+    start : `LIGOTimeGPS`, `int`, `float`, `str`
+        the start of the segment (inclusive)
+
+    end : `LIGOTimeGPS`, `int`, `float`, `str`
+        the end of the segment (exclusive)
+
+    Raises
+    ------
+    ValueError
+        if ``end`` is before ``start``
+
+    Examples
+    --------
+    >>> seg = Segment(100, 110.5)
+    >>> seg.duration
+    LIGOTimeGPS(10, 500000000)
+    >>> 110 in seg
+    True
+    >>> 110.5 in seg
+    False
+    >>> start, end = seg
+    """
+
+    __slots__ = ("_end", "_start")
+
+    _start: int
+    _end: int
+
+    def __init__(self, start: GPSOperand, end: GPSOperand) -> None:
+        """Create a new `Segment`."""
+        self._start = _as_ns(start)
+        self._end = _as_ns(end)
+        if self._end < self._start:
+            msg = f"segment end ({end!r}) is before start ({start!r})"
+            raise ValueError(msg)
+
+    @classmethod
+    def _from_ns(cls, start: int, end: int) -> Self:
+        """Create a new `Segment` from trusted nanosecond boundaries."""
+        new = object.__new__(cls)
+        new._start = start
+        new._end = end
+        return new
+
+    @property
+    def start(self) -> LIGOTimeGPS:
+        """The start of this segment (inclusive)."""
+        return LIGOTimeGPS.from_ns(self._start)
+
+    @property
+    def end(self) -> LIGOTimeGPS:
+        """The end of this segment (exclusive)."""
+        return LIGOTimeGPS.from_ns(self._end)
+
+    @property
+    def duration(self) -> LIGOTimeGPS:
+        """The duration of this segment."""
+        return LIGOTimeGPS.from_ns(self._end - self._start)
+
+    def ns(self) -> tuple[int, int]:
+        """Return the boundaries of this segment as counts of nanoseconds.
+
+        Examples
+        --------
+        >>> Segment(1, 2.5).ns()
+        (1000000000, 2500000000)
+        """
+        return self._start, self._end
+
+    def __iter__(self) -> Iterator[LIGOTimeGPS]:
+        """Iterate over the start and end of this segment."""
+        yield self.start
+        yield self.end
+
+    def __repr__(self) -> str:
+        """Return a representation of this `Segment`."""
+        return f"{type(self).__name__}({self.start!r}, {self.end!r})"
+
+    def __eq__(self, other: object) -> bool:
+        """Return `True` if ``other`` is a segment with the same boundaries."""
+        if isinstance(other, Segment):
+            return self._start == other._start and self._end == other._end
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Return a hash of this segment."""
+        return hash((self._start, self._end))
+
+    def __bool__(self) -> bool:
+        """Return `True` if this segment has a non-zero duration."""
+        return self._end > self._start
+
+    def __contains__(self, other: object) -> bool:
+        """Return `True` if a time, or a whole segment, is in this segment."""
+        if isinstance(other, Segment):
+            start, end = other.ns()
+            return self._start <= start and end <= self._end
+        try:
+            ns = _as_ns(other)  # type: ignore[arg-type]
+        except (TypeError, ValueError, OverflowError):
+            return False
+        return self._start <= ns < self._end
+
+    def intersects(self, other: Segment) -> bool:
+        """Return `True` if this segment overlaps ``other``.
+
+        Segments that only touch at a boundary do not intersect.
+
+        Examples
+        --------
+        >>> Segment(0, 10).intersects(Segment(5, 15))
+        True
+        >>> Segment(0, 10).intersects(Segment(10, 15))
+        False
+        """
+        return (
+            max(self._start, other._start) < min(self._end, other._end)
+        )
+
+
+if TYPE_CHECKING:
+    SegmentLike = Segment | tuple[GPSOperand, GPSOperand]
+
+
+def _segment_ns(segment: SegmentLike) -> tuple[int, int]:
+    """Return the boundaries of a segment-like object in nanoseconds."""
+    if isinstance(segment, Segment):
+        return segment.ns()
+    start, end = segment
+    return _as_ns(start), _as_ns(end)
+
+
+def _coalesce(segments: Iterable[tuple[int, int]]) -> array[int]:
+    """Return the flattened, coalesced boundaries of some segments.
+
+    Empty segments are dropped, and overlapping or touching segments
+    are merged.
+    """
+    boundaries = array("q")
+    append = boundaries.append
+    current_start = current_end = 0
+    for start, end in sorted(segments):
+        if end < start:
+            msg = f"segment end ({end}) is before start ({start}) [ns]"
+            raise ValueError(msg)
+        if start == end:
+            continue
+        if not boundaries and current_start == current_end:
+            # first non-empty segment
+            current_start, current_end = start, end
+        elif start > current_end:
+            append(current_start)
+            append(current_end)
+            current_start, current_end = start, end
+        elif end > current_end:
+            current_end = end
+    if current_end > current_start:
+        append(current_start)
+        append(current_end)
+    return boundaries
+
+
+def _sweep(
+    left: array[int],
+    right: array[int],
+    keep: tuple[int, int, int, int],
+) -> array[int]:
+    """Combine two sets of coalesced boundaries in a single linear sweep.
+
+    Each boundary toggles whether the sweep is inside a segment of its
+    list, so after consuming ``i`` boundaries of ``left`` the sweep is
+    inside ``left`` if ``i`` is odd.
+    ``keep[2 * inside_left + inside_right]`` is the truth table that
+    decides whether the sweep is inside the result, and a boundary is
+    emitted whenever that changes.
+    """
+    out = array("q")
+    append = out.append
+    nleft = len(left)
+    nright = len(right)
+    i = j = 0
+    inside = 0
+    while i < nleft or j < nright:
+        if j == nright or (i < nleft and left[i] < right[j]):
+            time = left[i]
+            i += 1
+        elif i == nleft or right[j] < left[i]:
+            time = right[j]
+            j += 1
+        else:
+            time = left[i]
+            i += 1
+            j += 1
+        state = keep[((i & 1) << 1) | (j & 1)]
+        if state != inside:
+            append(time)
+            inside = state
+    return out
+
+
+# truth tables for _sweep, indexed by 2 * inside_left + inside_right
+_UNION = (0, 1, 1, 1)
+_INTERSECTION = (0, 0, 0, 1)
+_DIFFERENCE = (0, 0, 1, 0)
+_SYMMETRIC_DIFFERENCE = (0, 1, 1, 0)
+
+
+class SegmentList:
+    """A sorted list of disjoint half-open segments of GPS time.
+
+    The segments are always stored coalesced: sorted by start, with
+    overlapping or touching segments merged and empty segments dropped.
+    The boundaries are stored as a single flattened sequence of 64-bit
+    integer nanoseconds ``[start0, end0, start1, end1, ...]``, so that
+    set operations (``|``, ``&``, ``-``, ``^``) are linear sweeps over
+    integers, and membership queries are a single binary search.
+
+    Parameters
+    ----------
+    segments : `Iterable` of `Segment`, or ``(start, end)`` pairs
+        the segments to store, in any order
+
+    Raises
+    ------
+    ValueError
+        if any segment ends before it starts
+
+    Examples
+    --------
+    >>> science = SegmentList([(0, 100), (200, 300), (50, 150)])
+    >>> science[0]
+    Segment(LIGOTimeGPS(0, 0), LIGOTimeGPS(150, 0))
+    >>> len(science)
+    2
+    >>> vetoes = SegmentList([(90, 210)])
+    >>> (science - vetoes).ns()
+    array('q', [0, 90000000000, 210000000000, 300000000000])
+    >>> 250 in science - vetoes
+    True
+    >>> (science & vetoes).duration
+    LIGOTimeGPS(70, 0)
+    """
+
+    __slots__ = ("_boundaries",)
+
+    _boundaries: array[int]
+
+    def __init__(self, segments: Iterable[SegmentLike] = ()) -> None:
+        """Create a new `SegmentList`."""
+        if isinstance(segments, SegmentList):
+            self._boundaries = segments.ns()
+        else:
+            self._boundaries = _coalesce(map(_segment_ns, segments))
+
+    @classmethod
+    def from_ns(cls, boundaries: Iterable[int]) -> Self:
+        """Create a new `SegmentList` from flattened nanosecond boundaries.
+
+        Parameters
+        ----------
+        boundaries : `Iterable` of `int`
+            the boundaries ``[start0, end0, start1, end1, ...]`` in
+            nanoseconds, need not be sorted or coalesced
+
+        Returns
+        -------
+        segments : `SegmentList`
+            a new segment list
+
+        Raises
+        ------
+        ValueError
+            if the number of boundaries is odd
+
+        Examples
+        --------
+        >>> SegmentList.from_ns([0, 1000000000])
+        SegmentList([Segment(LIGOTimeGPS(0, 0), LIGOTimeGPS(1, 0))])
+        """
+        values = array("q", boundaries)
+        if len(values) % 2:
+            msg = "boundaries must contain an even number of values"
+            raise ValueError(msg)
+        it = iter(values)
+        return cls._from_boundaries(_coalesce(zip(it, it, strict=True)))
+
+    @classmethod
+    def _from_boundaries(cls, boundaries: array[int]) -> Self:
+        """Create a new `SegmentList` that takes ownership of boundaries.
+
+        ``boundaries`` must already be sorted and coalesced, and no other
+        object may modify it.
+        """
+        new = object.__new__(cls)
+        new._boundaries = boundaries
+        return new
+
+    @classmethod
+    def _coerce(cls, other: object) -> Self | None:
+        """Return ``other`` as a `SegmentList`, or `None` if not possible."""
+        if isinstance(other, cls):
+            return other
+        if isinstance(other, (SegmentList, list, tuple)):
+            return cls(other)  # type: ignore[arg-type]
+        return None
+
+    # -- sequence --------------------
+
+    def __len__(self) -> int:
+        """Return the number of segments in this list."""
+        return len(self._boundaries) // 2
+
+    def __bool__(self) -> bool:
+        """Return `True` if this list contains any segments."""
+        return bool(self._boundaries)
+
+    @overload
+    def __getitem__(self, index: int) -> Segment: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Self: ...
+
+    def __getitem__(self, index: int | slice) -> Segment | Self:
+        """Return a single `Segment`, or a `SegmentList` for a slice."""
+        boundaries = self._boundaries
+        if isinstance(index, slice):
+            out = array("q")
+            for i in range(*index.indices(len(self))):
+                out.extend(boundaries[2 * i:2 * i + 2])
+            if index.step is not None and index.step < 0:
+                return type(self).from_ns(out)
+            return self._from_boundaries(out)
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            msg = "SegmentList index out of range"
+            raise IndexError(msg)
+        return Segment._from_ns(boundaries[2 * index], boundaries[2 * index + 1])  # noqa: SLF001
+
+    def __iter__(self) -> Iterator[Segment]:
+        """Iterate over the segments in this list."""
+        it = iter(self._boundaries)
+        from_ns = Segment._from_ns  # noqa: SLF001
+        return (from_ns(start, end) for start, end in zip(it, it, strict=True))
+
+    def __repr__(self) -> str:
+        """Return a representation of this `SegmentList`."""
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def __eq__(self, other: object) -> bool:
+        """Return `True` if ``other`` contains the same segments."""
+        if isinstance(other, SegmentList):
+            return self._boundaries == other._boundaries
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    # -- attributes ------------------
+
+    @property
+    def duration(self) -> LIGOTimeGPS:
+        """The total duration of all segments in this list."""
+        boundaries = self._boundaries
+        return LIGOTimeGPS.from_ns(
+            sum(boundaries[1::2]) - sum(boundaries[0::2]),
+        )
+
+    def extent(self) -> Segment:
+        """Return the smallest `Segment` that contains this whole list.
+
+        Raises
+        ------
+        ValueError
+            if this list is empty
+        """
+        if not self._boundaries:
+            msg = "empty SegmentList has no extent"
+            raise ValueError(msg)
+        return Segment._from_ns(self._boundaries[0], self._boundaries[-1])  # noqa: SLF001
+
+    def ns(self) -> array[int]:
+        """Return the flattened segment boundaries as counts of nanoseconds.
+
+        Returns
+        -------
+        boundaries : `array.array`
+            a copy of the boundaries ``[start0, end0, start1, end1, ...]``,
+            with type code ``'q'``
+        """
+        return array("q", self._boundaries)
+
+    # -- membership ------------------
+
+    def find(self, time: GPSOperand) -> int:
+        """Return the index of the segment containing ``time``.
+
+        Raises
+        ------
+        ValueError
+            if ``time`` is not in any segment
+
+        Examples
+        --------
+        >>> SegmentList([(0, 10), (20, 30)]).find(25)
+        1
+        """
+        index = bisect_right(self._boundaries, _as_ns(time))
+        if not index & 1:
+            msg = f"{time!r} is not in any segment"
+            raise ValueError(msg)
+        return index // 2
+
+    def __contains__(self, other: object) -> bool:
+        """Return `True` if a time, or a whole segment, is in this list.
+
+        A `Segment` is contained if it lies entirely within a single
+        segment of this list.
+        """
+        boundaries = self._boundaries
+        if isinstance(other, Segment):
+            start, end = other.ns()
+            index = bisect_right(boundaries, start)
+            return bool(index & 1) and end <= boundaries[index]
+        try:
+            ns = _as_ns(other)  # type: ignore[arg-type]
+        except (TypeError, ValueError, OverflowError):
+            return False
+        return bool(bisect_right(boundaries, ns) & 1)
+
+    def intersects(self, segment: SegmentLike) -> bool:
+        """Return `True` if any segment in this list overlaps ``segment``.
+
+        Examples
+        --------
+        >>> segments = SegmentList([(0, 10), (20, 30)])
+        >>> segments.intersects((12, 18))
+        False
+        >>> segments.intersects(Segment(15, 25))
+        True
+        """
+        start, end = _segment_ns(segment)
+        if start >= end:
+            return False
+        boundaries = self._boundaries
+        index = bisect_right(boundaries, start)
+        if index & 1:
+            return True
+        return index < len(boundaries) and boundaries[index] < end
+
+    # -- set operations --------------
+
+    def _operate(
+        self,
+        other: object,
+        keep: tuple[int, int, int, int],
+    ) -> Self:
+        coerced = self._coerce(other)
+        if coerced is None:
+            return NotImplemented
+        return self._from_boundaries(
+            _sweep(self._boundaries, coerced._boundaries, keep),  # noqa: SLF001
+        )
+
+    def __or__(self, other: SegmentList | Iterable[SegmentLike]) -> Self:
+        """Return the union of this list and ``other``."""
+        return self._operate(other, _UNION)
+
+    def __and__(self, other: SegmentList | Iterable[SegmentLike]) -> Self:
+        """Return the intersection of this list and ``other``."""
+        return self._operate(other, _INTERSECTION)
+
+    def __sub__(self, other: SegmentList | Iterable[SegmentLike]) -> Self:
+        """Return the times in this list that are not in ``other``."""
+        return self._operate(other, _DIFFERENCE)
+
+    def __xor__(self, other: SegmentList | Iterable[SegmentLike]) -> Self:
+        """Return the times in exactly one of this list and ``other``."""
+        return self._operate(other, _SYMMETRIC_DIFFERENCE)
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    def __rsub__(self, other: SegmentList | Iterable[SegmentLike]) -> Self:
+        """Return the times in ``other`` that are not in this list."""
+        coerced = self._coerce(other)
+        if coerced is None:
+            return NotImplemented
+        return coerced - self
+
+    def complement(self, span: SegmentLike) -> Self:
+        """Return the times within ``span`` that are not in this list.
+
+        Examples
+        --------
+        >>> SegmentList([(10, 20)]).complement((0, 100)).ns()
+        array('q', [0, 10000000000, 20000000000, 100000000000])
+        """
+        return self._from_boundaries(_sweep(
+            _coalesce([_segment_ns(span)]),
+            self._boundaries,
+            _DIFFERENCE,
+        ))
@@ -0,0 +1,179 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for `ligotimegps.buffer`."""
+
+from array import array
+
+import pytest
+
+from .. import (
+    LIGOTimeGPS,
+    LIGOTimeGPSArray,
+    LIGOTimeGPSView,
+    from_ns_array,
+    to_ns_array,
+)
+
+NS = [1000000000123456789, -1, 0, 2 ** 63 - 1, -(2 ** 63)]
+TIMES = [LIGOTimeGPS.from_ns(ns) for ns in NS]
+
+
+@pytest.mark.parametrize("buffer", [
+    pytest.param(array("q", NS), id="array"),
+    pytest.param(memoryview(array("q", NS)), id="memoryview"),
+    pytest.param(
+        memoryview(bytearray(array("q", NS).tobytes())).cast("q"),
+        id="bytearray",
+    ),
+])
+def test_from_ns_array(buffer):
+    """Test `from_ns_array`."""
+    times = from_ns_array(buffer)
+    assert isinstance(times, LIGOTimeGPSArray)
+    assert list(times) == TIMES
+    # check that the data were copied
+    memoryview(buffer).cast("B")[:8] = bytes(8)
+    assert list(times) == TIMES
+
+
+def test_from_ns_array_numpy():
+    """Test `from_ns_array` with a NumPy array."""
+    numpy = pytest.importorskip("numpy")
+    times = from_ns_array(numpy.array(NS, dtype="int64"))
+    assert list(times) == TIMES
+
+
+@pytest.mark.parametrize(("buffer", "error", "match"), [
+    pytest.param([1, 2], TypeError, "bytes-like", id="list"),
+    pytest.param(b"12345678", TypeError, "format 'B'", id="bytes"),
+    pytest.param(array("i", [1, 2]), TypeError, "format 'i'", id="int32"),
+    pytest.param(array("d", [1, 2]), TypeError, "format 'd'", id="float64"),
+    pytest.param(
+        memoryview(array("q", range(4))).cast("B").cast("q", (2, 2)),
+        ValueError,
+        "one-dimensional",
+        id="2d",
+    ),
+    pytest.param(
+        memoryview(array("q", range(4)))[::2],
+        ValueError,
+        "C-contiguous",
+        id="strided",
+    ),
+])
+def test_from_ns_array_error(buffer, error, match):
+    """Test `from_ns_array` errors."""
+    with pytest.raises(error, match=match):
+        from_ns_array(buffer)
+
+
+@pytest.mark.parametrize("times", [
+    pytest.param(LIGOTimeGPSArray(TIMES), id="LIGOTimeGPSArray"),
+    pytest.param(LIGOTimeGPSView(array("q", NS)), id="LIGOTimeGPSView"),
+    pytest.param(TIMES, id="list"),
+    pytest.param(iter(TIMES), id="iterator"),
+])
+def test_to_ns_array(times):
+    """Test `to_ns_array`."""
+    ns = to_ns_array(times)
+    assert isinstance(ns, array)
+    assert ns.typecode == "q"
+    assert ns.tolist() == NS
+
+
+def test_to_ns_array_mixed():
+    """Test `to_ns_array` with mixed input types."""
+    assert to_ns_array([1, 0.5, "-1.5", LIGOTimeGPS(2, 3)]).tolist() == [
+        1000000000,
+        500000000,
+        -1500000000,
+        2000000003,
+    ]
+
+
+def test_to_ns_array_nocopy():
+    """Test `to_ns_array` with ``copy=False`` shares memory."""
+    data = array("q", NS)
+    ns = to_ns_array(LIGOTimeGPSView(data), copy=False)
+    assert isinstance(ns, memoryview)
+    assert ns.readonly
+    data[0] = 1
+    assert ns[0] == 1
+
+    times = LIGOTimeGPSArray(TIMES)
+    ns = to_ns_array(times, copy=False)
+    assert ns.readonly
+    assert ns.tolist() == NS
+    # the memory is shared with the array, so resizing is blocked
+    with pytest.raises(BufferError):
+        times._ns.append(0)  # noqa: SLF001
+
+
+def test_to_ns_array_numpy():
+    """Test that `to_ns_array` output can be wrapped by NumPy."""
+    numpy = pytest.importorskip("numpy")
+    ns = to_ns_array(LIGOTimeGPSArray(TIMES), copy=False)
+    assert numpy.frombuffer(ns, dtype="int64").tolist() == NS
+
+
+def test_view():
+    """Test `LIGOTimeGPSView`."""
+    data = array("q", NS)
+    view = LIGOTimeGPSView(data)
+    assert len(view) == len(NS)
+    assert view[0] == TIMES[0]
+    assert view[-1] == TIMES[-1]
+    assert list(view) == TIMES
+    assert view.ns().tolist() == NS
+
+    # changes to the buffer are visible through the view
+    data[1] = 1500000000
+    assert view[1] == LIGOTimeGPS(1, 500000000)
+
+
+def test_view_slice():
+    """Test that slicing a `LIGOTimeGPSView` returns a view."""
+    data = array("q", NS)
+    view = LIGOTimeGPSView(data)[1::2]
+    assert isinstance(view, LIGOTimeGPSView)
+    assert list(view) == TIMES[1::2]
+    data[1] = 0
+    assert view[0] == LIGOTimeGPS(0)
+
+
+def test_view_readonly():
+    """Test that a `LIGOTimeGPSView` can't modify its buffer."""
+    view = LIGOTimeGPSView(array("q", NS))
+    with pytest.raises(TypeError):
+        view.ns()[0] = 1
+
+
+def test_view_to_array():
+    """Test `LIGOTimeGPSView.to_array`."""
+    data = array("q", NS)
+    times = LIGOTimeGPSView(data).to_array()
+    assert isinstance(times, LIGOTimeGPSArray)
+    data[0] = 0
+    assert list(times) == TIMES
+
+
+def test_view_repr():
+    """Test ``repr(LIGOTimeGPSView)``."""
+    assert repr(LIGOTimeGPSView(array("q", [1]))) == (
+        "LIGOTimeGPSView([LIGOTimeGPS(0, 1)])"
+    )
@@ -0,0 +1,112 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for `ligotimegps.coincidences`."""
+
+import random
+from itertools import product
+
+import pytest
+
+from .. import (
+    GPSRange,
+    LIGOTimeGPS,
+    LIGOTimeGPSArray,
+    coincidences,
+)
+
+
+def _brute_force(streams, window, shifts):
+    """Return the set of coincidences by testing every combination."""
+    shifted = [
+        [(t + shift).ns() for t in stream]
+        for stream, shift in zip(streams, shifts, strict=True)
+    ]
+    window = window.ns()
+    result = set()
+    for match in product(*(range(len(s)) for s in streams)):
+        times = [s[i] for s, i in zip(shifted, match, strict=True)]
+        if max(times) - min(times) <= window:
+            result.add(match)
+    return result
+
+
+def _as_set(indices):
+    """Return the output of `coincidences` as a set of tuples."""
+    result = list(zip(*indices, strict=True))
+    assert len(result) == len(set(result)), "duplicate coincidences"
+    return set(result)
+
+
+@pytest.mark.parametrize("nstreams", [2, 3, 4])
+def test_coincidences_random(nstreams):
+    """Test `coincidences` against a brute-force search."""
+    rng = random.Random(nstreams)
+    window = LIGOTimeGPS(0, 10000000)
+    for _ in range(10):
+        # integer milliseconds, so there are plenty of exact ties
+        streams = [
+            [LIGOTimeGPS(0, rng.randrange(500) * 1000000) for _ in range(12)]
+            for _ in range(nstreams)
+        ]
+        shifts = [LIGOTimeGPS(0, rng.randrange(-5, 5) * 1000000)
+                  for _ in range(nstreams)]
+        assert _as_set(coincidences(*streams, window=window)) == (
+            _brute_force(streams, window, [0] * nstreams)
+        )
+        assert _as_set(
+            coincidences(*streams, window=window, shifts=shifts),
+        ) == _brute_force(streams, window, shifts)
+
+
+def test_coincidences_inclusive():
+    """Test that the window is inclusive and exact."""
+    left = [LIGOTimeGPS(100)]
+    right = [
+        LIGOTimeGPS(100, 10000000),
+        LIGOTimeGPS(100, 10000001),
+        LIGOTimeGPS(99, 990000000),
+        LIGOTimeGPS(99, 989999999),
+    ]
+    assert _as_set(coincidences(left, right, window=0.01)) == {(0, 0), (0, 2)}
+    assert _as_set(coincidences(left, right, window=0)) == set()
+
+
+def test_coincidences_types():
+    """Test `coincidences` with different stream types."""
+    left = GPSRange(0, 10, 1)
+    right = LIGOTimeGPSArray([2.5, 7.25])
+    indices = coincidences(left, right, window="0.5")
+    assert _as_set(indices) == {(2, 0), (3, 0), (7, 1)}
+    assert [i.typecode for i in indices] == ["q", "q"]
+
+
+def test_coincidences_empty():
+    """Test `coincidences` with an empty stream."""
+    assert coincidences([], [1, 2], window=1) == coincidences([1], [], window=1)
+    assert _as_set(coincidences([], [1, 2], window=1)) == set()
+
+
+@pytest.mark.parametrize(("args", "kwargs", "match"), [
+    (([1],), {"window": 1}, "at least two streams"),
+    (([1], [1]), {"window": -1}, "must not be negative"),
+    (([1], [1]), {"window": 1, "shifts": [0]}, "got 1 shifts for 2 streams"),
+])
+def test_coincidences_error(args, kwargs, match):
+    """Test `coincidences` errors."""
+    with pytest.raises(ValueError, match=match):
+        coincidences(*args, **kwargs)
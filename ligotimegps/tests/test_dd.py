@@ -0,0 +1,176 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for `ligotimegps.dd`."""
+
+import random
+from array import array
+from fractions import Fraction
+
+import pytest
+
+from .. import (
+    GPSRange,
+    LIGOTimeGPS,
+    LIGOTimeGPSArray,
+    dd_add,
+    dd_div,
+    dd_mul,
+    dd_sub,
+    from_dd_arrays,
+    to_dd_arrays,
+)
+
+U = Fraction(1, 2 ** 53)
+
+RNG = random.Random(0)
+NS = [RNG.randrange(-10 ** 18, 10 ** 18) for _ in range(200)] + [
+    0,
+    1,
+    -1,
+    1400000000123456789,
+]
+FACTORS = [RNG.uniform(-1e4, 1e4) for _ in NS]
+TIMES = LIGOTimeGPSArray.from_ns(NS)
+
+
+def _exact(pair):
+    """Return the exact value of a double-double."""
+    return Fraction(pair[0]) + Fraction(pair[1])
+
+
+def _check(pair, exact, bound):
+    """Check that a double-double is a normalised approximation of exact."""
+    hi, lo = pair
+    assert hi + lo == hi
+    assert abs(_exact(pair) - exact) <= bound * abs(exact)
+
+
+def test_to_dd():
+    """Test `LIGOTimeGPS.to_dd` is accurate to ``u ** 2``."""
+    for ns in NS:
+        pair = LIGOTimeGPS.from_ns(ns).to_dd()
+        _check(pair, Fraction(ns, 10 ** 9), U ** 2)
+        assert pair[0] == ns / 10 ** 9
+
+
+def test_from_dd():
+    """Test `LIGOTimeGPS.from_dd` round-trips `LIGOTimeGPS.to_dd`."""
+    for ns in NS:
+        gps = LIGOTimeGPS.from_ns(ns)
+        assert LIGOTimeGPS.from_dd(*gps.to_dd()) == gps
+    assert LIGOTimeGPS.from_dd(1.5) == LIGOTimeGPS(1, 500000000)
+    assert LIGOTimeGPS.from_dd(1., 4.9e-10) == LIGOTimeGPS(1, 0)
+    assert LIGOTimeGPS.from_dd(1., 5.1e-10) == LIGOTimeGPS(1, 1)
+
+
+@pytest.mark.parametrize(("value", "error"), [
+    (float("nan"), ValueError),
+    (float("inf"), OverflowError),
+])
+def test_from_dd_error(value, error):
+    """Test that `LIGOTimeGPS.from_dd` rejects non-finite parts."""
+    with pytest.raises(error):
+        LIGOTimeGPS.from_dd(0., value)
+
+
+def test_dd_add_sub():
+    """Test `dd_add` and `dd_sub` are accurate to ``3 * u ** 2``."""
+    bound = 3 * U ** 2 / (1 - 4 * U)
+    for a, b in zip(NS, reversed(NS), strict=True):
+        x = LIGOTimeGPS.from_ns(a).to_dd()
+        y = LIGOTimeGPS.from_ns(b).to_dd()
+        _check(dd_add(x, y), _exact(x) + _exact(y), bound)
+        _check(dd_sub(x, y), _exact(x) - _exact(y), bound)
+        assert LIGOTimeGPS.from_dd(*dd_sub(x, y)) == LIGOTimeGPS.from_ns(a - b)
+
+
+def test_dd_mul_div():
+    """Test `dd_mul` and `dd_div` against exact arithmetic."""
+    for ns, factor in zip(NS, FACTORS, strict=True):
+        x = LIGOTimeGPS.from_ns(ns).to_dd()
+        _check(dd_mul(x, factor), _exact(x) * Fraction(factor), 2 * U ** 2)
+        _check(dd_div(x, factor), _exact(x) / Fraction(factor), 3.5 * U ** 2)
+
+
+def test_dd_div_zero():
+    """Test that `dd_div` by zero raises `ZeroDivisionError`."""
+    with pytest.raises(ZeroDivisionError):
+        dd_div((1., 0.), 0.)
+
+
+def test_arrays():
+    """Test the ``dd_*`` functions on `array.array` match floats."""
+    x = to_dd_arrays(TIMES)
+    y = to_dd_arrays(reversed(TIMES))
+    factors = array("d", FACTORS)
+    for func, other in (
+        (dd_add, y),
+        (dd_sub, y),
+        (dd_mul, factors),
+        (dd_mul, 3.),
+        (dd_div, factors),
+        (dd_div, 3.),
+    ):
+        hi, lo = func(x, other)
+        assert isinstance(hi, array)
+        assert isinstance(lo, array)
+        assert list(zip(hi, lo, strict=True)) == [
+            func(
+                (x[0][i], x[1][i]),
+                other if isinstance(other, float) else (
+                    other[i] if isinstance(other, array)
+                    else (other[0][i], other[1][i])
+                ),
+            )
+            for i in range(len(NS))
+        ]
+
+
+def test_arrays_length_mismatch():
+    """Test that array operands of different lengths are rejected."""
+    x = to_dd_arrays(TIMES)
+    with pytest.raises(ValueError, match="could not be broadcast"):
+        dd_mul(x, array("d", [1.]))
+
+
+def test_to_dd_arrays():
+    """Test `to_dd_arrays` matches `LIGOTimeGPS.to_dd`."""
+    hi, lo = to_dd_arrays(GPSRange(0, 1, 0.1))
+    assert hi.typecode == lo.typecode == "d"
+    assert list(zip(hi, lo, strict=True)) == [
+        LIGOTimeGPS(0, n * 100000000).to_dd() for n in range(10)
+    ]
+
+
+def test_from_dd_arrays():
+    """Test `from_dd_arrays` round-trips `to_dd_arrays`."""
+    assert from_dd_arrays(*to_dd_arrays(TIMES)).ns() == TIMES.ns()
+    with pytest.raises(ValueError, match="shorter"):
+        from_dd_arrays([1.], [])
+
+
+def test_numpy():
+    """Test the ``dd_*`` functions on `numpy.ndarray` match floats."""
+    numpy = pytest.importorskip("numpy")
+    hi, lo = map(numpy.frombuffer, to_dd_arrays(TIMES))
+    factors = numpy.asarray(FACTORS)
+    result = dd_div(dd_mul(dd_add((hi, lo), (hi, lo)), factors), 3.)
+    assert list(zip(*result, strict=True)) == [
+        dd_div(dd_mul(dd_add(x, x), f), 3.)
+        for x, f in zip(zip(hi, lo, strict=True), FACTORS, strict=True)
+    ]
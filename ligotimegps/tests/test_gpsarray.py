@@ -0,0 +1,302 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for `ligotimegps.LIGOTimeGPSArray`."""
+
+from array import array
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from .. import (
+    LIGOTimeGPS,
+    LIGOTimeGPSArray,
+)
+
+TIMES = [
+    LIGOTimeGPS(1000000000, 123456789),
+    LIGOTimeGPS(-1, 500000000),
+    LIGOTimeGPS(-3, 999999999),
+    LIGOTimeGPS(0),
+    LIGOTimeGPS(12345, 500000000),
+]
+
+
+@pytest.fixture
+def times():
+    """Return a `LIGOTimeGPSArray` of `TIMES`."""
+    return LIGOTimeGPSArray(TIMES)
+
+
+@pytest.mark.parametrize("value", [
+    pytest.param(LIGOTimeGPS(1, 2), id="LIGOTimeGPS"),
+    pytest.param(1, id="int"),
+    pytest.param(1.002, id="float"),
+    pytest.param("1.234", id="str"),
+    pytest.param(b"-1.234", id="bytes"),
+])
+def test_creation(value):
+    """Test `LIGOTimeGPSArray` creation from different types."""
+    arr = LIGOTimeGPSArray([value])
+    assert len(arr) == 1
+    assert arr[0] == LIGOTimeGPS(value)
+
+
+def test_creation_protocol():
+    """Test `LIGOTimeGPSArray` creation from a `LIGOTimeGPSLike`."""
+
+    class Time:
+        gpsSeconds = 10  # noqa: N815
+        gpsNanoSeconds = 20  # noqa: N815
+
+    assert LIGOTimeGPSArray([Time()]).ns().tolist() == [10000000020]
+
+
+def test_creation_error():
+    """Test `LIGOTimeGPSArray` creation errors."""
+    with pytest.raises(TypeError, match="cannot convert None"):
+        LIGOTimeGPSArray([None])
+
+
+def test_copy(times):
+    """Test that creating from another array copies the data."""
+    copy = LIGOTimeGPSArray(times)
+    assert copy is not times
+    assert copy.ns() == times.ns()
+
+
+def test_from_ns():
+    """Test `LIGOTimeGPSArray.from_ns`."""
+    arr = LIGOTimeGPSArray.from_ns([-500000000, 1500000000])
+    assert list(arr) == [LIGOTimeGPS(-1, 500000000), LIGOTimeGPS(1, 500000000)]
+
+
+def test_getitem(times):
+    """Test that indexing returns `LIGOTimeGPS` objects."""
+    for i, ref in enumerate(TIMES):
+        item = times[i]
+        assert isinstance(item, LIGOTimeGPS)
+        assert (item.gpsSeconds, item.gpsNanoSeconds) == (
+            ref.gpsSeconds,
+            ref.gpsNanoSeconds,
+        )
+    assert times[-1] == TIMES[-1]
+
+
+def test_getitem_slice(times):
+    """Test that slicing returns a new `LIGOTimeGPSArray`."""
+    sub = times[1:4:2]
+    assert isinstance(sub, LIGOTimeGPSArray)
+    assert list(sub) == TIMES[1:4:2]
+
+
+def test_parts(times):
+    """Test `LIGOTimeGPSArray.seconds` and `LIGOTimeGPSArray.nanoseconds`."""
+    assert times.seconds().tolist() == [t.gpsSeconds for t in TIMES]
+    assert times.nanoseconds().tolist() == [t.gpsNanoSeconds for t in TIMES]
+
+
+def test_ns(times):
+    """Test `LIGOTimeGPSArray.ns`."""
+    ns = times.ns()
+    assert isinstance(ns, array)
+    assert ns.typecode == "q"
+    assert ns.tolist() == [t.ns() for t in TIMES]
+
+
+def test_float(times):
+    """Test `LIGOTimeGPSArray.float`."""
+    assert times.float().tolist() == [float(t) for t in TIMES]
+
+
+def test_repr():
+    """Test ``repr(x)``."""
+    assert repr(LIGOTimeGPSArray([1])) == (
+        "LIGOTimeGPSArray([LIGOTimeGPS(1, 0)])"
+    )
+
+
+@pytest.mark.parametrize("other", [
+    LIGOTimeGPS(1, 600000000),
+    2,
+    0.75,
+    "-1.5",
+])
+@pytest.mark.parametrize("op", [
+    pytest.param(lambda a, b: a + b, id="add"),
+    pytest.param(lambda a, b: a - b, id="sub"),
+])
+def test_arithmetic_scalar(times, other, op):
+    """Test arithmetic with a scalar matches `LIGOTimeGPS`."""
+    result = op(times, other)
+    assert isinstance(result, LIGOTimeGPSArray)
+    assert list(result) == [op(t, other) for t in TIMES]
+
+
+@pytest.mark.parametrize("other", [2, 0.75, "-1.5"])
+@pytest.mark.parametrize("op", [
+    pytest.param(lambda a, b: b + a, id="radd"),
+    pytest.param(lambda a, b: b - a, id="rsub"),
+])
+def test_arithmetic_scalar_reflected(times, other, op):
+    """Test reflected arithmetic with a scalar matches `LIGOTimeGPS`."""
+    result = op(times, other)
+    assert isinstance(result, LIGOTimeGPSArray)
+    assert list(result) == [op(t, other) for t in TIMES]
+
+
+def test_arithmetic_array(times):
+    """Test element-wise arithmetic between arrays."""
+    other = list(reversed(TIMES))
+    assert list(times + LIGOTimeGPSArray(other)) == [
+        a + b for a, b in zip(TIMES, other, strict=True)
+    ]
+    assert list(times - other) == [
+        a - b for a, b in zip(TIMES, other, strict=True)
+    ]
+
+
+def test_arithmetic_length_mismatch(times):
+    """Test that arithmetic between arrays of different lengths fails."""
+    with pytest.raises(ValueError, match="could not be broadcast"):
+        times + times[:2]
+
+
+@pytest.mark.parametrize("op", [
+    pytest.param(lambda a: -a, id="neg"),
+    pytest.param(lambda a: +a, id="pos"),
+    pytest.param(abs, id="abs"),
+    pytest.param(round, id="round"),
+    pytest.param(lambda a: round(a, 3), id="round-3"),
+    pytest.param(lambda a: round(a, 8), id="round-8"),
+])
+def test_unary(times, op):
+    """Test unary operations match `LIGOTimeGPS`."""
+    result = op(times)
+    assert isinstance(result, LIGOTimeGPSArray)
+    assert list(result) == [op(t) for t in TIMES]
+
+
+def test_neg(times):
+    """Test unary minus."""
+    result = -times
+    assert isinstance(result, LIGOTimeGPSArray)
+    assert result.ns().tolist() == [-t.ns() for t in TIMES]
+    assert all(-result == times)
+
+
+@pytest.mark.parametrize("other", [
+    LIGOTimeGPS(0),
+    LIGOTimeGPS(12345, 500000000),
+    -2,
+    -0.5,
+    float("inf"),
+    -float("inf"),
+])
+@pytest.mark.parametrize("op", [
+    pytest.param(lambda a, b: a == b, id="eq"),
+    pytest.param(lambda a, b: a != b, id="ne"),
+    pytest.param(lambda a, b: a < b, id="lt"),
+    pytest.param(lambda a, b: a <= b, id="le"),
+    pytest.param(lambda a, b: a > b, id="gt"),
+    pytest.param(lambda a, b: a >= b, id="ge"),
+])
+def test_compare_scalar(times, other, op):
+    """Test comparisons with a scalar match `LIGOTimeGPS`."""
+    assert op(times, other) == [op(t, other) for t in TIMES]
+
+
+@pytest.mark.parametrize("other", [
+    pytest.param(0.1, id="float"),
+    pytest.param(-0.1, id="negative-float"),
+    pytest.param(1126259462.4, id="large-float"),
+    pytest.param(1 / 3, id="inexact-float"),
+    pytest.param(Fraction(1, 10), id="Fraction"),
+    pytest.param(Fraction(1, 3), id="inexact-Fraction"),
+    pytest.param(Fraction(-1, 3), id="negative-Fraction"),
+    pytest.param(Decimal("0.3333333333"), id="Decimal"),
+    pytest.param("0.1", id="str"),
+    pytest.param("0.3333333333", id="precise-str"),
+    pytest.param(b"-0.1", id="bytes"),
+])
+@pytest.mark.parametrize("op", [
+    pytest.param(lambda a, b: a == b, id="eq"),
+    pytest.param(lambda a, b: a != b, id="ne"),
+    pytest.param(lambda a, b: a < b, id="lt"),
+    pytest.param(lambda a, b: a <= b, id="le"),
+    pytest.param(lambda a, b: a > b, id="gt"),
+    pytest.param(lambda a, b: a >= b, id="ge"),
+])
+def test_compare_scalar_rules(other, op):
+    """Test that element-wise comparisons follow the `LIGOTimeGPS` rules."""
+    elements = [
+        LIGOTimeGPS(0.1),
+        LIGOTimeGPS(-0.1),
+        LIGOTimeGPS(1126259462.4),
+        LIGOTimeGPS(1 / 3),
+        LIGOTimeGPS(0, 333333333),
+        LIGOTimeGPS(-1, 666666666),
+        LIGOTimeGPS(0, 333333334),
+    ]
+    arr = LIGOTimeGPSArray(elements)
+    try:
+        expected = [op(element, other) for element in elements]
+    except TypeError:  # not orderable, e.g. strings
+        with pytest.raises(TypeError):
+            op(arr, other)
+        return
+    result = op(arr, other)
+    assert result == expected
+    assert result == [op(arr[i], other) for i in range(len(arr))]
+    # comparisons against a sequence follow the same rules
+    assert op(arr, [other] * len(elements)) == result
+
+
+def test_compare_array(times):
+    """Test element-wise comparisons between arrays."""
+    other = list(reversed(TIMES))
+    assert (times < LIGOTimeGPSArray(other)) == [
+        a < b for a, b in zip(TIMES, other, strict=True)
+    ]
+
+
+def test_compare_nan(times):
+    """Test that comparisons with NaN match `LIGOTimeGPS`."""
+    nan = float("nan")
+    assert (times == nan) == [False] * len(TIMES)
+    assert (times != nan) == [True] * len(TIMES)
+    for op in (
+        LIGOTimeGPSArray.__lt__,
+        LIGOTimeGPSArray.__le__,
+        LIGOTimeGPSArray.__gt__,
+        LIGOTimeGPSArray.__ge__,
+    ):
+        assert op(times, nan) == [False] * len(TIMES)
+
+
+def test_compare_error(times):
+    """Test that ordering against an unsupported type raises `TypeError`."""
+    assert (times == "test") == [False] * len(TIMES)
+    with pytest.raises(TypeError, match="comparison not supported"):
+        times < "test"  # noqa: B015
+
+
+def test_unhashable(times):
+    """Test that a `LIGOTimeGPSArray` cannot be hashed."""
+    with pytest.raises(TypeError):
+        hash(times)
@@ -0,0 +1,170 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for `ligotimegps.gpsfile`."""
+
+from array import array
+from itertools import chain
+
+import pytest
+
+from .. import (
+    GPSRange,
+    LIGOTimeGPS,
+    LIGOTimeGPSArray,
+    LIGOTimeGPSView,
+    pack_many,
+    read_times,
+    write_times,
+)
+
+FORMATS = ["text", "int64", "packed"]
+
+TIMES = [
+    LIGOTimeGPS(-2, 500000000),
+    LIGOTimeGPS(0),
+    LIGOTimeGPS(0, 1),
+    LIGOTimeGPS(1000000000, 123456789),
+    LIGOTimeGPS(1400000000),
+]
+NS = array("q", (t.ns() for t in TIMES))
+
+
+@pytest.fixture(params=FORMATS)
+def fmt(request):
+    """Return each of the supported file formats."""
+    return request.param
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 100])
+def test_roundtrip(tmp_path, fmt, chunk_size):
+    """Test writing and reading times in chunks."""
+    path = tmp_path / "times"
+    assert write_times(path, TIMES, fmt, chunk_size=chunk_size) == len(TIMES)
+    chunks = list(read_times(path, fmt, chunk_size=chunk_size))
+    assert all(len(chunk) <= chunk_size for chunk in chunks)
+    assert all(type(t) is LIGOTimeGPS for t in chain(*chunks))
+    assert list(chain(*chunks)) == TIMES
+    nanoseconds = list(read_times(path, fmt, chunk_size=chunk_size, as_ns=True))
+    assert all(isinstance(chunk, array) for chunk in nanoseconds)
+    assert array("q", chain(*nanoseconds)) == NS
+
+
+@pytest.mark.parametrize("times", [
+    pytest.param(LIGOTimeGPSArray(TIMES), id="LIGOTimeGPSArray"),
+    pytest.param(LIGOTimeGPSView(NS), id="LIGOTimeGPSView"),
+    pytest.param(iter(map(str, TIMES)), id="iterator"),
+])
+def test_write_types(tmp_path, times):
+    """Test writing each type of input."""
+    path = tmp_path / "times.bin"
+    assert write_times(path, times, "int64", chunk_size=2) == len(TIMES)
+    assert path.read_bytes() == NS.tobytes()
+
+
+def test_write_formats(tmp_path):
+    """Test the content of the file written for each format."""
+    path = tmp_path / "times"
+    write_times(path, TIMES[:3])
+    assert path.read_text() == "-1.5\n0\n0.000000001\n"
+    write_times(path, TIMES, "packed")
+    assert path.read_bytes() == pack_many(TIMES)
+
+
+def test_append(tmp_path, fmt):
+    """Test appending to an existing file."""
+    path = tmp_path / "times"
+    write_times(path, TIMES[:2], fmt)
+    write_times(path, TIMES[2:], fmt, append=True)
+    assert list(chain.from_iterable(read_times(path, fmt))) == TIMES
+
+
+@pytest.mark.parametrize(("start", "expected"), [
+    pytest.param(-10, TIMES, id="before"),
+    pytest.param(0, TIMES[1:], id="exact"),
+    pytest.param("0.5", TIMES[3:], id="between"),
+    pytest.param(LIGOTimeGPS(1400000000, 1), [], id="after"),
+])
+@pytest.mark.parametrize("chunk_size", [1, 2, 100])
+def test_start(tmp_path, fmt, start, expected, chunk_size):
+    """Test seeking to the first time at or after ``start``."""
+    path = tmp_path / "times"
+    write_times(path, TIMES, fmt)
+    chunks = list(read_times(path, fmt, chunk_size=chunk_size, start=start))
+    assert all(chunks)
+    assert list(chain(*chunks)) == expected
+
+
+def test_start_large(tmp_path):
+    """Test seeking in a large binary file."""
+    path = tmp_path / "times.bin"
+    times = GPSRange(0, 100, 0.001)
+    write_times(path, times, "packed")
+    chunks = read_times(path, "packed", start=99.9975, chunk_size=10)
+    assert next(chunks) == list(times[99998:])
+    assert next(chunks, None) is None
+
+
+def test_text_blank_lines(tmp_path):
+    """Test that blank lines and whitespace in text files are ignored."""
+    path = tmp_path / "times.txt"
+    path.write_bytes(b"\n 1.5 \n\n\n2\r\n")
+    assert list(read_times(path, chunk_size=2)) == [
+        [LIGOTimeGPS(1.5)],
+        [LIGOTimeGPS(2)],
+    ]
+
+
+def test_text_blank_lines_start(tmp_path):
+    """Test seeking past leading blank lines in a text file."""
+    path = tmp_path / "times.txt"
+    path.write_bytes(b"\n\n1\n2\n3\n4\n")
+    chunks = read_times(path, chunk_size=2, start=3, as_ns=True)
+    assert list(map(list, chunks)) == [[3000000000, 4000000000]]
+
+
+def test_empty(tmp_path, fmt):
+    """Test reading and writing no times."""
+    path = tmp_path / "times"
+    assert write_times(path, [], fmt) == 0
+    assert path.read_bytes() == b""
+    assert list(read_times(path, fmt)) == []
+
+
+@pytest.mark.parametrize(("fmt", "data", "error", "match"), [
+    ("int64", b"\x00" * 9, ValueError, "not a multiple of the 8-byte"),
+    ("packed", b"\x00" * 8, ValueError, "not a multiple of the 12-byte"),
+    ("packed", bytes(8) + b"\xff" * 4, ValueError, "invalid nanoseconds"),
+    ("text", b"1\nabc\n", TypeError, "invalid literal"),
+])
+def test_read_error(tmp_path, fmt, data, error, match):
+    """Test errors when reading invalid files."""
+    path = tmp_path / "times"
+    path.write_bytes(data)
+    with pytest.raises(error, match=match):
+        list(read_times(path, fmt))
+
+
+@pytest.mark.parametrize("func", [read_times, write_times])
+def test_argument_error(tmp_path, func):
+    """Test that invalid arguments are rejected immediately."""
+    path = tmp_path / "times"
+    args = (path,) if func is read_times else (path, TIMES)
+    with pytest.raises(ValueError, match="unsupported format 'csv'"):
+        func(*args, "csv")
+    with pytest.raises(ValueError, match="chunk_size must be positive"):
+        func(*args, chunk_size=0)
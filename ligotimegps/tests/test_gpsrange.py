@@ -0,0 +1,169 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for `ligotimegps.GPSRange`."""
+
+from array import array
+from fractions import Fraction
+
+import pytest
+
+from .. import (
+    GPSRange,
+    LIGOTimeGPS,
+    LIGOTimeGPSArray,
+    to_ns_array,
+)
+from .._exact import as_integer_ratio
+
+START = LIGOTimeGPS(1000000000, 123456789)
+
+
+def _expected(start, stop, step):
+    """Return the expected nanoseconds of a range, by brute force."""
+    step_ns = Fraction(*as_integer_ratio(step)) * 1000000000
+    values = []
+    while True:
+        exact = start.ns() + len(values) * step_ns
+        value = (2 * exact + 1) // 2  # round half up
+        if (step_ns > 0 and value >= stop.ns()) or (
+            step_ns < 0 and value <= stop.ns()
+        ):
+            return values
+        values.append(value)
+
+
+@pytest.mark.parametrize(("stop", "step"), [
+    pytest.param(START + 1, Fraction(1, 64), id="64Hz"),
+    pytest.param(START + 0.01, 1 / 16384, id="float"),
+    pytest.param(START + 10, Fraction(1, 3), id="third"),
+    pytest.param(START + 10, Fraction(7, 3), id="non-dividing"),
+    pytest.param(START + 10, 1, id="int"),
+    pytest.param(START + 0.0001, LIGOTimeGPS(0, 1000), id="LIGOTimeGPS"),
+    pytest.param(START - 10, -0.25, id="negative"),
+    pytest.param(START - 10, Fraction(-4, 3), id="negative-third"),
+    pytest.param(START + LIGOTimeGPS(0, 10), Fraction(3, 1000000000), id="ns"),
+    pytest.param(START, 1, id="empty"),
+    pytest.param(START - 1, 1, id="empty-backwards"),
+])
+def test_range(stop, step):
+    """Test that `GPSRange` elements match the exact brute-force values."""
+    expected = _expected(START, stop, step)
+    times = GPSRange(START, stop, step)
+    assert len(times) == len(expected)
+    assert bool(times) is bool(expected)
+    assert times.ns().tolist() == expected
+    assert [t.ns() for t in times] == expected
+    assert [t.ns() for t in reversed(times)] == expected[::-1]
+    for i, ns in enumerate(expected):
+        assert times[i].ns() == ns
+        assert times[i - len(expected)].ns() == ns
+        assert times.index(LIGOTimeGPS.from_ns(ns)) == i
+        assert LIGOTimeGPS.from_ns(ns) in times
+        assert (LIGOTimeGPS.from_ns(ns + 1) in times) is (ns + 1 in expected)
+
+
+def test_range_no_accumulation():
+    """Test that long ranges don't accumulate rounding error."""
+    times = GPSRange(START, START + 86400, 1 / 16384)
+    assert len(times) == 16384 * 86400
+    assert times[16384 * 3600] == START + 3600
+    assert times[-1] == START + 86400 - LIGOTimeGPS(0, 61035)
+
+
+def test_range_attributes():
+    """Test `GPSRange.start`, `~GPSRange.stop`, and `~GPSRange.step`."""
+    times = GPSRange(1, "2.1", 0.25)
+    assert times.start == LIGOTimeGPS(1)
+    assert times.stop == LIGOTimeGPS(2, 250000000)
+    assert times.step == Fraction(1, 4)
+    assert repr(times) == (
+        "GPSRange(LIGOTimeGPS(1, 0), LIGOTimeGPS(2, 250000000), "
+        "Fraction(1, 4))"
+    )
+
+
+@pytest.mark.parametrize("index", [
+    slice(None),
+    slice(2, None),
+    slice(None, -3),
+    slice(1, 50, 3),
+    slice(None, None, -1),
+    slice(-2, 3, -4),
+    slice(100, 200),
+])
+def test_range_slice(index):
+    """Test slicing a `GPSRange`."""
+    times = GPSRange(START, START + 1, 1 / 64)
+    expected = times.ns().tolist()[index]
+    sliced = times[index]
+    assert isinstance(sliced, GPSRange)
+    assert sliced.ns().tolist() == expected
+    for ns in expected:
+        assert LIGOTimeGPS.from_ns(ns) in sliced
+
+
+def test_range_index_error():
+    """Test that indexing beyond a `GPSRange` raises `IndexError`."""
+    times = GPSRange(0, 1, 0.5)
+    with pytest.raises(IndexError, match="out of range"):
+        times[2]
+    with pytest.raises(IndexError, match="out of range"):
+        times[-3]
+
+
+def test_range_contains():
+    """Test ``x in GPSRange`` with different types."""
+    times = GPSRange(10, 20, 0.5)
+    assert 12 in times
+    assert 12.5 in times
+    assert "12.5" in times
+    assert 12.25 not in times
+    assert 20 not in times
+    assert 9.5 not in times
+    assert None not in times
+    assert "test" not in times
+    assert float("inf") not in times
+    assert times.count(12.5) == 1
+    assert times.count(12.25) == 0
+
+
+def test_range_index_missing():
+    """Test `GPSRange.index` for a time not in the range."""
+    with pytest.raises(ValueError, match="not in GPSRange"):
+        GPSRange(10, 20, 0.5).index(12.25)
+
+
+@pytest.mark.parametrize(("step", "match"), [
+    (0, "must not be zero"),
+    (1e-10, "at least one nanosecond"),
+])
+def test_range_error(step, match):
+    """Test `GPSRange` creation errors."""
+    with pytest.raises(ValueError, match=match):
+        GPSRange(0, 1, step)
+
+
+def test_range_to_array():
+    """Test materialising a `GPSRange` in bulk."""
+    times = GPSRange(START, START + 1, 0.25)
+    ns = to_ns_array(times)
+    assert isinstance(ns, array)
+    assert ns == times.ns()
+    gpsarray = times.to_array()
+    assert isinstance(gpsarray, LIGOTimeGPSArray)
+    assert list(gpsarray) == list(times)
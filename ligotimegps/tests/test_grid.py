@@ -0,0 +1,132 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for `ligotimegps.SampleGrid`."""
+
+from array import array
+from fractions import Fraction
+
+import pytest
+
+from .. import (
+    LIGOTimeGPS,
+    LIGOTimeGPSArray,
+    SampleGrid,
+)
+
+T0 = LIGOTimeGPS(1000000000, 500000000)
+
+
+@pytest.fixture
+def grid():
+    """Return a 16384 Hz `SampleGrid`."""
+    return SampleGrid(T0, 16384)
+
+
+def test_grid(grid):
+    """Test `SampleGrid` attributes."""
+    assert grid.t0 == T0
+    assert grid.rate == 16384
+    assert grid.step == Fraction(1, 16384)
+    assert repr(grid) == "SampleGrid(LIGOTimeGPS(1000000000, 500000000), 16384)"
+
+
+@pytest.mark.parametrize("rate", [0, -1, 2e9])
+def test_grid_error(rate):
+    """Test `SampleGrid` creation errors."""
+    with pytest.raises(ValueError, match="rate must be"):
+        SampleGrid(0, rate)
+
+
+@pytest.mark.parametrize("rate", [16384, 4096, 1, 3, 1000, 0.5, Fraction(7, 3)])
+def test_roundtrip(rate):
+    """Test that `SampleGrid.index` inverts `SampleGrid.time`."""
+    grid = SampleGrid(T0, rate)
+    for index in (-100000, -1, 0, 1, 2, 3, 12345, 10 ** 12):
+        time = grid.time(index)
+        assert grid.index(time) == index
+        assert grid.index(time, rounding="ceil") == index
+        assert grid.index(time, rounding="nearest") == index
+        # one nanosecond either side
+        assert grid.index(time - LIGOTimeGPS(0, 1)) == index - 1
+        assert grid.index(time + LIGOTimeGPS(0, 1), rounding="ceil") == index + 1
+
+
+def test_time_exact(grid):
+    """Test that sample times don't accumulate error."""
+    # 1 day of samples is an exact number of seconds from t0
+    assert grid.time(16384 * 86400) == T0 + 86400
+    # a single sample is 61035.15625 ns, rounded to the nearest ns
+    assert grid.time(1) == T0 + LIGOTimeGPS(0, 61035)
+    assert grid.time(2) == T0 + LIGOTimeGPS(0, 122070)
+    assert grid.time(-1) == T0 - LIGOTimeGPS(0, 61035)
+
+
+@pytest.mark.parametrize(("time", "floor", "ceil", "nearest"), [
+    ("1000000000.5", 0, 0, 0),
+    ("1000000000.50003", 0, 1, 0),
+    ("1000000000.50004", 0, 1, 1),
+    ("1000000000.49999", -1, 0, 0),
+    (1000000001, 8192, 8192, 8192),
+])
+def test_index(grid, time, floor, ceil, nearest):
+    """Test `SampleGrid.index` rounding modes."""
+    assert grid.index(time) == floor
+    assert grid.index(time, rounding="ceil") == ceil
+    assert grid.index(time, rounding="nearest") == nearest
+
+
+def test_index_error(grid):
+    """Test `SampleGrid.index` with an invalid rounding mode."""
+    with pytest.raises(ValueError, match="invalid rounding 'up'"):
+        grid.index(T0, rounding="up")
+
+
+def test_snap(grid):
+    """Test `SampleGrid.snap`."""
+    time = LIGOTimeGPS(1000000000, 500040000)
+    assert grid.snap(time) == T0
+    assert grid.snap(time, "ceil") == grid.time(1)
+    assert grid.snap(time, "nearest") == grid.time(1)
+
+
+def test_snap_matches_method():
+    """Test that a grid at zero matches `LIGOTimeGPS.floor` and friends."""
+    grid = SampleGrid(0, 16384)
+    time = LIGOTimeGPS(1000000000, 123456789)
+    assert grid.snap(time) == time.floor(1 / 16384)
+    assert grid.snap(time, "ceil") == time.ceil(1 / 16384)
+    assert grid.snap(time, "nearest") == time.round_to(1 / 16384)
+
+
+@pytest.mark.parametrize("rounding", ["floor", "ceil", "nearest"])
+def test_indices(grid, rounding):
+    """Test `SampleGrid.indices`."""
+    times = [T0 + x for x in (-1, 0, 0.25, 0.5000001, 100)]
+    indices = grid.indices(times, rounding=rounding)
+    assert isinstance(indices, array)
+    assert indices.typecode == "q"
+    expected = [grid.index(t, rounding=rounding) for t in times]
+    assert indices.tolist() == expected
+    assert grid.indices(LIGOTimeGPSArray(times), rounding).tolist() == expected
+
+
+def test_times(grid):
+    """Test `SampleGrid.times`."""
+    times = grid.times(range(-2, 3))
+    assert isinstance(times, LIGOTimeGPSArray)
+    assert list(times) == [grid.time(i) for i in range(-2, 3)]
@@ -0,0 +1,171 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for `ligotimegps.GPSIndex`."""
+
+import random
+from array import array
+
+import pytest
+
+from .. import (
+    GPSIndex,
+    GPSRange,
+    LIGOTimeGPS,
+    LIGOTimeGPSArray,
+)
+
+TIMES = [
+    LIGOTimeGPS(30),
+    LIGOTimeGPS(10, 500000000),
+    LIGOTimeGPS(20),
+    LIGOTimeGPS(10),
+    LIGOTimeGPS(20),
+]
+
+
+@pytest.fixture
+def index():
+    """Return a `GPSIndex` of `TIMES`."""
+    return GPSIndex(TIMES)
+
+
+def test_index(index):
+    """Test `GPSIndex` creation sorts the times, keeping row IDs."""
+    assert len(index) == 5
+    assert list(index.times()) == sorted(TIMES)
+    # equal times keep their input order
+    assert index.rows().tolist() == [3, 1, 2, 4, 0]
+    assert list(index) == [(TIMES[i], i) for i in [3, 1, 2, 4, 0]]
+    assert repr(index) == "<GPSIndex: 5 times>"
+
+
+@pytest.mark.parametrize("times", [
+    pytest.param(TIMES, id="list"),
+    pytest.param(LIGOTimeGPSArray(TIMES), id="LIGOTimeGPSArray"),
+    pytest.param(["30", 10.5, 20, 10, 20], id="mixed"),
+])
+def test_index_types(times):
+    """Test `GPSIndex` creation from different types."""
+    assert list(GPSIndex(times)) == list(GPSIndex(TIMES))
+
+
+def test_index_range_input():
+    """Test `GPSIndex` creation from a `GPSRange`."""
+    index = GPSIndex(GPSRange(0, 10, 0.5))
+    assert index.count_between(1, 2) == 2
+    assert index.rows() == array("q", range(20))
+
+
+def test_index_rows():
+    """Test `GPSIndex` creation with custom row IDs."""
+    index = GPSIndex(TIMES, rows=[100, 101, 102, 103, 104])
+    assert index.rows().tolist() == [103, 101, 102, 104, 100]
+    with pytest.raises(ValueError, match="rows has length 2"):
+        GPSIndex(TIMES, rows=[1, 2])
+
+
+def test_from_ns():
+    """Test `GPSIndex.from_ns`."""
+    index = GPSIndex.from_ns([2, 1], rows=[7, 8])
+    assert list(index) == [(LIGOTimeGPS(0, 1), 8), (LIGOTimeGPS(0, 2), 7)]
+
+
+@pytest.mark.parametrize(("start", "stop", "rows"), [
+    (10, 20, [3, 1]),
+    (10, 20.5, [3, 1, 2, 4]),
+    (LIGOTimeGPS(10, 1), "30", [1, 2, 4]),
+    (None, 20, [3, 1]),
+    (20, None, [2, 4, 0]),
+    (None, None, [3, 1, 2, 4, 0]),
+    (30, 10, []),
+    (31, 40, []),
+])
+def test_range(index, start, stop, rows):
+    """Test `GPSIndex.range` and friends."""
+    assert index.range(start, stop).tolist() == rows
+    assert index.count_between(start, stop) == len(rows)
+    assert list(index.range_times(start, stop)) == [TIMES[i] for i in rows]
+
+
+@pytest.mark.parametrize(("time", "result"), [
+    (0, (LIGOTimeGPS(10), 3)),
+    (10.2, (LIGOTimeGPS(10), 3)),
+    (10.25, (LIGOTimeGPS(10), 3)),
+    (10.3, (LIGOTimeGPS(10, 500000000), 1)),
+    (20, (LIGOTimeGPS(20), 2)),
+    (25, (LIGOTimeGPS(20), 4)),
+    (26, (LIGOTimeGPS(30), 0)),
+    (1e6, (LIGOTimeGPS(30), 0)),
+])
+def test_nearest(index, time, result):
+    """Test `GPSIndex.nearest`."""
+    assert index.nearest(time) == result
+
+
+def test_nearest_empty():
+    """Test `GPSIndex.nearest` on an empty index."""
+    with pytest.raises(ValueError, match="empty GPSIndex"):
+        GPSIndex().nearest(0)
+
+
+def test_contains(index):
+    """Test ``x in GPSIndex``."""
+    assert 10 in index
+    assert "10.5" in index
+    assert 11 not in index
+    assert 100 not in index
+    assert None not in index
+
+
+def test_insert(index):
+    """Test `GPSIndex.insert`."""
+    index.insert(15)
+    index.insert(LIGOTimeGPS(20), row=99)
+    index.insert("0.5")
+    assert index.range().tolist() == [100, 3, 1, 5, 2, 4, 99, 0]
+    assert index.nearest(14) == (LIGOTimeGPS(15), 5)
+
+
+def test_insert_default_row():
+    """Test that default row IDs don't collide with explicit ones."""
+    index = GPSIndex()
+    index.insert(10)
+    index.insert(20, row=2)
+    index.insert(30)
+    index.insert(40, row=1)
+    index.insert(50)
+    assert index.rows().tolist() == [0, 2, 3, 1, 4]
+
+
+def test_random():
+    """Test queries against a brute-force search."""
+    rng = random.Random(0)
+    ns = [rng.randrange(-10 ** 12, 10 ** 12) for _ in range(1000)]
+    index = GPSIndex.from_ns(ns)
+    for _ in range(100):
+        start, stop = sorted(rng.randrange(-10 ** 12, 10 ** 12) for _ in "ab")
+        expected = sorted(
+            (i for i, t in enumerate(ns) if start <= t < stop),
+            key=ns.__getitem__,
+        )
+        result = index.range(LIGOTimeGPS.from_ns(start), LIGOTimeGPS.from_ns(stop))
+        assert result.tolist() == expected
+        time = LIGOTimeGPS.from_ns(start)
+        nearest, row = index.nearest(time)
+        assert nearest.ns() == ns[row]
+        assert abs(ns[row] - start) == min(abs(t - start) for t in ns)
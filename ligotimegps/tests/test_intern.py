@@ -0,0 +1,146 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for `ligotimegps.intern`."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from .. import (
+    InternCache,
+    LIGOTimeGPS,
+)
+
+
+class MyGPS(LIGOTimeGPS):
+    """A trivial subclass of `LIGOTimeGPS`."""
+
+
+@pytest.mark.parametrize("value", [
+    "1000000000.5",
+    b"1000000000.5",
+    1000000000.5,
+    1000000000,
+    LIGOTimeGPS(1000000000, 500000000),
+])
+def test_intern(value):
+    """Test that `InternCache` returns a shared instance."""
+    cache = InternCache(LIGOTimeGPS)
+    first = cache(value)
+    assert first == LIGOTimeGPS(value)
+    assert cache(value) is first
+    assert cache.cache_info() == (1, 1, 4096, 1)
+
+
+def test_intern_key_type():
+    """Test that equal inputs of different types are cached separately."""
+    cache = InternCache(LIGOTimeGPS)
+    assert cache(1) is not cache(1.0)
+    assert cache(1) == cache(1.0)
+    assert len(cache) == 2
+
+
+def test_intern_lru():
+    """Test least-recently-used eviction."""
+    cache = InternCache(LIGOTimeGPS, maxsize=2)
+    a = cache("1")
+    cache("2")
+    assert cache("1") is a  # "1" is now the most recently used
+    cache("3")  # evicts "2"
+    assert cache.cache_info() == (1, 3, 2, 2)
+    assert cache("1") is a
+    cache("2")
+    assert cache.cache_info().misses == 4
+
+
+def test_intern_maxsize():
+    """Test resizing and disabling the cache."""
+    cache = InternCache(LIGOTimeGPS, maxsize=None)
+    for i in range(10):
+        cache(i)
+    assert len(cache) == 10
+    cache.maxsize = 3
+    assert cache.cache_info() == (0, 0, 3, 0)
+    for i in range(10):
+        cache(i)
+    assert len(cache) == 3
+    cache.maxsize = 0
+    assert cache("1") is not cache("1")
+    assert len(cache) == 0
+    with pytest.raises(ValueError, match="must be non-negative"):
+        cache.maxsize = -1
+
+
+def test_intern_clear():
+    """Test `InternCache.cache_clear`."""
+    cache = InternCache(LIGOTimeGPS)
+    a = cache("1")
+    cache("1")
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 4096, 0)
+    assert cache("1") is not a
+
+
+def test_intern_unhashable():
+    """Test that unhashable inputs bypass the cache."""
+
+    class Time:
+        __hash__ = None
+        gpsSeconds = 1  # noqa: N815
+        gpsNanoSeconds = 2  # noqa: N815
+
+    cache = InternCache(LIGOTimeGPS)
+    assert cache(Time()) == LIGOTimeGPS(1, 2)
+    assert len(cache) == 0
+
+
+def test_intern_error():
+    """Test that conversion errors are raised and not cached."""
+    cache = InternCache(LIGOTimeGPS)
+    with pytest.raises(TypeError, match="invalid literal"):
+        cache("test")
+    assert len(cache) == 0
+
+
+def test_intern_threads():
+    """Test that concurrent use of a cache is consistent."""
+    cache = InternCache(LIGOTimeGPS, maxsize=50)
+    values = [str(i % 100) for i in range(10000)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(cache, values))
+    assert results == list(map(LIGOTimeGPS, values))
+    info = cache.cache_info()
+    assert info.hits + info.misses == len(values)
+    assert info.currsize == 50
+
+
+def test_ligotimegps_intern():
+    """Test `LIGOTimeGPS.intern`."""
+    a = LIGOTimeGPS.intern("1234567890.123456789")
+    assert a == LIGOTimeGPS(1234567890, 123456789)
+    assert LIGOTimeGPS.intern("1234567890.123456789") is a
+    assert LIGOTimeGPS.intern_cache() is LIGOTimeGPS.intern_cache()
+
+
+def test_ligotimegps_intern_subclass():
+    """Test that each subclass has its own intern cache."""
+    a = MyGPS.intern("1.5")
+    assert type(a) is MyGPS
+    assert MyGPS.intern("1.5") is a
+    assert type(LIGOTimeGPS.intern("1.5")) is LIGOTimeGPS
+    assert MyGPS.intern_cache() is not LIGOTimeGPS.intern_cache()
@@ -0,0 +1,230 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for `ligotimegps.leapseconds`."""
+
+from array import array
+from datetime import (
+    UTC,
+    datetime,
+    timedelta,
+    timezone,
+)
+from pathlib import Path
+from time import time_ns
+
+import pytest
+
+from .. import (
+    LeapSecondTable,
+    LIGOTimeGPS,
+    get_leap_second_table,
+    gps_to_unix_ns,
+    ligotimegps as ligotimegps_module,
+    set_leap_second_table,
+    unix_to_gps_ns,
+)
+from ..leapseconds import BUILTIN_TABLE
+
+NS = 1000000000
+
+# the 2016-12-31 leap second: 23:59:60 UTC started at GPS 1167264017
+LEAP_2017 = 1167264017
+UNIX_2017 = 1483228800
+
+SYSTEM_LEAP_SECONDS_LIST = "/usr/share/zoneinfo/leap-seconds.list"
+
+LEAP_SECONDS_LIST = """\
+#	Leap second table
+#$	3676924800
+#@	3881174400
+#
+2272060800	10	# 1 Jan 1972
+2287785600	11	# 1 Jul 1972
+2303683200	12	# 1 Jan 1973
+"""
+
+
+@pytest.fixture
+def leap_second_table():
+    """Restore the active leap-second table after a test."""
+    previous = get_leap_second_table()
+    yield
+    set_leap_second_table(previous)
+
+
+def test_builtin_table():
+    """Test that the built-in table has entries at the start of UTC days."""
+    leaps = BUILTIN_TABLE.leaps
+    assert [tai for _, tai in leaps] == list(range(10, 38))
+    for unix, _ in leaps:
+        date = datetime.fromtimestamp(unix, tz=UTC)
+        assert (date.month, date.day, date.hour) in {(1, 1, 0), (7, 1, 0)}
+    assert get_leap_second_table() is BUILTIN_TABLE
+
+
+@pytest.mark.parametrize(("gps", "unix"), [
+    pytest.param(0, 315964800 * NS, id="GPS epoch"),
+    pytest.param(-86400 * NS, 315878400 * NS, id="1980-01-05"),
+    pytest.param(-1, 315964800 * NS - 1, id="before epoch"),
+    pytest.param(-10**18, -10**18 + 315964809 * NS, id="1948"),
+    pytest.param(LEAP_2017 * NS - 1, UNIX_2017 * NS - 1, id="23:59:59"),
+    pytest.param(LEAP_2017 * NS, (UNIX_2017 - 1) * NS, id="23:59:60"),
+    pytest.param((LEAP_2017 + 1) * NS, UNIX_2017 * NS, id="00:00:00"),
+    pytest.param(1400000000 * NS + 5, 1715964782 * NS + 5, id="2024"),
+])
+def test_gps_to_unix_ns(gps, unix):
+    """Test conversion of GPS to Unix time around leap seconds."""
+    assert LIGOTimeGPS.from_ns(gps).to_unix_ns() == unix
+    assert gps_to_unix_ns(array("q", [gps])) == array("q", [unix])
+
+
+@pytest.mark.parametrize(("unix", "gps"), [
+    pytest.param((UNIX_2017 - 1) * NS, (LEAP_2017 - 1) * NS, id="23:59:59"),
+    pytest.param(UNIX_2017 * NS - 1, LEAP_2017 * NS - 1, id="end 23:59:59"),
+    pytest.param(UNIX_2017 * NS, (LEAP_2017 + 1) * NS, id="00:00:00"),
+])
+def test_unix_to_gps_ns(unix, gps):
+    """Test conversion of Unix to GPS time around a leap second."""
+    assert LIGOTimeGPS.from_unix_ns(unix).ns() == gps
+    assert unix_to_gps_ns(array("q", [unix])) == array("q", [gps])
+
+
+def test_roundtrip():
+    """Test that every time outside a leap second round-trips exactly."""
+    table = get_leap_second_table()
+    for unix, _ in BUILTIN_TABLE.leaps:
+        for unix_ns in range((unix - 2) * NS - 2, (unix + 1) * NS, NS // 4):
+            gps_ns = table.unix_to_gps_ns(unix_ns)
+            assert table.gps_to_unix_ns(gps_ns) == unix_ns
+
+
+def test_bulk_mixed():
+    """Test bulk conversion of times either side of leap seconds."""
+    gps = array("q", range(-10 * NS, 1400000000 * NS, 999999999999999))
+    unix = gps_to_unix_ns(gps)
+    assert list(unix) == [LIGOTimeGPS.from_ns(x).to_unix_ns() for x in gps]
+    assert unix_to_gps_ns(unix) == gps
+    assert gps_to_unix_ns(array("q")) == array("q")
+
+
+def test_bulk_error():
+    """Test that bulk conversion validates its input."""
+    with pytest.raises(TypeError):
+        gps_to_unix_ns(array("d", [0.]))
+
+
+def test_to_unix():
+    """Test `LIGOTimeGPS.to_unix` and `LIGOTimeGPS.from_unix`."""
+    gps = LIGOTimeGPS(1400000000, 500000000)
+    assert gps.to_unix() == 1715964782.5
+    assert LIGOTimeGPS.from_unix(1715964782.5) == gps
+    assert LIGOTimeGPS.from_unix("1715964782.000000001") == gps - 0.499999999
+    assert LIGOTimeGPS.from_unix(1715964782) == gps - 0.5
+
+
+def test_to_datetime():
+    """Test `LIGOTimeGPS.to_datetime` and `LIGOTimeGPS.from_datetime`."""
+    gps = LIGOTimeGPS(1400000000, 123456789)
+    dt = gps.to_datetime()
+    assert dt == datetime(2024, 5, 17, 16, 53, 2, 123456, tzinfo=UTC)
+    assert LIGOTimeGPS.from_datetime(dt) == LIGOTimeGPS(1400000000, 123456000)
+    assert LIGOTimeGPS.from_datetime(dt.replace(tzinfo=None)) == (
+        LIGOTimeGPS(1400000000, 123456000)
+    )
+    # aware datetimes are converted to UTC
+    cest = timezone(timedelta(hours=2))
+    assert LIGOTimeGPS.from_datetime(dt.astimezone(cest)) == (
+        LIGOTimeGPS(1400000000, 123456000)
+    )
+    # negative times round down
+    assert LIGOTimeGPS(-1, 999999999).to_datetime() == (
+        datetime(1980, 1, 5, 23, 59, 59, 999999, tzinfo=UTC)
+    )
+
+
+@pytest.mark.usefixtures("leap_second_table")
+def test_set_leap_second_table(tmp_path):
+    """Test reading a table and setting it as the active table."""
+    path = tmp_path / "leap-seconds.list"
+    path.write_text(LEAP_SECONDS_LIST)
+    previous = set_leap_second_table(path)
+    assert previous is BUILTIN_TABLE
+    table = get_leap_second_table()
+    assert table == LeapSecondTable(
+        [(63072000, 10), (78796800, 11), (94694400, 12)],
+        expires=1672185600,
+    )
+    # the 1973 offset is used for all later times
+    assert LIGOTimeGPS(0).to_unix_ns() == (315964800 + 7) * NS
+    assert set_leap_second_table(None) is table
+    assert get_leap_second_table() is BUILTIN_TABLE
+
+
+def test_read_error(tmp_path):
+    """Test that `LeapSecondTable.read` reports bad lines."""
+    path = tmp_path / "leap-seconds.list"
+    path.write_text("#\n2272060800\n")
+    with pytest.raises(ValueError, match="cannot parse line 2"):
+        LeapSecondTable.read(path)
+
+
+@pytest.mark.parametrize(("leaps", "match"), [
+    ([], "at least one entry"),
+    ([(1, 10), (1, 11)], "increasing order"),
+])
+def test_table_error(leaps, match):
+    """Test that `LeapSecondTable` validates its entries."""
+    with pytest.raises(ValueError, match=match):
+        LeapSecondTable(leaps)
+
+
+@pytest.mark.skipif(
+    not Path(SYSTEM_LEAP_SECONDS_LIST).is_file(),
+    reason="no system leap-seconds.list",
+)
+def test_builtin_table_system():
+    """Test that the built-in table agrees with the system table."""
+    table = LeapSecondTable.read(SYSTEM_LEAP_SECONDS_LIST)
+    assert table.leaps[:len(BUILTIN_TABLE.leaps)] == BUILTIN_TABLE.leaps
+
+
+def test_now():
+    """Test `LIGOTimeGPS.now` matches the system clock."""
+    before = LIGOTimeGPS.from_unix_ns(time_ns())
+    now = LIGOTimeGPS.now()
+    after = LIGOTimeGPS.from_unix_ns(time_ns())
+    assert type(now) is LIGOTimeGPS
+    assert before <= now <= after
+
+
+@pytest.mark.usefixtures("leap_second_table")
+def test_now_leap_second(monkeypatch):
+    """Test `LIGOTimeGPS.now` across a leap second and a table change."""
+    clock = iter([
+        (UNIX_2017 - 1) * NS,
+        UNIX_2017 * NS - 1,
+        UNIX_2017 * NS,
+        UNIX_2017 * NS,
+    ])
+    monkeypatch.setattr(ligotimegps_module, "time_ns", clock.__next__)
+    assert LIGOTimeGPS.now() == LEAP_2017 - 1
+    assert LIGOTimeGPS.now() == LIGOTimeGPS(LEAP_2017 - 1, NS - 1)
+    assert LIGOTimeGPS.now() == LEAP_2017 + 1
+    # changing the table resets the cached offset
+    set_leap_second_table(LeapSecondTable([(0, 19)]))
+    assert LIGOTimeGPS.now() == UNIX_2017 - 315964800
@@ -17,11 +17,19 @@
 
 """Tests for `ligotimegps.LIGOTimeGPS`."""
 
+import copy
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from fractions import Fraction
 from numbers import Integral
 
 import pytest
 
-from .. import LIGOTimeGPS
+from .. import (
+    LIGOTimeGPS,
+    ligotimegps as ligotimegps_module,
+)
 
 
 @pytest.mark.parametrize(("value", "sec", "nanosec"), [
@@ -44,7 +52,9 @@ from .. import LIGOTimeGPS
         765432100,
         id="high-precision-str",
     ),
-    # overly precise string (rounded)
+    # exponent notation
+    pytest.param(("1e-7",), 0, 100, id="exponent-str"),
+    # overly precise string (truncated)
     pytest.param(
         ("1.2345678987654321987654321e9",),
         1234567898,
@@ -59,6 +69,102 @@ def test_creation(value, sec, nanosec):
     assert gps.gpsNanoSeconds == nanosec
 
 
+@pytest.mark.parametrize(("value", "sec", "nanosec"), [
+    pytest.param((0, 2 ** 60 + 1), 1152921504, 606846977, id="large-ns"),
+    pytest.param((0, -(2 ** 60) - 1), -1152921505, 393153023, id="negative"),
+    pytest.param((2 ** 70, 999999999), 2 ** 70, 999999999, id="large-s"),
+    pytest.param(("1.5", 2 ** 60), 1152921506, 106846976, id="str-int"),
+    pytest.param(("10000000000",), 10000000000, 0, id="large-str"),
+    pytest.param(("-1e30",), -(10 ** 30), 0, id="large-exponent-str"),
+    pytest.param(
+        ("1" * 30 + ".5",),
+        int("1" * 30),
+        500000000,
+        id="large-precise-str",
+    ),
+])
+def test_creation_exact(value, sec, nanosec):
+    """Test that integer nanoseconds are normalised exactly."""
+    gps = LIGOTimeGPS(*value)
+    assert (gps.gpsSeconds, gps.gpsNanoSeconds) == (sec, nanosec)
+
+
+@pytest.mark.parametrize("ns", [
+    0,
+    1,
+    -1,
+    100500000000,
+    2 ** 63 + 1,
+    -(2 ** 80) - 7,
+])
+def test_from_ns(ns):
+    """Test `LIGOTimeGPS.from_ns`."""
+    gps = LIGOTimeGPS.from_ns(ns)
+    assert type(gps) is LIGOTimeGPS
+    assert gps.ns() == ns
+    assert 0 <= gps.gpsNanoSeconds < 1000000000
+    assert gps == LIGOTimeGPS(0, ns)
+
+
+def test_from_ns_subclass():
+    """Test that `LIGOTimeGPS.from_ns` returns an instance of the subclass."""
+    assert type(MyGPS.from_ns(1)) is MyGPS
+
+
+def test_from_ns_error():
+    """Test that `LIGOTimeGPS.from_ns` rejects non-integers."""
+    with pytest.raises(TypeError):
+        LIGOTimeGPS.from_ns(1.5)
+
+
+class ForeignGPS:
+    """A `LIGOTimeGPSLike` type defining its attributes on the class."""
+
+    gpsSeconds = 10  # noqa: N815
+    gpsNanoSeconds = 20  # noqa: N815
+
+
+class InstanceGPS:
+    """A `LIGOTimeGPSLike` type defining its attributes per instance."""
+
+    def __init__(self, seconds, nanoseconds):
+        """Store the GPS time."""
+        self.gpsSeconds = seconds
+        self.gpsNanoSeconds = nanoseconds
+
+
+class MyFloat(float):
+    """A trivial subclass of `float`."""
+
+
+@pytest.mark.parametrize(("value", "sec", "nanosec"), [
+    pytest.param(ForeignGPS(), 10, 20, id="LIGOTimeGPSLike"),
+    pytest.param(InstanceGPS(1, 2), 1, 2, id="LIGOTimeGPSLike-instance"),
+    pytest.param(True, 1, 0, id="bool"),
+    pytest.param(MyFloat(1.5), 1, 500000000, id="float-subclass"),
+])
+def test_creation_dispatch(value, sec, nanosec):
+    """Test `LIGOTimeGPS` creation from types without a fast path."""
+    for _ in range(2):  # second time uses the cached converter, if any
+        gps = LIGOTimeGPS(value)
+        assert gps.gpsSeconds == sec
+        assert gps.gpsNanoSeconds == nanosec
+
+
+def test_creation_dispatch_cache():
+    """Test that type classification is only cached when it is safe."""
+    converters = ligotimegps_module._CONVERTERS  # noqa: SLF001
+    LIGOTimeGPS(ForeignGPS())
+    assert ForeignGPS in converters
+    LIGOTimeGPS(InstanceGPS(1, 2))
+    assert InstanceGPS not in converters
+    with pytest.raises(TypeError):
+        LIGOTimeGPS(InstanceGPS)
+    with pytest.raises(TypeError):
+        LIGOTimeGPS(None)
+    assert type(None) not in converters
+
+
 def test_copy():
     """Test that we can copy a `LIGOTimeGPS` to a new object."""
     a = LIGOTimeGPS(1)
@@ -67,6 +173,200 @@ def test_copy():
     assert b is not a
 
 
+def test_slots():
+    """Test that `LIGOTimeGPS` instances don't carry a ``__dict__``."""
+    a = LIGOTimeGPS(1, 2)
+    assert not hasattr(a, "__dict__")
+    with pytest.raises(AttributeError):
+        a.gpsSeconds = 2
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(protocol):
+    """Test that a `LIGOTimeGPS` survives a round-trip through `pickle`."""
+    a = LIGOTimeGPS(123, 456)
+    b = pickle.loads(pickle.dumps(a, protocol=protocol))  # noqa: S301
+    assert type(b) is LIGOTimeGPS
+    assert (b.gpsSeconds, b.gpsNanoSeconds) == (123, 456)
+
+
+def test_reduce():
+    """Test that a `LIGOTimeGPS` pickles as its integer parts."""
+    func, args = LIGOTimeGPS(123, 456).__reduce__()
+    assert args == (123, 456)
+    assert func(*args) == LIGOTimeGPS(123, 456)
+    func, args = MyGPS(123, 456).__reduce__()
+    assert args == (123, 456, MyGPS)
+    assert type(func(*args)) is MyGPS
+
+
+@pytest.mark.parametrize("data", [
+    # protocol 2 pickle from a version without __slots__
+    (
+        b"\x80\x02cligotimegps.ligotimegps\nLIGOTimeGPS\nq\x00)\x81q\x01}q"
+        b"\x02(X\x08\x00\x00\x00_secondsq\x03J\x00\xca\x9a;X\x0c\x00\x00\x00"
+        b"_nanosecondsq\x04J\x15\xcd[\x07ub."
+    ),
+    # protocol 4 pickle from a version without __slots__
+    (
+        b"\x80\x04\x95W\x00\x00\x00\x00\x00\x00\x00\x8c\x17"
+        b"ligotimegps.ligotimegps\x94\x8c\x0bLIGOTimeGPS\x94\x93\x94)"
+        b"\x81\x94}\x94(\x8c\x08_seconds\x94J\x00\xca\x9a;\x8c\x0c"
+        b"_nanoseconds\x94J\x15\xcd[\x07ub."
+    ),
+])
+def test_unpickle_dict_state(data):
+    """Test that pickles storing the parts in ``__dict__`` still load."""
+    gps = pickle.loads(data)  # noqa: S301
+    assert type(gps) is LIGOTimeGPS
+    assert gps == LIGOTimeGPS(1000000000, 123456789)
+    assert (gps.gpsSeconds, gps.gpsNanoSeconds) == (1000000000, 123456789)
+    # subclass pickles also carried the rest of the instance __dict__
+    a = MyGPS.__new__(MyGPS)
+    a.__setstate__({"_seconds": 1, "_nanoseconds": 2, "label": "test"})
+    assert a == LIGOTimeGPS(1, 2)
+    assert a.__dict__ == {"label": "test"}
+
+
+def test_unpickle_legacy():
+    """Test that pickles of `LIGOTimeGPS` using ``__setstate__`` still load."""
+    data = (
+        b"\x80\x04\x95;\x00\x00\x00\x00\x00\x00\x00\x8c\x17"
+        b"ligotimegps.ligotimegps\x94\x8c\x0bLIGOTimeGPS\x94\x93\x94)"
+        b"\x81\x94J\x00\xca\x9a;J\x15\xcd[\x07\x86\x94b."
+    )
+    assert pickle.loads(data) == LIGOTimeGPS(1000000000, 123456789)  # noqa: S301
+    # subclass pickles carried the instance __dict__ in the state tuple
+    a = MyGPS.__new__(MyGPS)
+    a.__setstate__((1, 2, {"label": "test"}))
+    assert a == LIGOTimeGPS(1, 2)
+    assert a.label == "test"
+
+
+@pytest.mark.parametrize("value", [
+    "1000000000.123456789",
+    b"-1.2",
+    "1e-7",
+])
+def test_lazy(value):
+    """Test that `LIGOTimeGPS.lazy` behaves like an eager `LIGOTimeGPS`."""
+    eager = LIGOTimeGPS(value)
+    lazy = LIGOTimeGPS.lazy(value)
+    assert isinstance(lazy, LIGOTimeGPS)
+    assert lazy._raw == value  # noqa: SLF001
+    assert lazy == eager
+    # the parsed time is stored, the string is kept
+    assert (lazy._seconds, lazy._nanoseconds) == (  # noqa: SLF001
+        eager.gpsSeconds,
+        eager.gpsNanoSeconds,
+    )
+    assert lazy._raw == value  # noqa: SLF001
+    assert (lazy.gpsSeconds, lazy.gpsNanoSeconds) == (
+        eager.gpsSeconds,
+        eager.gpsNanoSeconds,
+    )
+    assert repr(lazy) == repr(eager)
+    assert str(LIGOTimeGPS.lazy(value)) == str(eager)
+    assert hash(LIGOTimeGPS.lazy(value)) == hash(eager)
+    assert LIGOTimeGPS.lazy(value) < eager + 1
+    assert LIGOTimeGPS(LIGOTimeGPS.lazy(value)) == eager
+    assert type(LIGOTimeGPS.lazy(value) + 1) is LIGOTimeGPS
+    assert type(-LIGOTimeGPS.lazy(value)) is LIGOTimeGPS
+    assert type(copy.copy(LIGOTimeGPS.lazy(value))) is LIGOTimeGPS
+    b = pickle.loads(pickle.dumps(LIGOTimeGPS.lazy(value)))  # noqa: S301
+    assert type(b) is LIGOTimeGPS
+    assert b == eager
+
+
+def test_lazy_threads():
+    """Test that lazy times can be parsed by several threads at once."""
+    times = [LIGOTimeGPS.lazy(f"{i}.5") for i in range(1000)]
+
+    def parts(attr):
+        return [getattr(t, attr) for t in times]
+
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(parts, ["gpsNanoSeconds", "gpsSeconds"] * 4))
+    assert results[::2] == [[500000000] * 1000] * 4
+    assert results[1::2] == [list(range(1000))] * 4
+
+
+def test_lazy_subclass():
+    """Test `LIGOTimeGPS.lazy` for a subclass."""
+    lazy = MyGPS.lazy("1.5")
+    assert isinstance(lazy, MyGPS)
+    assert type(lazy + 1) is MyGPS
+    assert type(pickle.loads(pickle.dumps(lazy))) is MyGPS  # noqa: S301
+    assert type(lazy.lazy("2")) is type(lazy)
+
+
+def test_lazy_error():
+    """Test that `LIGOTimeGPS.lazy` defers parsing errors to first use."""
+    with pytest.raises(TypeError, match=r"cannot lazily convert 1\.5"):
+        LIGOTimeGPS.lazy(1.5)
+    lazy = LIGOTimeGPS.lazy("abc")
+    with pytest.raises(TypeError, match="invalid literal"):
+        lazy + 1
+    with pytest.raises(AttributeError):
+        lazy.missing  # noqa: B018
+
+
+@pytest.mark.parametrize(("value", "hexdata"), [
+    (LIGOTimeGPS(0), "000000000000000000000000"),
+    (LIGOTimeGPS(1, 2), "010000000000000002000000"),
+    (LIGOTimeGPS(-1, 999999999), "ffffffffffffffffffc99a3b"),
+    (LIGOTimeGPS(2 ** 63 - 1, 999999999), "ffffffffffffff7fffc99a3b"),
+])
+def test_to_bytes(value, hexdata):
+    """Test `LIGOTimeGPS.to_bytes` and `LIGOTimeGPS.from_bytes`."""
+    data = value.to_bytes()
+    assert data.hex() == hexdata
+    assert LIGOTimeGPS.from_bytes(data) == value
+    assert LIGOTimeGPS.from_bytes(bytearray(data)) == value
+    assert type(MyGPS.from_bytes(data)) is MyGPS
+
+
+def test_to_bytes_overflow():
+    """Test `LIGOTimeGPS.to_bytes` with times that can't be packed."""
+    with pytest.raises(OverflowError, match="out of range for packing"):
+        LIGOTimeGPS(2 ** 63).to_bytes()
+
+
+@pytest.mark.parametrize(("data", "match"), [
+    (b"\x00" * 11, "expected 12 bytes, got 11"),
+    (bytes.fromhex("000000000000000000ca9a3b"), "invalid nanoseconds"),
+])
+def test_from_bytes_error(data, match):
+    """Test `LIGOTimeGPS.from_bytes` errors."""
+    with pytest.raises(ValueError, match=match):
+        LIGOTimeGPS.from_bytes(data)
+
+
+@pytest.mark.parametrize("func", [copy.copy, copy.deepcopy])
+def test_copy_module(func):
+    """Test that a `LIGOTimeGPS` can be copied with the `copy` module."""
+    a = LIGOTimeGPS(123, 456)
+    assert func(a) == a
+
+
+class MyGPS(LIGOTimeGPS):
+    """A trivial subclass of `LIGOTimeGPS`."""
+
+
+def test_subclass():
+    """Test that `LIGOTimeGPS` can be subclassed."""
+    a = MyGPS(1, 2)
+    a.label = "test"
+    assert a.label == "test"
+    assert isinstance(a + 1, MyGPS)
+    b = pickle.loads(pickle.dumps(a))  # noqa: S301
+    assert type(b) is MyGPS
+    assert b == a
+    assert b.label == "test"
+    c = copy.deepcopy(a)
+    assert c.label == "test"
+
+
 @pytest.mark.parametrize(("input_", "errstr"), [
     pytest.param(
         "test",
@@ -203,7 +503,45 @@ def test_hash():
     """Test ``hash(x)``."""
     h = hash(LIGOTimeGPS(123, 456))
     assert isinstance(h, int)
-    assert h == 435
+    assert h == hash(Fraction(123000000456, 1000000000))
+
+
+@pytest.mark.parametrize(("gps", "value"), [
+    (LIGOTimeGPS(0), 0),
+    (LIGOTimeGPS(5), 5),
+    (LIGOTimeGPS(-5), -5),
+    (LIGOTimeGPS(2 ** 70), 2 ** 70),
+    (LIGOTimeGPS(0, 500000000), 0.5),
+    (LIGOTimeGPS(-1, 750000000), -0.25),
+    (LIGOTimeGPS(-1235, 500000000), -1234.5),
+    (LIGOTimeGPS(-123457, 211000000), Fraction(-123456789, 1000)),
+    (LIGOTimeGPS(-1, 999999999), Fraction(-1, 1000000000)),
+])
+def test_hash_consistent(gps, value):
+    """Test that ``hash(x)`` matches the hash of equal numbers."""
+    assert gps == value
+    assert hash(gps) == hash(value)
+
+
+@pytest.mark.parametrize("value", [0.1, 100.1, 1126259462.4])
+def test_hash_inexact_float(value):
+    """Test that ``hash(x)`` is that of the exact nanosecond value.
+
+    Floats that are not a whole number of nanoseconds compare equal to
+    the `LIGOTimeGPS` they convert to, but don't share its hash.
+    """
+    gps = LIGOTimeGPS(value)
+    assert gps == value
+    assert hash(gps) == hash(Fraction(gps.ns(), 1000000000))
+
+
+def test_hash_distribution():
+    """Test that ``hash(x)`` doesn't collide on a dense sample grid."""
+    times = [
+        LIGOTimeGPS(1000000000 + i // 16384, (i % 16384) * 61035)
+        for i in range(2 ** 16)
+    ]
+    assert len(set(map(hash, times))) == len(times)
 
 
 @pytest.mark.parametrize(("value", "truth"), [
@@ -264,6 +602,43 @@ def test_sub(a, b, result):
     assert diff == result
 
 
+@pytest.mark.parametrize("other", [
+    pytest.param(MyGPS(2, 999999999), id="LIGOTimeGPS"),
+    pytest.param(7, id="int"),
+    pytest.param(-7, id="negative-int"),
+    pytest.param(0.5, id="float"),
+    pytest.param(-0.9999999999, id="negative-float"),
+    pytest.param(1234567890.123456, id="large-float"),
+    pytest.param(True, id="bool"),
+    pytest.param("1.25", id="str"),
+    pytest.param(ForeignGPS(), id="LIGOTimeGPSLike"),
+])
+@pytest.mark.parametrize("op", [
+    pytest.param(lambda a, b: a + b, id="add"),
+    pytest.param(lambda a, b: b + a, id="radd"),
+    pytest.param(lambda a, b: a - b, id="sub"),
+    pytest.param(lambda a, b: b - a, id="rsub"),
+])
+def test_arithmetic_mixed(op, other):
+    """Test mixed-operand arithmetic matches converting the operand first."""
+    a = MyGPS(100, 750000000)
+    result = op(a, other)
+    expected = op(a, MyGPS(other))
+    assert type(result) is MyGPS
+    assert (result.gpsSeconds, result.gpsNanoSeconds) == (
+        expected.gpsSeconds,
+        expected.gpsNanoSeconds,
+    )
+
+
+def test_arithmetic_error():
+    """Test that arithmetic with an unsupported type raises `TypeError`."""
+    with pytest.raises(TypeError, match="cannot convert None"):
+        LIGOTimeGPS(1) + None
+    with pytest.raises(TypeError, match="cannot convert None"):
+        None - LIGOTimeGPS(1)
+
+
 @pytest.mark.parametrize(("a", "b", "result"), [
     (LIGOTimeGPS(2), LIGOTimeGPS(5), 10),
     (LIGOTimeGPS(2), 5, 10),
@@ -290,6 +665,54 @@ def test_div(a, b, result):
     assert quot == result
 
 
+@pytest.mark.parametrize(("a", "b", "result"), [
+    pytest.param(
+        LIGOTimeGPS(1234567890, 123456789),
+        1 / 16384,
+        LIGOTimeGPS(20227160311782, 716030976),
+        id="float",
+    ),
+    pytest.param(
+        LIGOTimeGPS(1234567890, 123456789),
+        Fraction(1, 3),
+        LIGOTimeGPS(3703703670, 370370367),
+        id="Fraction",
+    ),
+    pytest.param(
+        LIGOTimeGPS(1234567890, 123456789),
+        Decimal("0.0625"),
+        LIGOTimeGPS(19753086241, 975308624),
+        id="Decimal",
+    ),
+    pytest.param(
+        LIGOTimeGPS(100),
+        -3,
+        LIGOTimeGPS(-34, 666666666),
+        id="negative",
+    ),
+    pytest.param(LIGOTimeGPS(0, 1), 2, LIGOTimeGPS(0), id="floor"),
+    pytest.param(
+        LIGOTimeGPS(-1, 999999999),
+        2,
+        LIGOTimeGPS(-1, 999999999),
+        id="negative-floor",
+    ),
+])
+def test_div_exact(a, b, result):
+    """Test that division is exact, rounded down to the nanosecond."""
+    quot = a / b
+    assert (quot.gpsSeconds, quot.gpsNanoSeconds) == (
+        result.gpsSeconds,
+        result.gpsNanoSeconds,
+    )
+
+
+def test_div_zero():
+    """Test that division by zero raises `ZeroDivisionError`."""
+    with pytest.raises(ZeroDivisionError):
+        LIGOTimeGPS(1) / 0
+
+
 def test_div_error():
     """Test that we can't do ``int / LIGOTimeGPS``."""
     # check that we can't do int/LIGOTimeGPS
@@ -297,9 +720,90 @@ def test_div_error():
         10 / LIGOTimeGPS(2)
 
 
-def test_mod():
+@pytest.mark.parametrize("other", ["2", b"2", None, [2]])
+def test_div_mod_type_error(other):
+    """Test that division and modulo reject non-numeric operands."""
+    with pytest.raises(TypeError, match="unsupported operand"):
+        LIGOTimeGPS(5) / other
+    with pytest.raises(TypeError, match="unsupported operand"):
+        LIGOTimeGPS(5) % other
+
+
+@pytest.mark.parametrize(("a", "b", "result"), [
+    (LIGOTimeGPS(100.5), 3, LIGOTimeGPS(1.5)),
+    (LIGOTimeGPS(-7.5), 2, LIGOTimeGPS(0.5)),
+    (LIGOTimeGPS(7.5), -2, LIGOTimeGPS(-0.5)),
+    (LIGOTimeGPS(1234567890, 123456789), 1 / 16384, LIGOTimeGPS(0, 43703)),
+    (LIGOTimeGPS(1234567890, 123456789), Fraction(1, 3), LIGOTimeGPS(0.123456789)),
+    (LIGOTimeGPS(10), LIGOTimeGPS(3), LIGOTimeGPS(1)),
+])
+def test_mod(a, b, result):
     """Test modulo operation."""
-    assert LIGOTimeGPS(100.5) % 3 == 1.5
+    assert a % b == result
+
+
+@pytest.mark.parametrize(("value", "step", "floor", "ceil", "nearest"), [
+    pytest.param(
+        LIGOTimeGPS(1000000000, 123456789),
+        1 / 16384,
+        LIGOTimeGPS(1000000000, 123413086),
+        LIGOTimeGPS(1000000000, 123474121),
+        LIGOTimeGPS(1000000000, 123474121),
+        id="16384Hz",
+    ),
+    pytest.param(
+        LIGOTimeGPS(1000000007),
+        4,
+        LIGOTimeGPS(1000000004),
+        LIGOTimeGPS(1000000008),
+        LIGOTimeGPS(1000000008),
+        id="int",
+    ),
+    pytest.param(
+        LIGOTimeGPS(1000000008),
+        4,
+        LIGOTimeGPS(1000000008),
+        LIGOTimeGPS(1000000008),
+        LIGOTimeGPS(1000000008),
+        id="on-grid",
+    ),
+    pytest.param(
+        LIGOTimeGPS(-1, 999999999),
+        Fraction(1, 3),
+        LIGOTimeGPS(-1, 666666667),
+        LIGOTimeGPS(0),
+        LIGOTimeGPS(0),
+        id="negative",
+    ),
+    pytest.param(
+        LIGOTimeGPS(2, 500000000),
+        1,
+        LIGOTimeGPS(2),
+        LIGOTimeGPS(3),
+        LIGOTimeGPS(2),
+        id="tie-even",
+    ),
+    pytest.param(
+        LIGOTimeGPS(1234567890, 123456789),
+        LIGOTimeGPS(0, 1000),
+        LIGOTimeGPS(1234567890, 123456000),
+        LIGOTimeGPS(1234567890, 123457000),
+        LIGOTimeGPS(1234567890, 123457000),
+        id="LIGOTimeGPS",
+    ),
+])
+def test_grid_rounding(value, step, floor, ceil, nearest):
+    """Test `LIGOTimeGPS.floor`, `~LIGOTimeGPS.ceil`, and `~.round_to`."""
+    assert value.floor(step) == floor
+    assert value.ceil(step) == ceil
+    assert value.round_to(step) == nearest
+
+
+@pytest.mark.parametrize("step", [0, -1, -0.5])
+def test_grid_rounding_error(step):
+    """Test that grid rounding with a non-positive step fails."""
+    with pytest.raises(ValueError, match="step must be positive"):
+        LIGOTimeGPS(1).floor(step)
 
 
 def test_pos():
@@ -312,6 +816,25 @@ def test_neg():
     """Test unary minus."""
     a = LIGOTimeGPS(1, 234)
     assert -a == LIGOTimeGPS(-2, 999999766)
+    assert -LIGOTimeGPS(-5) == LIGOTimeGPS(5)
+
+
+@pytest.mark.parametrize("ns", [
+    2 ** 53 + 1,
+    -(2 ** 53) - 1,
+    123456789123456789,
+    2 ** 70 + 3,
+])
+def test_arithmetic_exact(ns):
+    """Test that arithmetic is exact beyond float precision."""
+    a = LIGOTimeGPS.from_ns(ns)
+    b = LIGOTimeGPS(0, 999999999)
+    assert (-a).ns() == -ns
+    assert (a + b).ns() == ns + 999999999
+    assert (a - b).ns() == ns - 999999999
+    assert (b - a).ns() == 999999999 - ns
+    assert (a + 1).ns() == ns + 1000000000
+    assert round(a, 3).ns() == round(ns, -6)
 
 
 def test_abs():
@@ -324,9 +847,97 @@ def test_abs():
 def test_infinity():
     """Test comparisons with infinity."""
     assert LIGOTimeGPS(1) < float("inf")
+    assert LIGOTimeGPS(1) <= float("inf")
     assert LIGOTimeGPS(1) > -float("inf")
+    assert LIGOTimeGPS(1) >= -float("inf")
     assert LIGOTimeGPS(1) != float("inf")
     assert LIGOTimeGPS(1) != -float("inf")
+    assert not LIGOTimeGPS(1) > float("inf")
+    assert not LIGOTimeGPS(1) < -float("inf")
+
+
+def test_nan():
+    """Test comparisons with NaN."""
+    nan = float("nan")
+    a = LIGOTimeGPS(1)
+    assert a != nan
+    assert not a == nan  # noqa: SIM201
+    assert not a < nan
+    assert not a <= nan
+    assert not a > nan
+    assert not a >= nan
+
+
+@pytest.mark.parametrize(("value", "other"), [
+    (LIGOTimeGPS(1.5), Fraction(3, 2)),
+    (LIGOTimeGPS(1.5), Decimal("1.5")),
+    (LIGOTimeGPS(10, 20), ForeignGPS()),
+])
+def test_compare_exact(value, other):
+    """Test comparisons with exact non-float types."""
+    assert value == other
+    assert value <= other
+    assert value >= other
+    assert not value < other
+    assert not value > other
+    assert value + LIGOTimeGPS(0, 1) > other
+    assert value - LIGOTimeGPS(0, 1) < other
+
+
+@pytest.mark.parametrize("value", [
+    0.1,
+    -0.1,
+    100.1,
+    1126259462.4,
+    1400000000.1,
+    1 / 3,
+    1e-10,
+    -1e-10,
+])
+def test_compare_float_roundtrip(value):
+    """Test that a float compares equal to the `LIGOTimeGPS` made from it."""
+    gps = LIGOTimeGPS(value)
+    assert gps == value
+    assert value == gps
+    assert gps <= value
+    assert gps >= value
+    assert not gps < value
+    assert not gps > value
+    assert gps + LIGOTimeGPS(0, 1) > value
+    assert gps - LIGOTimeGPS(0, 1) < value
+
+
+def test_compare_fraction_precision():
+    """Test that comparison with a `Fraction` is not rounded."""
+    a = LIGOTimeGPS(1, 500000000)
+    assert a < Fraction(3, 2) + Fraction(1, 10**12)
+    assert a > Fraction(3, 2) - Fraction(1, 10**12)
+    assert a != Fraction(3, 2) + Fraction(1, 10**12)
+
+
+@pytest.mark.parametrize("op", [
+    pytest.param(lambda a, b: a < b, id="lt"),
+    pytest.param(lambda a, b: a <= b, id="le"),
+    pytest.param(lambda a, b: a > b, id="gt"),
+    pytest.param(lambda a, b: a >= b, id="ge"),
+])
+@pytest.mark.parametrize("other", [-2, 1, 1.5, 1.25, 1.75, 3])
+def test_compare_consistent(op, other):
+    """Test that comparisons with numbers agree with ``float``."""
+    for value in (LIGOTimeGPS(1), LIGOTimeGPS(1.5)):
+        assert op(value, other) is op(float(value), other)
+        assert op(other, value) is op(other, float(value))
+
+
+@pytest.mark.parametrize("op", [
+    pytest.param(lambda a, b: a <= b, id="le"),
+    pytest.param(lambda a, b: a > b, id="gt"),
+    pytest.param(lambda a, b: a >= b, id="ge"),
+])
+def test_compare_notimplemented(op):
+    """Test that ordering against an unsupported type raises `TypeError`."""
+    with pytest.raises(TypeError, match="not supported between instances"):
+        op(LIGOTimeGPS(1), "test")
 
 
 def test_lal():
@@ -0,0 +1,147 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for `ligotimegps.merge_by_time`."""
+
+import random
+from itertools import (
+    count,
+    islice,
+)
+
+import pytest
+
+from .. import (
+    LIGOTimeGPS,
+    merge_by_time,
+)
+
+
+def _events(name, times):
+    """Return a list of ``(name, time)`` events."""
+    return [(name, LIGOTimeGPS(t)) for t in times]
+
+
+def _time(event):
+    return event[1]
+
+
+def test_merge():
+    """Test `merge_by_time` yields items in time order."""
+    h1 = _events("H1", [1, 2.5, 4])
+    l1 = _events("L1", ["1.5", 2.5, 3])
+    v1 = _events("V1", [0.5])
+    merged = list(merge_by_time(h1, l1, v1, key=_time))
+    assert merged == sorted(h1 + l1 + v1, key=_time)
+    # ties keep the order of the streams
+    assert merged[3:5] == [h1[1], l1[1]]
+
+
+def test_merge_times():
+    """Test `merge_by_time` with items that are times."""
+    assert list(merge_by_time([1, "2.5"], [LIGOTimeGPS(2), 3.0])) == [
+        1, LIGOTimeGPS(2), "2.5", 3.0,
+    ]
+
+
+def test_merge_protocol():
+    """Test `merge_by_time` with a key returning a `LIGOTimeGPSLike`."""
+
+    class Time:
+        def __init__(self, ns):
+            self.gpsSeconds, self.gpsNanoSeconds = divmod(ns, 1000000000)
+
+    a = [Time(5), Time(3000000000)]
+    b = [Time(1000000000)]
+    merged = list(merge_by_time(a, b, key=lambda x: x))
+    assert merged == [a[0], b[0], a[1]]
+
+
+def test_merge_random():
+    """Test `merge_by_time` against `sorted`."""
+    rng = random.Random(0)
+    streams = [
+        sorted(LIGOTimeGPS.from_ns(rng.randrange(10 ** 10)) for _ in range(100))
+        for _ in range(10)
+    ]
+    merged = list(merge_by_time(*streams))
+    assert merged == sorted(t for stream in streams for t in stream)
+
+
+@pytest.mark.parametrize("streams", [
+    pytest.param([], id="none"),
+    pytest.param([[]], id="one-empty"),
+    pytest.param([[], [1, 2], []], id="some-empty"),
+])
+def test_merge_empty(streams):
+    """Test `merge_by_time` with empty streams."""
+    expected = [t for stream in streams for t in stream]
+    assert list(merge_by_time(*streams)) == expected
+
+
+def test_merge_lazy():
+    """Test that `merge_by_time` consumes its inputs lazily."""
+    evens = count(0, 2)
+    odds = count(1, 2)
+    assert list(islice(merge_by_time(evens, odds), 5)) == [0, 1, 2, 3, 4]
+    # with a reorder buffer, only items within the window are consumed
+    merged = merge_by_time(count(), lateness=5)
+    assert list(islice(merged, 3)) == [0, 1, 2]
+
+
+def test_merge_lateness():
+    """Test that `merge_by_time` reorders late items within ``lateness``."""
+    a = [1, 3, 2, 6, 4, 5, 9]
+    b = [3.5, 2.5, 7]
+    merged = list(merge_by_time(a, b, lateness=2))
+    assert merged == sorted(a + b)
+
+
+# 3.5 arrives after 5 has been merged, which is too late even with a
+# one-second reorder buffer
+LATE = [1, 2, 5, 6.5, 3.5, 7]
+
+
+@pytest.mark.parametrize("lateness", [0, 1])
+def test_merge_late_raise(lateness):
+    """Test that `merge_by_time` raises on items that are too late."""
+    merged = merge_by_time(LATE, [10], lateness=lateness)
+    with pytest.raises(ValueError, match="from stream 0 is earlier"):
+        list(merged)
+
+
+@pytest.mark.parametrize(("lateness", "on_late", "result"), [
+    (0, "drop", [1, 2, 5, 6.5, 7, 10]),
+    (1, "drop", [1, 2, 5, 6.5, 7, 10]),
+    (0, "emit", [1, 2, 5, 6.5, 3.5, 7, 10]),
+    # 6.5 is still held in the reorder buffer when 3.5 is emitted
+    (1, "emit", [1, 2, 5, 3.5, 6.5, 7, 10]),
+])
+def test_merge_late(lateness, on_late, result):
+    """Test the ``on_late`` policies of `merge_by_time`."""
+    merged = merge_by_time(LATE, [10], lateness=lateness, on_late=on_late)
+    assert list(merged) == result
+
+
+@pytest.mark.parametrize(("kwargs", "match"), [
+    ({"lateness": -1}, "must not be negative"),
+    ({"on_late": "test"}, "invalid on_late"),
+])
+def test_merge_error(kwargs, match):
+    """Test `merge_by_time` argument errors are raised immediately."""
+    with pytest.raises(ValueError, match=match):
+        merge_by_time([1], **kwargs)
@@ -0,0 +1,82 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for `ligotimegps.packing`."""
+
+import pytest
+
+from .. import (
+    PACKED_SIZE,
+    GPSRange,
+    LIGOTimeGPS,
+    LIGOTimeGPSArray,
+    pack_many,
+    unpack_many,
+)
+
+TIMES = [
+    LIGOTimeGPS(1000000000, 123456789),
+    LIGOTimeGPS(-1, 500000000),
+    LIGOTimeGPS(0),
+    LIGOTimeGPS(12345, 999999999),
+]
+
+
+@pytest.mark.parametrize("times", [
+    pytest.param(TIMES, id="list"),
+    pytest.param(LIGOTimeGPSArray(TIMES), id="LIGOTimeGPSArray"),
+    pytest.param(list(map(str, TIMES)), id="str"),
+])
+def test_pack_many(times):
+    """Test `pack_many` matches `LIGOTimeGPS.to_bytes`."""
+    data = pack_many(times)
+    assert isinstance(data, bytes)
+    assert len(data) == PACKED_SIZE * len(TIMES)
+    assert data == b"".join(t.to_bytes() for t in TIMES)
+
+
+def test_unpack_many():
+    """Test `unpack_many` round-trips `pack_many`."""
+    data = pack_many(TIMES)
+    assert unpack_many(data) == TIMES
+    assert unpack_many(memoryview(data)) == TIMES
+    times = unpack_many(bytearray(data), as_array=True)
+    assert isinstance(times, LIGOTimeGPSArray)
+    assert list(times) == TIMES
+
+
+def test_range():
+    """Test packing a `GPSRange`."""
+    times = GPSRange(0, 1, 0.125)
+    assert unpack_many(pack_many(times)) == list(times)
+
+
+def test_empty():
+    """Test packing and unpacking no times."""
+    assert pack_many([]) == b""
+    assert unpack_many(b"") == []
+    assert len(unpack_many(b"", as_array=True)) == 0
+
+
+@pytest.mark.parametrize(("data", "match"), [
+    (b"\x00" * 13, r"buffer length \(13\) is not a multiple of 12"),
+    (bytes(12) + bytes.fromhex("000000000000000000ca9a3b"), "invalid nanoseconds"),
+])
+def test_unpack_many_error(data, match):
+    """Test `unpack_many` errors."""
+    with pytest.raises(ValueError, match=match):
+        unpack_many(data)
@@ -0,0 +1,128 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for `ligotimegps.parse`."""
+
+import pytest
+
+from .. import (
+    LIGOTimeGPS,
+    LIGOTimeGPSArray,
+    parse_many,
+)
+from ..parse import parse_ns
+
+
+@pytest.mark.parametrize(("value", "result"), [
+    pytest.param("1", 1000000000, id="int"),
+    pytest.param("1.5", 1500000000, id="float"),
+    pytest.param("+1.5", 1500000000, id="plus"),
+    pytest.param("-1.5", -1500000000, id="minus"),
+    pytest.param(".5", 500000000, id="no-int"),
+    pytest.param("5.", 5000000000, id="no-frac"),
+    pytest.param(" 1.5\n", 1500000000, id="whitespace"),
+    pytest.param("1_000.5", 1000500000000, id="underscore"),
+    pytest.param(b"1.5", 1500000000, id="bytes"),
+    pytest.param("1e9", 1000000000000000000, id="exponent"),
+    pytest.param("1.5E-7", 150, id="negative-exponent"),
+    pytest.param("1e-100", 0, id="tiny"),
+    pytest.param("0.0000000018", 1, id="truncate"),
+    pytest.param("-0.0000000018", -1, id="truncate-negative"),
+    pytest.param(
+        "1.2345678987654321987654321e9",
+        1234567898765432198,
+        id="overly-precise",
+    ),
+    pytest.param("9223372036.854775808", 2 ** 63, id="beyond-int64"),
+    pytest.param("-9223372036.854775809", -2 ** 63 - 1, id="below-int64"),
+    pytest.param("1e10", 10 ** 19, id="large-exponent"),
+    pytest.param("1" * 20, int("1" * 20) * 10 ** 9, id="large-int"),
+    pytest.param("0" * 20 + "1.5", 1500000000, id="leading-zeros"),
+    pytest.param("0." + "1" * 5000, 111111111, id="long-fraction"),
+    pytest.param("1e-999999999", 0, id="huge-negative-exponent"),
+    pytest.param("1" * 5000 + "e-4990", 10 ** 19 // 9, id="long-digits"),
+])
+def test_parse_ns(value, result):
+    """Test `parse_ns`."""
+    assert parse_ns(value) == result
+
+
+@pytest.mark.parametrize("value", [
+    "",
+    ".",
+    "e5",
+    "1.2.3",
+    "--1",
+    "1 2",
+    "inf",
+    "nan",
+    "test",
+])
+def test_parse_ns_error(value):
+    """Test that `parse_ns` raises `TypeError` for invalid input."""
+    with pytest.raises(TypeError, match="invalid literal for LIGOTimeGPS"):
+        parse_ns(value)
+
+
+@pytest.mark.parametrize("value", [
+    pytest.param("1e3991", id="exponent"),
+    pytest.param("1" * 5000, id="digits-int-limit"),
+    pytest.param("1e999999999", id="huge-exponent"),
+    pytest.param("1e" + "9" * 5000, id="huge-exponent-digits"),
+])
+def test_parse_ns_range(value):
+    """Test that `parse_ns` rejects values with too many digits."""
+    with pytest.raises(TypeError, match="out of range"):
+        parse_ns(value)
+
+
+@pytest.mark.parametrize("values", [
+    pytest.param(["1.5", b"-2", "3e2"], id="list"),
+    pytest.param("1.5 -2\n3e2\n", id="str"),
+    pytest.param(b"1.5 -2\n3e2\n", id="bytes"),
+    pytest.param(memoryview(b"1.5\t-2 3e2"), id="memoryview"),
+])
+def test_parse_many(values):
+    """Test `parse_many`."""
+    times = parse_many(values)
+    assert times == [LIGOTimeGPS(1.5), LIGOTimeGPS(-2), LIGOTimeGPS(300)]
+    assert all(type(t) is LIGOTimeGPS for t in times)
+
+
+def test_parse_many_sep():
+    """Test `parse_many` with a custom delimiter."""
+    assert parse_many(b"1.5,,2,", sep=",") == [1.5, 2]
+
+
+def test_parse_many_array():
+    """Test `parse_many` with ``as_array=True``."""
+    times = parse_many(b"1.5 -2", as_array=True)
+    assert isinstance(times, LIGOTimeGPSArray)
+    assert times.ns().tolist() == [1500000000, -2000000000]
+
+
+def test_parse_many_array_range():
+    """Test that `parse_many` with ``as_array=True`` is limited to int64."""
+    assert parse_many(b"1e10")[0].ns() == 10 ** 19
+    with pytest.raises(OverflowError):
+        parse_many(b"1 1e10", as_array=True)
+
+
+def test_parse_many_error():
+    """Test that `parse_many` raises `TypeError` for invalid input."""
+    with pytest.raises(TypeError, match="invalid literal for LIGOTimeGPS: 'a'"):
+        parse_many("1 a 2")
@@ -0,0 +1,138 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for `ligotimegps.reductions`."""
+
+import random
+from array import array
+from fractions import Fraction
+
+import pytest
+
+from .. import (
+    GPSRange,
+    LIGOTimeGPS,
+    LIGOTimeGPSArray,
+    LIGOTimeGPSView,
+    SampleGrid,
+    argsort,
+    gps_max,
+    gps_mean,
+    gps_min,
+    gps_sum,
+    histogram,
+)
+
+TIMES = [
+    LIGOTimeGPS(1000000000, 123456789),
+    LIGOTimeGPS(-1, 500000000),
+    LIGOTimeGPS(1000000000, 123456789),
+    LIGOTimeGPS(0),
+    LIGOTimeGPS(12345, 500000001),
+]
+
+
+@pytest.fixture(params=["list", "LIGOTimeGPSArray", "LIGOTimeGPSView", "str"])
+def times(request):
+    """Return `TIMES` in various container types."""
+    if request.param == "LIGOTimeGPSArray":
+        return LIGOTimeGPSArray(TIMES)
+    if request.param == "LIGOTimeGPSView":
+        return LIGOTimeGPSView(LIGOTimeGPSArray(TIMES).ns())
+    if request.param == "str":
+        return list(map(str, TIMES))
+    return list(TIMES)
+
+
+def test_gps_sum(times):
+    """Test `gps_sum`."""
+    assert gps_sum(times) == sum(TIMES, LIGOTimeGPS(0))
+    assert gps_sum([]) == LIGOTimeGPS(0)
+
+
+def test_gps_mean(times):
+    """Test `gps_mean` matches summing and dividing."""
+    assert gps_mean(times) == sum(TIMES, LIGOTimeGPS(0)) / len(TIMES)
+
+
+def test_gps_mean_exact():
+    """Test that `gps_mean` is exact for large values."""
+    times = GPSRange(1000000000, 1000001000, Fraction(1, 3))
+    assert gps_mean(times) == LIGOTimeGPS(1000000499, 833333333)
+
+
+@pytest.mark.parametrize(("func", "expected"), [
+    (gps_min, min(TIMES)),
+    (gps_max, max(TIMES)),
+])
+def test_gps_min_max(times, func, expected):
+    """Test `gps_min` and `gps_max`."""
+    assert func(times) == expected
+
+
+@pytest.mark.parametrize("func", [gps_mean, gps_min, gps_max])
+def test_empty(func):
+    """Test reductions that are undefined for an empty sequence."""
+    with pytest.raises(ValueError, match="empty sequence"):
+        func([])
+
+
+def test_argsort(times):
+    """Test `argsort` is a stable sort."""
+    indices = argsort(times)
+    assert isinstance(indices, array)
+    assert indices.tolist() == [1, 3, 4, 0, 2]
+
+
+def test_histogram():
+    """Test `histogram`."""
+    times = [0.5, 1, 1.25, 3.9, -1, "1.999999999"]
+    assert histogram(times, 0, 1).tolist() == [1, 3, 0, 1]
+    assert histogram(times, 0, 1, nbins=6).tolist() == [1, 3, 0, 1, 0, 0]
+    assert histogram(times, 1, 2, nbins=1).tolist() == [3]
+    assert histogram(times, 10, 1).tolist() == []
+    assert histogram([], 0, 1).tolist() == []
+
+
+@pytest.mark.parametrize("bin_width", [1 / 16384, Fraction(1, 3), 0.25, 7])
+def test_histogram_grid(bin_width):
+    """Test `histogram` bins match `SampleGrid` boundaries."""
+    rng = random.Random(0)
+    start = LIGOTimeGPS(1000000000, 5)
+    times = [
+        start + LIGOTimeGPS.from_ns(rng.randrange(-10 ** 9, 10 ** 11))
+        for _ in range(1000)
+    ]
+    grid = SampleGrid(start, 1 / Fraction(bin_width))
+    counts = histogram(times, start, bin_width, nbins=100)
+    expected = [0] * 100
+    for t in times:
+        index = grid.index(t)
+        if 0 <= index < 100:
+            expected[index] += 1
+    assert counts.tolist() == expected
+
+
+@pytest.mark.parametrize(("kwargs", "match"), [
+    ({"bin_width": 0}, "at least one nanosecond"),
+    ({"bin_width": 1e-10}, "at least one nanosecond"),
+    ({"bin_width": 1, "nbins": -1}, "must not be negative"),
+])
+def test_histogram_error(kwargs, match):
+    """Test `histogram` errors."""
+    with pytest.raises(ValueError, match=match):
+        histogram([1], 0, **kwargs)
@@ -0,0 +1,248 @@
+# Copyright (c) 2025 Cardiff University
+#
+# This file is part of ligotimegps.
+#
+# ligotimegps is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ligotimegps is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ligotimegps.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for `ligotimegps.Segment` and `ligotimegps.SegmentList`."""
+
+import random
+from array import array
+
+import pytest
+
+from .. import (
+    LIGOTimeGPS,
+    Segment,
+    SegmentList,
+)
+
+# -- Segment -----------------------------
+
+
+def test_segment():
+    """Test `Segment` attributes."""
+    seg = Segment(100, "110.5")
+    assert seg.start == LIGOTimeGPS(100)
+    assert seg.end == LIGOTimeGPS(110, 500000000)
+    assert seg.duration == LIGOTimeGPS(10, 500000000)
+    assert seg.ns() == (100000000000, 110500000000)
+    assert tuple(seg) == (seg.start, seg.end)
+    assert repr(seg) == (
+        "Segment(LIGOTimeGPS(100, 0), LIGOTimeGPS(110, 500000000))"
+    )
+    assert bool(seg)
+    assert not Segment(1, 1)
+
+
+def test_segment_error():
+    """Test `Segment` creation errors."""
+    with pytest.raises(ValueError, match="is before start"):
+        Segment(10, 9.5)
+
+
+def test_segment_eq_hash():
+    """Test `Segment` equality and hashing."""
+    assert Segment(1, 2) == Segment(LIGOTimeGPS(1), 2.0)
+    assert Segment(1, 2) != Segment(1, 3)
+    assert Segment(1, 2) != (1, 2)
+    assert len({Segment(1, 2), Segment(1.0, "2")}) == 1
+
+
+def test_segment_contains():
+    """Test ``x in Segment``."""
+    seg = Segment(10, 20)
+    assert 10 in seg
+    assert LIGOTimeGPS(19, 999999999) in seg
+    assert 20 not in seg
+    assert Segment(12, 20) in seg
+    assert Segment(12, 21) not in seg
+    assert None not in seg
+
+
+@pytest.mark.parametrize(("other", "result"), [
+    ((5, 15), True),
+    ((2, 4), True),
+    ((10, 15), False),
+    ((-5, 0), False),
+    ((5, 5), False),
+])
+def test_segment_intersects(other, result):
+    """Test `Segment.intersects`."""
+    assert Segment(0, 10).intersects(Segment(*other)) is result
+
+
+# -- SegmentList -------------------------
+
+
+def _random_segments(rng, count, span=1000):
+    """Return random (start, end) pairs in integer seconds."""
+    segments = []
+    for _ in range(count):
+        start = rng.randrange(span)
+        segments.append((start, start + rng.randrange(10)))
+    return segments
+
+
+def _seconds(segments):
+    """Return the set of integer seconds covered by some segments."""
+    return {t for start, end in segments for t in range(start, end)}
+
+
+def _as_set(segments):
+    """Return the set of integer seconds covered by a `SegmentList`."""
+    return _seconds(
+        (int(seg.start), int(seg.end)) for seg in segments
+    )
+
+
+def test_segmentlist_coalesce():
+    """Test that a `SegmentList` is always coalesced."""
+    segments = SegmentList([(20, 30), (0, 10), (5, 12), (12, 15), (40, 40)])
+    assert segments.ns().tolist() == [
+        0, 15000000000,
+        20000000000, 30000000000,
+    ]
+    assert len(segments) == 2
+    assert segments[1] == Segment(20, 30)
+    assert segments[-1] == Segment(20, 30)
+    assert list(segments) == [Segment(0, 15), Segment(20, 30)]
+    assert segments.duration == LIGOTimeGPS(25)
+    assert segments.extent() == Segment(0, 30)
+    assert repr(SegmentList([(0, 1)])) == (
+        "SegmentList([Segment(LIGOTimeGPS(0, 0), LIGOTimeGPS(1, 0))])"
+    )
+
+
+def test_segmentlist_random_coalesce():
+    """Test coalescing random segments against a brute-force result."""
+    rng = random.Random(0)
+    raw = _random_segments(rng, 500)
+    segments = SegmentList(raw)
+    assert _as_set(segments) == _seconds(raw)
+    boundaries = segments.ns().tolist()
+    # strictly increasing means sorted, disjoint, not touching, non-empty
+    assert boundaries == sorted(set(boundaries))
+
+
+def test_segmentlist_error():
+    """Test `SegmentList` creation errors."""
+    with pytest.raises(ValueError, match="is before start"):
+        SegmentList([(0, 1), (3, 2)])
+    with pytest.raises(ValueError, match="even number"):
+        SegmentList.from_ns([0, 1, 2])
+    with pytest.raises(ValueError, match="no extent"):
+        SegmentList().extent()
+    with pytest.raises(IndexError, match="out of range"):
+        SegmentList([(0, 1)])[1]
+
+
+def test_segmentlist_from_ns():
+    """Test `SegmentList.from_ns`."""
+    segments = SegmentList.from_ns([5, 10, 0, 6])
+    assert segments.ns() == array("q", [0, 10])
+    assert SegmentList.from_ns(segments.ns()) == segments
+
+
+def test_segmentlist_slice():
+    """Test slicing a `SegmentList`."""
+    segments = SegmentList([(0, 1), (2, 3), (4, 5), (6, 7)])
+    assert isinstance(segments[1:3], SegmentList)
+    assert list(segments[1:3]) == [Segment(2, 3), Segment(4, 5)]
+    assert list(segments[::2]) == [Segment(0, 1), Segment(4, 5)]
+    assert segments[::-1] == segments
+
+
+def test_segmentlist_copy():
+    """Test that creating from another `SegmentList` copies the data."""
+    segments = SegmentList([(0, 1)])
+    copy = SegmentList(segments)
+    assert copy == segments
+    assert copy.ns() is not segments.ns()
+    assert segments != [(0, 1)]
+
+
+@pytest.mark.parametrize(("op", "setop"), [
+    pytest.param(lambda a, b: a | b, set.__or__, id="or"),
+    pytest.param(lambda a, b: a & b, set.__and__, id="and"),
+    pytest.param(lambda a, b: a - b, set.__sub__, id="sub"),
+    pytest.param(lambda a, b: a ^ b, set.__xor__, id="xor"),
+])
+def test_segmentlist_operations(op, setop):
+    """Test set operations against a brute-force result."""
+    rng = random.Random(1)
+    for _ in range(20):
+        left = _random_segments(rng, 50, span=300)
+        right = _random_segments(rng, 50, span=300)
+        result = op(SegmentList(left), SegmentList(right))
+        assert isinstance(result, SegmentList)
+        assert _as_set(result) == setop(_seconds(left), _seconds(right))
+        boundaries = result.ns().tolist()
+        assert boundaries == sorted(set(boundaries))
+        # other may be a plain list of pairs
+        assert op(SegmentList(left), right) == result
+        assert op(left, SegmentList(right)) == result
+
+
+def test_segmentlist_operation_error():
+    """Test that set operations with unsupported types fail."""
+    with pytest.raises(TypeError):
+        SegmentList() | 1
+
+
+def test_segmentlist_complement():
+    """Test `SegmentList.complement`."""
+    segments = SegmentList([(10, 20), (30, 40)])
+    assert segments.complement((0, 35)) == SegmentList([(0, 10), (20, 30)])
+    assert segments.complement(Segment(15, 16)) == SegmentList()
+
+
+def test_segmentlist_contains():
+    """Test ``x in SegmentList``."""
+    segments = SegmentList([(10, 20), (30, 40)])
+    assert 10 in segments
+    assert "19.999999999" in segments
+    assert 20 not in segments
+    assert 25 not in segments
+    assert 5 not in segments
+    assert 40 not in segments
+    assert Segment(30, 40) in segments
+    assert Segment(15, 35) not in segments
+    assert Segment(20, 30) not in segments
+    assert "test" not in segments
+
+
+def test_segmentlist_find():
+    """Test `SegmentList.find`."""
+    segments = SegmentList([(10, 20), (30, 40)])
+    assert segments.find(10) == 0
+    assert segments.find(LIGOTimeGPS(39, 999999999)) == 1
+    with pytest.raises(ValueError, match="not in any segment"):
+        segments.find(25)
+
+
+@pytest.mark.parametrize(("segment", "result"), [
+    ((0, 10), False),
+    ((0, 11), True),
+    ((15, 16), True),
+    ((20, 30), False),
+    ((25, 35), True),
+    ((45, 50), False),
+    ((12, 12), False),
+])
+def test_segmentlist_intersects(segment, result):
+    """Test `SegmentList.intersects`."""
+    segments = SegmentList([(10, 20), (30, 40)])
+    assert segments.intersects(segment) is result
+    assert segments.intersects(Segment(*segment)) is result